@@ -9,6 +9,8 @@ meta_path = path.join("src", name, "__init__.py")
 here = path.abspath(path.dirname(__file__))
 
 extras_require = {
+	"arrow": ["pyarrow"],
+	"zstd": ["zstandard; python_version<'3.14'"],
 	"tests": ["pytest", "pytest-mock"],
 }
 extras_require["all"] = sorted(
@@ -70,7 +72,11 @@ if __name__ == "__main__":
 		packages=find_packages("src"),
 		package_dir={"": "src"},
 		package_data={
-			"spaceweather": ["data/.cache", "data/omni_extended/.cache"],
+			"spaceweather": [
+				"data/.cache",
+				"data/omni_extended/.cache",
+				"data/omni_hro/.cache",
+			],
 		},
 		include_package_data=True,
 		install_requires=[
@@ -80,6 +86,8 @@ if __name__ == "__main__":
 		],
 		extras_require=extras_require,
 		scripts=[],
-		entry_points={},
+		entry_points={
+			"console_scripts": ["spaceweather = spaceweather.cli:main"],
+		},
 		zip_safe=False,
 	)
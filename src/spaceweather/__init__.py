@@ -10,6 +10,14 @@
 """
 __version__ = "0.4.2"
 
+from .analysis import *
+from .arrays import *
 from .celestrak import *
 from .gfz import *
 from .omni import *
+from .resample import *
+from .combined import *
+from .coupling import *
+from .gaps import *
+from .shm import *
+from .snapshot import *
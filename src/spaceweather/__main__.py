@@ -0,0 +1,14 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Command line interface, ``python -m spaceweather``
+"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,219 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Awaitable (asyncio) variants of the data loaders, for Python 3.7+.
+The file checks, updates, and parsing run in an executor, concurrent
+awaits of the same data share one load, and the results are kept
+in memory for a configurable time.
+
+This module is not imported by ``import spaceweather``,
+use ``from spaceweather import aio``.
+"""
+import asyncio
+import functools
+import threading
+import time
+
+import pandas as pd
+
+from .celestrak import ap_kp_3h as _ap_kp_3h, sw_daily as _sw_daily
+from .core import _freeze, _share
+from .gfz import (
+	gfz_3h as _gfz_3h, gfz_daily as _gfz_daily,
+	gfz_hp30 as _gfz_hp30, gfz_hp60 as _gfz_hp60,
+)
+from .omni import omnie_hourly as _omnie_hourly
+
+__all__ = [
+	"AsyncLoader",
+	"ap_kp_3h",
+	"gfz_3h",
+	"gfz_daily",
+	"gfz_hp30",
+	"gfz_hp60",
+	"omnie_hourly",
+	"sw_daily",
+]
+
+
+class AsyncLoader(object):
+	"""Awaitable data loading with coalescing and in-memory caching
+
+	Runs the (blocking) loader functions, e.g. :func:`sw_daily()`,
+	in an executor, such that the event loop is not blocked.
+	Concurrent awaits of the same function with the same arguments
+	share one call, and the results are kept for `ttl`, such that
+	cached (warm) loads return without leaving the event loop.
+	Each caller receives its own (copy-on-write) copy of the result.
+
+	Parameters
+	----------
+	executor: `None` or `concurrent.futures.Executor`, optional
+		The executor for the loader calls, e.g. a
+		`concurrent.futures.ProcessPoolExecutor` for parsing in
+		separate processes. `None` uses the default (thread pool)
+		executor of the event loop.
+	ttl: `None`, float, or str, optional, default "1h"
+		The time to keep the results, in seconds or as time span
+		such as "30min". `None` keeps the results until
+		:meth:`invalidate()` is called, 0 disables the cache.
+
+	Examples
+	--------
+	>>> import asyncio
+	>>> from spaceweather import aio
+	>>> loader = aio.AsyncLoader(ttl="30min")
+	>>> async def main():
+	...     return await loader.sw_daily()
+	>>> df = asyncio.run(main())  # doctest: +SKIP
+	"""
+	def __init__(self, executor=None, ttl="1h"):
+		self.executor = executor
+		if ttl is not None and not isinstance(ttl, (int, float)):
+			ttl = pd.Timedelta(ttl).total_seconds()
+		self.ttl = ttl
+		self._lock = threading.Lock()
+		self._cache = {}
+		self._pending = {}
+
+	def _cached(self, key):
+		with self._lock:
+			hit = self._cache.get(key)
+		if hit is None:
+			return None
+		if self.ttl is not None and time.monotonic() - hit[0] >= self.ttl:
+			return None
+		return hit
+
+	async def _run(self, key, call):
+		loop = asyncio.get_running_loop()
+		try:
+			ret = await loop.run_in_executor(self.executor, call)
+			if self.ttl is None or self.ttl > 0:
+				with self._lock:
+					self._cache[key] = (time.monotonic(), ret)
+			return ret
+		finally:
+			del self._pending[(loop, key)]
+
+	async def load(self, func, *args, **kwargs):
+		"""Awaitable call of the loader `func`
+
+		Parameters
+		----------
+		func: callable
+			The loader function, e.g. :func:`sw_daily()`.
+			Must be picklable (e.g. a module-level function)
+			for process pool executors.
+		*args, **kwargs:
+			The arguments passed to `func`.
+
+		Returns
+		-------
+		The (copy of the) result of `func`.
+		"""
+		key = (
+			(func.__module__, func.__name__),
+			tuple(map(_freeze, args)),
+			tuple(sorted((_k, _freeze(_v)) for _k, _v in kwargs.items())),
+		)
+		hit = self._cached(key)
+		if hit is not None:
+			return _share(hit[1])
+		loop = asyncio.get_running_loop()
+		task = self._pending.get((loop, key))
+		if task is None:
+			call = functools.partial(func, *args, **kwargs)
+			task = loop.create_task(self._run(key, call))
+			self._pending[(loop, key)] = task
+		# a cancelled caller does not cancel the shared load
+		return _share(await asyncio.shield(task))
+
+	def invalidate(self, func=None):
+		"""Remove cached results
+
+		Parameters
+		----------
+		func: `None` or callable, optional, default `None`
+			Remove only the results of `func`, `None` removes all.
+		"""
+		with self._lock:
+			if func is None:
+				self._cache.clear()
+				return
+			name = (func.__module__, func.__name__)
+			for key in [_k for _k in self._cache if _k[0] == name]:
+				del self._cache[key]
+
+	async def sw_daily(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.sw_daily()`"""
+		return await self.load(_sw_daily, *args, **kwargs)
+
+	async def ap_kp_3h(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.ap_kp_3h()`"""
+		return await self.load(_ap_kp_3h, *args, **kwargs)
+
+	async def gfz_daily(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.gfz_daily()`"""
+		return await self.load(_gfz_daily, *args, **kwargs)
+
+	async def gfz_3h(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.gfz_3h()`"""
+		return await self.load(_gfz_3h, *args, **kwargs)
+
+	async def gfz_hp30(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.gfz_hp30()`"""
+		return await self.load(_gfz_hp30, *args, **kwargs)
+
+	async def gfz_hp60(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.gfz_hp60()`"""
+		return await self.load(_gfz_hp60, *args, **kwargs)
+
+	async def omnie_hourly(self, *args, **kwargs):
+		"""Awaitable :func:`spaceweather.omnie_hourly()`"""
+		return await self.load(_omnie_hourly, *args, **kwargs)
+
+
+# module-level loader for the functions below
+_loader = AsyncLoader()
+
+
+async def sw_daily(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.sw_daily()` using the module loader"""
+	return await _loader.sw_daily(*args, **kwargs)
+
+
+async def ap_kp_3h(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.ap_kp_3h()` using the module loader"""
+	return await _loader.ap_kp_3h(*args, **kwargs)
+
+
+async def gfz_daily(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.gfz_daily()` using the module loader"""
+	return await _loader.gfz_daily(*args, **kwargs)
+
+
+async def gfz_3h(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.gfz_3h()` using the module loader"""
+	return await _loader.gfz_3h(*args, **kwargs)
+
+
+async def gfz_hp30(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.gfz_hp30()` using the module loader"""
+	return await _loader.gfz_hp30(*args, **kwargs)
+
+
+async def gfz_hp60(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.gfz_hp60()` using the module loader"""
+	return await _loader.gfz_hp60(*args, **kwargs)
+
+
+async def omnie_hourly(*args, **kwargs):
+	"""Awaitable :func:`spaceweather.omnie_hourly()` using the module loader"""
+	return await _loader.omnie_hourly(*args, **kwargs)
@@ -0,0 +1,323 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Analysis tools for regularly spaced space weather data,
+such as superposed epoch analysis and event (storm) detection.
+"""
+import os
+from warnings import catch_warnings, simplefilter
+
+import numpy as np
+import pandas as pd
+
+from .arrays import _regular_values, _to_ns
+
+__all__ = [
+	"event_catalogue",
+	"find_events",
+	"superposed_epoch",
+	"superposed_epoch_stats",
+]
+
+
+def superposed_epoch(df, events, window=("-5D", "5D"), columns=None, freq=None):
+	"""Superposed epoch arrays
+
+	Extracts the data around each event time within `window` from
+	regularly spaced data, e.g. from :func:`omnie_hourly()`,
+	:func:`read_gfz_hp()`, or :func:`gfz_3h()`, using one vectorized
+	indexing operation instead of slicing event by event.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		Regularly spaced data with a `pandas.DatetimeIndex`,
+		missing time steps are allowed and filled with NaN.
+		Missing-value markers should already be masked, e.g. using
+		:func:`omnie_mask_missing()` for the OMNI data.
+	events: array_like of times
+		The event (epoch zero) times.
+	window: tuple of str, optional, default ("-5D", "5D")
+		The time range around each event, both ends included.
+	columns: `None` or list of str, optional, default `None`
+		The columns (variables) to extract, `None` uses all columns.
+	freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the smallest time difference.
+
+	Returns
+	-------
+	epochs: numpy.ndarray
+		The (event, lag, variable) array, NaN for data gaps and
+		for times outside of the data range.
+	lags: pandas.TimedeltaIndex
+		The time lags relative to the events.
+
+	Notes
+	-----
+	Epoch zero is the time step closest to each event time.
+
+	See Also
+	--------
+	superposed_epoch_stats
+	"""
+	t0, step, values = _regular_values(df, columns=columns, freq=freq)
+	nt = values.shape[0] - 1
+	lo, hi = (pd.Timedelta(_w).value for _w in window)
+	lags = np.arange(-(-lo // step), hi // step + 1, dtype=np.int64)
+	ev = np.atleast_1d(_to_ns(events))
+	ev_pos = (ev - t0 + step // 2) // step
+	idx = ev_pos[:, None] + lags[None, :]
+	idx[(idx < 0) | (idx >= nt)] = nt
+	return values[idx], pd.to_timedelta(lags * step, unit="ns")
+
+
+def superposed_epoch_stats(epochs, quantiles=(0.25, 0.75)):
+	"""Summary statistics of superposed epoch arrays
+
+	Computes the NaN-aware statistics over the events
+	for each lag and variable.
+
+	Parameters
+	----------
+	epochs: numpy.ndarray
+		The (event, lag, variable) array from :func:`superposed_epoch()`.
+	quantiles: sequence of float, optional, default (0.25, 0.75)
+		The quantiles to compute, in the range 0 to 1.
+
+	Returns
+	-------
+	stats: dict of numpy.ndarray
+		The (lag, variable) arrays "mean", "median", "std", and "count",
+		and the (quantile, lag, variable) array "quantiles".
+		Lags without any data are NaN.
+
+	See Also
+	--------
+	superposed_epoch
+	"""
+	with catch_warnings():
+		# all-NaN slices
+		simplefilter("ignore", RuntimeWarning)
+		return {
+			"mean": np.nanmean(epochs, axis=0),
+			"median": np.nanmedian(epochs, axis=0),
+			"std": np.nanstd(epochs, axis=0),
+			"count": np.sum(np.isfinite(epochs), axis=0),
+			# np.nanquantile() requires numpy >= 1.15
+			"quantiles": np.nanpercentile(
+				epochs, 100. * np.asarray(quantiles), axis=0,
+			),
+		}
+
+
+_EVENT_COLUMNS = ["start", "end", "peak_time", "peak", "duration"]
+
+
+def _find_runs(t0, step, x, threshold, above, min_len, integ=None):
+	# Run-length encoding of the threshold crossings of `x`
+	with np.errstate(invalid="ignore"):
+		mask = x >= threshold if above else x <= threshold
+	edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+	starts = np.flatnonzero(edges == 1)
+	ends = np.flatnonzero(edges == -1)
+	keep = ends - starts >= min_len
+	starts, ends = starts[keep], ends[keep]
+	lens = ends - starts
+	if len(starts) == 0:
+		return pd.DataFrame(
+			columns=_EVENT_COLUMNS + (["integral"] if integ is not None else [])
+		)
+	# segment reductions over [start, end), the padding value
+	# allows `end` to be equal to the length of `x`
+	bounds = np.stack([starts, ends], axis=1).ravel()
+	xp = np.append(x, np.nan)
+	reduce = np.maximum if above else np.minimum
+	peaks = reduce.reduceat(xp, bounds)[::2]
+	offsets = np.concatenate(([0], np.cumsum(lens)[:-1]))
+	pos = np.arange(lens.sum()) - np.repeat(offsets - starts, lens)
+	hit = xp[pos] == np.repeat(peaks, lens)
+	peak_pos = np.minimum.reduceat(np.where(hit, pos, len(x)), offsets)
+
+	def times(i):
+		return pd.to_datetime(t0 + i * step, unit="ns")
+
+	events = pd.DataFrame({
+		"start": times(starts),
+		"end": times(ends - 1),
+		"peak_time": times(peak_pos),
+		"peak": peaks,
+		"duration": pd.to_timedelta(lens * step, unit="ns"),
+	})
+	if integ is not None:
+		integ = np.append(np.nan_to_num(integ), 0.)
+		hours = step / pd.Timedelta("1h").value
+		events["integral"] = np.add.reduceat(integ, bounds)[::2] * hours
+	return events
+
+
+def find_events(
+	df, column, threshold,
+	above=True,
+	min_duration=None,
+	integrate=None,
+	freq=None,
+):
+	"""Detect threshold-crossing events
+
+	Finds the intervals where `column` stays above (or below) `threshold`
+	using vectorized run-length encoding, e.g. geomagnetic storms with
+	Kp >= 5 from :func:`gfz_3h()` or with Dst <= -50 from the OMNI data.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		Regularly spaced data with a `pandas.DatetimeIndex`,
+		missing time steps and NaN values end an event.
+		Missing-value markers should already be masked, e.g. using
+		:func:`omnie_mask_missing()` for the OMNI data.
+	column: str
+		The column to compare to `threshold`.
+	threshold: float
+		The threshold, included in the events.
+	above: bool, optional, default True
+		Detect values greater or equal (True) or less or equal (False)
+		than the threshold.
+	min_duration: `None` or str, optional, default `None`
+		The minimum duration of an event, `None` keeps all events.
+	integrate: `None` or str, optional, default `None`
+		The column to integrate over the events, e.g. "Ap".
+	freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the smallest time difference.
+
+	Returns
+	-------
+	events: pandas.DataFrame
+		The event table with the columns:
+
+		"start", "end":
+			The times of the first and the last data point of the event.
+		"peak_time", "peak":
+			The time and the value of the first extreme value.
+		"duration":
+			The duration of the event (number of data points times spacing).
+		"integral":
+			The time integral of `integrate` over the event, in units of
+			that column times hours, only if `integrate` is given.
+
+	See Also
+	--------
+	event_catalogue
+	"""
+	columns = [column] + ([integrate] if integrate is not None else [])
+	t0, step, values = _regular_values(df, columns=columns, freq=freq)
+	min_len = 1
+	if min_duration is not None:
+		min_len = max(1, -(-pd.Timedelta(min_duration).value // step))
+	return _find_runs(
+		t0, step, values[:-1, 0], threshold, above, min_len,
+		integ=values[:-1, 1] if integrate is not None else None,
+	)
+
+
+def event_catalogue(
+	df, column, threshold,
+	above=True,
+	min_duration=None,
+	integrate=None,
+	freq=None,
+	cache_file=None,
+):
+	"""Cached and incrementally updated event table
+
+	Same as :func:`find_events()`, but stores the event table in
+	`cache_file` (csv) together with the time of the last data point.
+	When called again with new data, only the data after the last
+	below-threshold data point of the previous run are scanned again,
+	and the events found there replace the tail of the cached table.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		Regularly spaced data, see :func:`find_events()`.
+		The data already scanned before are assumed to be unchanged.
+	column: str
+		The column to compare to `threshold`.
+	threshold: float
+		The threshold, see :func:`find_events()`.
+	above: bool, optional, default True
+		Detect values above (True) or below (False) the threshold.
+	min_duration: `None` or str, optional, default `None`
+		The minimum duration of an event, `None` keeps all events.
+	integrate: `None` or str, optional, default `None`
+		The column to integrate over the events, e.g. "Ap".
+	freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the smallest time difference.
+	cache_file: `None` or str, optional, default `None`
+		The csv file to store the event table in, e.g. next to the data files.
+		A cache file created with different settings is replaced.
+		`None` disables caching.
+
+	Returns
+	-------
+	events: pandas.DataFrame
+		The event table, see :func:`find_events()`.
+
+	See Also
+	--------
+	find_events
+	"""
+	key = "# column={0} threshold={1} above={2} min_duration={3} integrate={4}\n".format(
+		column, threshold, above, min_duration, integrate,
+	)
+	columns = [column] + ([integrate] if integrate is not None else [])
+	t0, step, values = _regular_values(df, columns=columns, freq=freq)
+	nt = values.shape[0] - 1
+	min_len = 1
+	if min_duration is not None:
+		min_len = max(1, -(-pd.Timedelta(min_duration).value // step))
+
+	cached, resume = None, 0
+	if cache_file is not None and os.path.exists(cache_file):
+		with open(cache_file) as fp:
+			header = fp.readline()
+			scanned = fp.readline()
+		if header == key:
+			scanned = pd.Timestamp(scanned[len("# scanned="):].strip()).value
+			i_s = min((scanned - t0) // step, nt - 1)
+			x = values[:i_s + 1, 0]
+			with np.errstate(invalid="ignore"):
+				quiet = ~(x >= threshold if above else x <= threshold)
+			quiet = np.flatnonzero(quiet)
+			if len(quiet) and i_s >= 0:
+				resume = quiet[-1] + 1
+				cached = pd.read_csv(
+					cache_file, comment="#",
+					parse_dates=["start", "end", "peak_time"],
+				)
+				cached["duration"] = pd.to_timedelta(cached["duration"])
+				t_resume = pd.to_datetime(t0 + resume * step, unit="ns")
+				cached = cached[cached["start"] < t_resume]
+
+	new = _find_runs(
+		t0 + resume * step, step, values[resume:nt, 0], threshold, above, min_len,
+		integ=values[resume:nt, 1] if integrate is not None else None,
+	)
+	if cached is not None and len(cached):
+		events = pd.concat([cached, new], ignore_index=True) if len(new) else cached
+	else:
+		events = new
+
+	if cache_file is not None:
+		with open(cache_file, "w") as fp:
+			fp.write(key)
+			fp.write("# scanned={0}\n".format(
+				pd.to_datetime(t0 + (nt - 1) * step, unit="ns").isoformat()
+			))
+			events.to_csv(fp, index=False)
+	return events
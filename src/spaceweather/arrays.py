@@ -0,0 +1,450 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Array-based access to regularly spaced space weather data.
+The daily, 3-hourly, Hp30/Hp60, and OMNI hourly data are regularly
+spaced in time, so the row of a given time can be computed directly
+from the first time and the spacing, without a pandas index lookup.
+The same applies to the range of rows for a given time window,
+which allows constant-time aggregates using precomputed tables.
+"""
+import numpy as np
+import pandas as pd
+
+__all__ = [
+	"AggregateIndex",
+	"SpaceWeatherArray",
+	"SpaceWeatherRecord",
+]
+
+
+def _to_ns(t):
+	# Time(s) to integer nanoseconds since the epoch (UTC)
+	if isinstance(t, (int, np.integer)):
+		return int(t)
+	if isinstance(t, np.datetime64):
+		return int(t.astype("M8[ns]").astype(np.int64))
+	if isinstance(t, np.ndarray):
+		if t.dtype.kind == "M":
+			return t.astype("M8[ns]").view(np.int64)
+		if t.dtype.kind in "iu":
+			return t.astype(np.int64)
+	if isinstance(t, (pd.DatetimeIndex, pd.Series)):
+		return _to_ns(pd.DatetimeIndex(t).values)
+	if isinstance(t, (str, pd.Timestamp)) or np.ndim(t) == 0:
+		return pd.Timestamp(t).value
+	return np.array([pd.Timestamp(_t).value for _t in t], dtype=np.int64)
+
+
+def _index_ns(index):
+	# DatetimeIndex to integer nanoseconds, ignoring the time zone
+	index = pd.DatetimeIndex(index)
+	if index.tz is not None:
+		index = index.tz_convert("UTC").tz_localize(None)
+	return index.values.astype("M8[ns]").view(np.int64)
+
+
+def _regular_positions(df, freq=None):
+	# The first time and the spacing in ns, and the row positions of the
+	# data on the regular time grid, `None` if there are no gaps.
+	index = pd.DatetimeIndex(df.index)
+	if index.tz is not None:
+		index = index.tz_convert("UTC").tz_localize(None)
+	# integer times in the resolution of the index to avoid a conversion
+	times = index.values.view(np.int64)
+	unit, count = np.datetime_data(index.values.dtype)
+	mult = int(np.timedelta64(count, unit) // np.timedelta64(1, "ns"))
+	dt = np.diff(times)
+	if len(times) == 0:
+		raise ValueError("The data are empty.")
+	if freq is not None:
+		step = pd.Timedelta(freq).value
+	elif len(times) == 1:
+		raise ValueError("Cannot infer the spacing from a single time.")
+	else:
+		step = int(dt.min())
+		if step <= 0:
+			# unsorted or duplicate times, rejected below
+			step = int(dt[dt > 0].min())
+		step *= mult
+	if step % mult == 0 and np.all(dt == step // mult):
+		return int(times[0]) * mult, step, None
+	times = times * mult
+	pos, rem = np.divmod(times - times[0], step)
+	if np.any(rem != 0) or np.any(np.diff(pos) <= 0):
+		raise ValueError("The data are not sorted or not regularly spaced.")
+	return int(times[0]), step, pos
+
+
+def _regular_values(df, columns=None, freq=None):
+	# Places the data on its regular time grid, gaps are filled with NaN.
+	# Returns the first time and the spacing in ns, and the (time, column)
+	# values with an additional NaN row at the end used for out-of-range
+	# indexing.
+	columns = list(columns if columns is not None else df.columns)
+	t0, step, pos = _regular_positions(df, freq=freq)
+	nt = len(df) if pos is None else pos[-1] + 1
+	values = np.empty((nt + 1, len(columns)))
+	values[nt] = np.nan
+	if pos is None:
+		values[:nt] = df[columns].values
+	else:
+		values[:nt] = np.nan
+		values[pos] = df[columns].values
+	return t0, step, values
+
+
+class SpaceWeatherRecord(object):
+	"""Single time step of a :class:`SpaceWeatherArray`
+
+	The values can be accessed by column name, either as attribute
+	(``rec.Kp``) or as item (``rec["Kp"]``).
+
+	Attributes
+	----------
+	time: numpy.datetime64
+		The time of the record.
+	values: numpy.ndarray
+		The values of the record, a view into the array data.
+	"""
+	__slots__ = ("time", "values", "_columns")
+
+	def __init__(self, time, values, columns):
+		self.time = time
+		self.values = values
+		self._columns = columns
+
+	def __getitem__(self, name):
+		return self.values[self._columns[name]]
+
+	def __getattr__(self, name):
+		try:
+			return self.values[self._columns[name]]
+		except KeyError:
+			raise AttributeError(name)
+
+	def _asdict(self):
+		return dict((_c, self.values[_i]) for _c, _i in self._columns.items())
+
+	def __repr__(self):
+		return "SpaceWeatherRecord({0}, {1})".format(self.time, self._asdict())
+
+
+class SpaceWeatherArray(object):
+	"""Regularly spaced space weather data with direct time indexing
+
+	Stores the data as a contiguous `float64` array and computes the row
+	for a given time arithmetically from the first time and the spacing,
+	as an alternative to the `pandas` index for scalar lookups.
+	A time maps to the interval that contains it, intervals start
+	at multiples of the spacing (since 1970-01-01), which takes care of
+	the centred time stamps of the 3h and Hp30/Hp60 data.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		The regularly spaced data, e.g. from :func:`sw_daily()`,
+		:func:`gfz_daily()`, :func:`ap_kp_3h()`, or :func:`gfz_3h()`.
+	columns: `None` or list of str, optional, default `None`
+		The columns to include, `None` includes all columns.
+	freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the difference of the
+		first two times.
+
+	Attributes
+	----------
+	values: numpy.ndarray
+		The data as (time, column) array.
+	columns: list of str
+		The column names.
+	t0: int
+		The first time in nanoseconds since 1970-01-01.
+	step: int
+		The spacing in nanoseconds.
+
+	Raises ``ValueError`` if the data are not regularly spaced.
+	Note that the celestrak data include monthly predicted values at the end,
+	which need to be excluded, for example using ``df[df["Apavg"] >= 0]``
+	for the daily data and ``df[df["Ap"] >= 0]`` for the 3h data.
+
+	Examples
+	--------
+	>>> import spaceweather as sw
+	>>> df = sw.ap_kp_3h()
+	>>> swa = sw.SpaceWeatherArray(df[df["Ap"] >= 0])
+	>>> rec = swa.at_3h("2000-01-01 02:00")
+	>>> print("{0} {1:.0f} {2:.1f}".format(rec.time, rec.Ap, rec["Kp"]))
+	2000-01-01T01:30:00.000000000 56 5.3
+	"""
+	def __init__(self, df, columns=None, freq=None):
+		times = _index_ns(df.index)
+		if freq is not None:
+			step = pd.Timedelta(freq).value
+		elif len(times) > 1:
+			step = int(times[1] - times[0])
+		else:
+			raise ValueError("Cannot infer the spacing from a single time.")
+		if len(times) > 1 and np.any(np.diff(times) != step):
+			raise ValueError("The data are not regularly spaced.")
+		self.columns = list(columns if columns is not None else df.columns)
+		self._columns = dict((_c, _i) for _i, _c in enumerate(self.columns))
+		self.values = np.ascontiguousarray(
+			df[self.columns].values, dtype=np.float64,
+		)
+		self.t0 = int(times[0])
+		self.step = step
+		self._offset = (self.t0 - self.t0 % step) // step
+
+	def __len__(self):
+		return self.values.shape[0]
+
+	@property
+	def times(self):
+		"""The times of the rows as `numpy.datetime64` array"""
+		return (
+			self.t0 + self.step * np.arange(len(self), dtype=np.int64)
+		).view("M8[ns]")
+
+	def index_of(self, t):
+		"""Row index of time(s) `t`
+
+		Parameters
+		----------
+		t: time or array_like of times
+			The time(s), as str, datetime, pandas.Timestamp, numpy.datetime64,
+			or integer nanoseconds since 1970-01-01.
+
+		Returns
+		-------
+		i: int or numpy.ndarray of int
+			The row(s) of the interval(s) containing `t`, not range checked.
+		"""
+		return _to_ns(t) // self.step - self._offset
+
+	def row(self, t):
+		"""Values at time `t` as raw array slice
+
+		Raises ``KeyError`` if `t` is outside of the data range.
+		"""
+		i = self.index_of(t)
+		if i < 0 or i >= len(self):
+			raise KeyError(t)
+		return self.values[i]
+
+	def at(self, t):
+		"""Record at time `t`
+
+		Parameters
+		----------
+		t: time
+			The time, as str, datetime, pandas.Timestamp, numpy.datetime64,
+			or integer nanoseconds since 1970-01-01.
+
+		Returns
+		-------
+		rec: SpaceWeatherRecord
+			The values of the interval containing `t`.
+			Raises ``KeyError`` if `t` is outside of the data range.
+		"""
+		i = self.index_of(t)
+		if i < 0 or i >= len(self):
+			raise KeyError(t)
+		return SpaceWeatherRecord(
+			np.datetime64(self.t0 + i * self.step, "ns"),
+			self.values[i],
+			self._columns,
+		)
+
+	def at_day(self, date):
+		"""Record for the day of `date` of daily data, see :meth:`at()`"""
+		if self.step != 86400 * 10**9:
+			raise ValueError("Not daily data.")
+		return self.at(date)
+
+	def at_3h(self, ts):
+		"""Record for the 3h interval of `ts` of 3h data, see :meth:`at()`"""
+		if self.step != 3 * 3600 * 10**9:
+			raise ValueError("Not 3-hourly data.")
+		return self.at(ts)
+
+	def take(self, t, columns=None):
+		"""Values at times `t`
+
+		Parameters
+		----------
+		t: array_like of times
+			The times, as for :meth:`index_of()`.
+		columns: `None` or list of str, optional, default `None`
+			The columns to return, `None` returns all columns.
+
+		Returns
+		-------
+		values: numpy.ndarray
+			The (time, column) values, NaN for times outside of the data range.
+		"""
+		i = np.atleast_1d(self.index_of(t))
+		valid = (i >= 0) & (i < len(self))
+		values = self.values
+		if columns is not None:
+			values = values[:, [self._columns[_c] for _c in columns]]
+		ret = values[np.where(valid, i, 0)]
+		ret[~valid] = np.nan
+		return ret
+
+
+class AggregateIndex(object):
+	"""Precomputed aggregates over arbitrary time windows
+
+	Precomputes cumulative sums and counts for sums and means, and
+	sparse tables for minima and maxima of regularly spaced data,
+	e.g. from :func:`sw_daily()`, :func:`gfz_3h()`, :func:`read_gfz_hp()`,
+	or :func:`omnie_hourly()`. Each aggregate over a window then takes
+	constant time, and is evaluated for whole arrays of windows at once.
+	NaN values and missing time steps are ignored in the aggregates.
+
+	The cumulative sums take (n + 1) values per column, the sparse tables
+	about n log2(n) values per column, select only the needed `columns`
+	for long time series.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		Regularly spaced data with a `pandas.DatetimeIndex`,
+		missing-value markers should already be replaced by NaN.
+	columns: `None` or list of str, optional, default `None`
+		The columns to include, `None` includes all columns.
+	freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the smallest time difference.
+	minmax: bool, optional, default True
+		Build the sparse tables for :meth:`min()` and :meth:`max()`.
+
+	Examples
+	--------
+	Mean F10.7 over the 81 days before (and including) a set of epochs:
+
+	>>> import pandas as pd
+	>>> import spaceweather as sw
+	>>> df = sw.sw_daily()
+	>>> agg = sw.AggregateIndex(df[df["Apavg"] >= 0], columns=["f107_obs", "Apavg"])
+	>>> epochs = pd.to_datetime(["2000-01-01", "2003-10-30"])
+	>>> agg.mean(epochs - pd.Timedelta("80D"), epochs, "f107_obs").round(2)
+	array([178.99, 129.29])
+	"""
+	def __init__(self, df, columns=None, freq=None, minmax=True):
+		self.columns = list(columns if columns is not None else df.columns)
+		self._columns = dict((_c, _i) for _i, _c in enumerate(self.columns))
+		t0, step, values = _regular_values(df, columns=self.columns, freq=freq)
+		values = values[:-1]
+		self.t0 = t0
+		self.step = step
+		self.n = values.shape[0]
+		finite = np.isfinite(values)
+		zeros = np.zeros((1, values.shape[1]))
+		self._csum = np.concatenate(
+			(zeros, np.cumsum(np.where(finite, values, 0.), axis=0))
+		)
+		self._ccnt = np.concatenate(
+			(zeros, np.cumsum(finite, axis=0))
+		).astype(np.int64)
+		self._min = self._max = None
+		if minmax:
+			self._min = self._sparse_table(np.where(finite, values, np.inf), np.minimum)
+			self._max = self._sparse_table(np.where(finite, values, -np.inf), np.maximum)
+
+	@staticmethod
+	def _sparse_table(values, func):
+		# level k holds the aggregate over 2**k rows starting at each row
+		table = [values]
+		k = 1
+		while 2 * k <= values.shape[0]:
+			prev = table[-1]
+			table.append(func(prev[:-k], prev[k:]))
+			k *= 2
+		return table
+
+	def _rows(self, start, end):
+		# Half-open row ranges [i0, i1) of the times in [start, end]
+		start = np.atleast_1d(_to_ns(start)) - self.t0
+		end = np.atleast_1d(_to_ns(end)) - self.t0
+		i0 = np.clip(-(-start // self.step), 0, self.n)
+		i1 = np.clip(end // self.step + 1, 0, self.n)
+		return i0, np.maximum(i0, i1)
+
+	def _cols(self, column):
+		if column is None:
+			return slice(None)
+		if isinstance(column, str):
+			return self._columns[column]
+		return [self._columns[_c] for _c in column]
+
+	def count(self, start, end, column=None):
+		"""Number of valid values in the windows [`start`, `end`]
+
+		Parameters
+		----------
+		start, end: array_like of times
+			The window start and end times, both included.
+		column: `None`, str, or list of str, optional, default `None`
+			The column(s) to aggregate, `None` uses all columns.
+
+		Returns
+		-------
+		count: numpy.ndarray
+			The (window,) array for a single column,
+			and the (window, column) array otherwise.
+		"""
+		i0, i1 = self._rows(start, end)
+		_c = self._cols(column)
+		return self._ccnt[i1][:, _c] - self._ccnt[i0][:, _c]
+
+	def sum(self, start, end, column=None):
+		"""Sum of the valid values in the windows, see :meth:`count()`"""
+		i0, i1 = self._rows(start, end)
+		_c = self._cols(column)
+		return self._csum[i1][:, _c] - self._csum[i0][:, _c]
+
+	def mean(self, start, end, column=None):
+		"""Mean of the valid values in the windows, see :meth:`count()`
+
+		Windows without valid values are NaN.
+		"""
+		with np.errstate(invalid="ignore", divide="ignore"):
+			return self.sum(start, end, column) / self.count(start, end, column)
+
+	def _minmax(self, table, start, end, column):
+		if table is None:
+			raise ValueError("Sparse tables not available, use `minmax=True`.")
+		i0, i1 = self._rows(start, end)
+		length = i1 - i0
+		empty = length == 0
+		level = np.zeros_like(length)
+		level[~empty] = np.floor(np.log2(length[~empty])).astype(length.dtype)
+		_c = self._cols(column)
+		ret = np.full((len(i0),) + np.shape(table[0][0, _c]), np.nan)
+		for k in np.unique(level[~empty]):
+			sel = (level == k) & ~empty
+			lo = table[k][i0[sel]][:, _c]
+			hi = table[k][i1[sel] - 2**k][:, _c]
+			ret[sel] = np.minimum(lo, hi) if table is self._min else np.maximum(lo, hi)
+		ret[np.isinf(ret)] = np.nan
+		return ret
+
+	def min(self, start, end, column=None):
+		"""Minimum of the valid values in the windows, see :meth:`count()`
+
+		Windows without valid values are NaN.
+		"""
+		return self._minmax(self._min, start, end, column)
+
+	def max(self, start, end, column=None):
+		"""Maximum of the valid values in the windows, see :meth:`count()`
+
+		Windows without valid values are NaN.
+		"""
+		return self._minmax(self._max, start, end, column)
@@ -18,12 +18,18 @@ from warnings import warn
 import numpy as np
 import pandas as pd
 
-from .core import _assert_file_exists, _dl_file, _resource_filepath
+from .core import (
+	_assert_file_exists, _dl_file, _fetch, _merge_frames, _open_text,
+	_resource_filepath, _single_flight, _split_compression,
+)
+from .snapshot import _from_snapshot
 
 __all__ = [
-	"sw_daily", "ap_kp_3h", "read_sw",
+	"sw_daily", "ap_kp_3h", "read_sw", "read_sw_sections", "read_sw_csv",
+	"fetch_sw",
 	"get_file_age", "update_data",
 	"SW_PATH_ALL", "SW_PATH_5Y",
+	"SW_PATH_ALL_CSV", "SW_PATH_5Y_CSV",
 ]
 
 DL_URL_ALL = "https://celestrak.org/SpaceData/SW-All.txt"
@@ -33,11 +39,25 @@ SW_FILE_5Y = os.path.basename(DL_URL_5Y)
 SW_PATH_ALL = _resource_filepath(SW_FILE_ALL)
 SW_PATH_5Y = _resource_filepath(SW_FILE_5Y)
 
+DL_URL_ALL_CSV = "https://celestrak.org/SpaceData/SW-All.csv"
+DL_URL_5Y_CSV = "https://celestrak.org/SpaceData/SW-Last5Years.csv"
+SW_FILE_ALL_CSV = os.path.basename(DL_URL_ALL_CSV)
+SW_FILE_5Y_CSV = os.path.basename(DL_URL_5Y_CSV)
+SW_PATH_ALL_CSV = _resource_filepath(SW_FILE_ALL_CSV)
+SW_PATH_5Y_CSV = _resource_filepath(SW_FILE_5Y_CSV)
+
+_SW_FORMATS = {
+	"txt": (SW_PATH_ALL, SW_PATH_5Y, DL_URL_ALL, DL_URL_5Y),
+	"csv": (SW_PATH_ALL_CSV, SW_PATH_5Y_CSV, DL_URL_ALL_CSV, DL_URL_5Y_CSV),
+}
+
 
 def get_file_age(swpath, relative=True):
 	"""Age of the downloaded data file
 
 	Retrieves the last update time of the given file or full path.
+	Files without an "UPDATED" header line, such as the csv files,
+	use the file's modification time instead.
 
 	Parameters
 	----------
@@ -53,13 +73,18 @@ def get_file_age(swpath, relative=True):
 		of `relative` above.
 		Raises ``IOError`` if the file is not found.
 	"""
-	_assert_file_exists(swpath)
-	with open(swpath) as fp:
+	upd = None
+	with _open_text(swpath) as fp:
 		for line in fp:
 			if line.startswith("UPDATED"):
+				upd = pd.to_datetime(line.lstrip("UPDATED"), utc=True)
 				# closes the file automatically
 				break
-	upd = pd.to_datetime(line.lstrip("UPDATED"), utc=True)
+			if line.startswith(("BEGIN", "DATE")):
+				# data starts, no time stamp in the header
+				break
+	if upd is None:
+		upd = pd.to_datetime(os.path.getmtime(swpath), unit="s", utc=True)
 	if relative:
 		return pd.Timestamp.now("UTC") - upd
 	return upd
@@ -69,6 +94,7 @@ def update_data(
 	min_age="3h",
 	swpath_all=None, swpath_5y=None,
 	url_all=None, url_5y=None,
+	file_format=None,
 ):
 	"""Update the local space weather index data
 
@@ -76,6 +102,8 @@ def update_data(
 	given that the 5-year file is older
 	than `min_age`, or the combined (large) file is older than four years.
 	If the data is missing for some reason, a download will be attempted nonetheless.
+	Paths ending in ".gz", ".xz", or ".zst" store the files compressed,
+	the readers decompress them transparently.
 
 	All arguments are optional and changing them from the defaults should not
 	be required neither should it be necessary nor is it recommended.
@@ -101,6 +129,9 @@ def update_data(
 	url_5y: `None` or str, optional, default `None`
 		The url of the data file of containing the indices of the last 5 years.
 		`None` uses the default url.
+	file_format: `None` or str, optional, default `None`
+		Download the fixed-width text files ("txt") or the csv files ("csv")
+		to the default locations. `None` defaults to "txt".
 
 	Returns
 	-------
@@ -117,10 +148,11 @@ def update_data(
 		logging.info("updating '{0}'.".format(swpath))
 		_dl_file(swpath, url)
 
-	swpath_all = swpath_all or SW_PATH_ALL
-	swpath_5y = swpath_5y or SW_PATH_5Y
-	url_all = url_all or DL_URL_ALL
-	url_5y = url_5y or DL_URL_5Y
+	_path_all, _path_5y, _url_all, _url_5y = _SW_FORMATS[file_format or "txt"]
+	swpath_all = swpath_all or _path_all
+	swpath_5y = swpath_5y or _path_5y
+	url_all = url_all or _url_all
+	url_5y = url_5y or _url_5y
 
 	# Update the large file after four years
 	# to have some overlap with the 5-year data
@@ -134,6 +166,7 @@ def read_sw(swpath):
 	"""Read and parse space weather index data file
 
 	Reads the given file and parses it according to the space weather data format.
+	Files ending in ".csv" are parsed with :func:`read_sw_csv()`.
 
 	Parameters
 	----------
@@ -144,6 +177,8 @@ def read_sw(swpath):
 	-------
 	sw_df: pandas.DataFrame
 		The parsed space weather data (daily values).
+		Includes the observed as well as the daily and monthly predicted
+		values, use :func:`read_sw_sections()` to get them separately.
 		Raises an ``IOError`` if the file is not found.
 		The index is returned timezone-naive but contains UTC timestamps.
 		To convert to a timezone-aware index, use
@@ -201,9 +236,41 @@ def read_sw(swpath):
 			Last 81-day arithmetic average of F10.7 (observed).
 	"""
 	_assert_file_exists(swpath)
+	if _is_csv(swpath):
+		return read_sw_csv(swpath)
+	return _sw_concat(read_sw_sections(swpath))
+
+
+def _is_csv(swpath):
+	return _split_compression(swpath)[0].lower().endswith(".csv")
+
+
+def _sw_concat(sections):
+	frames = [sections[_s] for _s in _SW_SECTIONS if _s in sections]
+	if not frames:
+		raise ValueError("No space weather data found.")
+	return pd.concat(frames)
+
+
+_SW_SECTIONS = ["observed", "daily_predicted", "monthly_predicted"]
+_SW_NAMES = [
+	"year", "month", "day", "bsrn", "rotd",
+	"Kp0", "Kp3", "Kp6", "Kp9", "Kp12", "Kp15", "Kp18", "Kp21", "Kpsum",
+	"Ap0", "Ap3", "Ap6", "Ap9", "Ap12", "Ap15", "Ap18", "Ap21", "Apavg",
+	"Cp", "C9", "isn", "f107_adj", "Q", "f107_81ctr_adj", "f107_81lst_adj",
+	"f107_obs", "f107_81ctr_obs", "f107_81lst_obs"
+]
+_SW_DTYPE = (
+	"i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,"
+	"i4,i4,i4,i4,i4,i4,i4,i4,i4,f8,i4,i4,f8,i4,"
+	"f8,f8,f8,f8,f8"
+)
+
+
+def _parse_sw(lines):
+	# Parses the data lines of one section of the file
 	sw = np.genfromtxt(
-		swpath,
-		skip_header=3,
+		lines,
 		delimiter=[
 		#  yy mm dd br rd kp kp kp kp kp kp kp kp Kp
 			4, 3, 3, 5, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4,
@@ -211,19 +278,10 @@ def read_sw(swpath):
 			4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 2, 4, 6, 2,
 		#  f2 f3 f4 f5 f6
 			6, 6, 6, 6, 6],
-		dtype=(
-			"i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,"
-			"i4,i4,i4,i4,i4,i4,i4,i4,i4,f8,i4,i4,f8,i4,"
-			"f8,f8,f8,f8,f8"
-		),
-		names=[
-			"year", "month", "day", "bsrn", "rotd",
-			"Kp0", "Kp3", "Kp6", "Kp9", "Kp12", "Kp15", "Kp18", "Kp21", "Kpsum",
-			"Ap0", "Ap3", "Ap6", "Ap9", "Ap12", "Ap15", "Ap18", "Ap21", "Apavg",
-			"Cp", "C9", "isn", "f107_adj", "Q", "f107_81ctr_adj", "f107_81lst_adj",
-			"f107_obs", "f107_81ctr_obs", "f107_81lst_obs"
-		]
-	)[2:-1]
+		dtype=_SW_DTYPE,
+		names=_SW_NAMES,
+	)
+	sw = np.atleast_1d(sw)
 	sw = sw[sw["year"] != -1]
 	ts = pd.to_datetime([
 		"{0:04d}-{1:02d}-{2:02d}".format(yy, mm, dd)
@@ -236,6 +294,180 @@ def read_sw(swpath):
 	return sw_df
 
 
+def read_sw_sections(swpath):
+	"""Read and parse the sections of a space weather index data file
+
+	Reads the given file in a single pass and parses the observed,
+	the daily predicted, and the monthly predicted data separately,
+	using the ``BEGIN`` and ``END`` section markers in the file.
+
+	Parameters
+	----------
+	swpath: str
+		File to parse, absolute path or relative to the current dir.
+
+	Returns
+	-------
+	sections: dict of pandas.DataFrame
+		The parsed sections, with the keys "observed", "daily_predicted",
+		and "monthly_predicted", sections missing in the file are omitted.
+		Files without section markers are returned as "observed" section.
+		The dataframes contain the same columns as returned by :func:`read_sw()`.
+		The Kp and Ap values of the monthly predicted data are not available
+		and are set to -0.1 and -1, respectively.
+		Raises an ``IOError`` if the file is not found.
+
+	See Also
+	--------
+	read_sw
+	"""
+	with _open_text(swpath) as fp:
+		return _sw_sections(fp)
+
+
+def _sw_sections(fp):
+	# Parses the sections from the lines of `fp`
+	lines = {}
+	data = []
+	section = None
+	for line in fp:
+		if line.startswith("BEGIN "):
+			section = line[len("BEGIN "):].strip().lower()
+			lines[section] = []
+		elif line.startswith("END "):
+			section = None
+		elif section is not None:
+			lines[section].append(line)
+		elif line[:4].isdigit():
+			data.append(line)
+	if not lines:
+		# files without section markers, all data lines as one section
+		lines["observed"] = data
+	return dict(
+		(_s, _parse_sw(_ls)) for _s, _ls in lines.items() if _ls
+	)
+
+
+_SW_CSV_COLUMNS = {
+	"BSRN": "bsrn", "ND": "rotd",
+	"KP1": "Kp0", "KP2": "Kp3", "KP3": "Kp6", "KP4": "Kp9",
+	"KP5": "Kp12", "KP6": "Kp15", "KP7": "Kp18", "KP8": "Kp21", "KP_SUM": "Kpsum",
+	"AP1": "Ap0", "AP2": "Ap3", "AP3": "Ap6", "AP4": "Ap9",
+	"AP5": "Ap12", "AP6": "Ap15", "AP7": "Ap18", "AP8": "Ap21", "AP_AVG": "Apavg",
+	"CP": "Cp", "C9": "C9", "ISN": "isn",
+	"F10.7_ADJ": "f107_adj",
+	"F10.7_ADJ_CENTER81": "f107_81ctr_adj", "F10.7_ADJ_LAST81": "f107_81lst_adj",
+	"F10.7_OBS": "f107_obs",
+	"F10.7_OBS_CENTER81": "f107_81ctr_obs", "F10.7_OBS_LAST81": "f107_81lst_obs",
+}
+# Flux qualifier for the csv data types, the predicted values get -1
+# as in the fixed-width files.
+_SW_CSV_Q = {"OBS": 0, "INT": 4, "PRD": -1, "PRM": -1}
+
+
+def read_sw_csv(swpath, engine=None):
+	"""Read and parse space weather index csv file
+
+	Reads the csv version of the celestrak space weather data files
+	using :func:`pandas.read_csv()` and returns the same columns
+	as :func:`read_sw()`.
+
+	Parameters
+	----------
+	swpath: str
+		File to parse, absolute path or relative to the current dir.
+	engine: `None` or str, optional, default `None`
+		The parser engine passed to :func:`pandas.read_csv()`.
+		`None` uses "pyarrow" if available, and "c" otherwise.
+
+	Returns
+	-------
+	sw_df: pandas.DataFrame
+		The parsed space weather data (daily values),
+		with the same columns and types as returned by :func:`read_sw()`.
+		Raises an ``IOError`` if the file is not found.
+
+		The csv files provide the data type ("OBS", "INT", "PRD", "PRM")
+		instead of the flux qualifier, thus "Q" is set to 0 for observed
+		values, to 4 for interpolated values, and to -1 for predictions.
+		The qualifiers 1, 2, and 3 are not available from the csv files.
+
+	See Also
+	--------
+	read_sw
+	"""
+	with _open_text(swpath, "rb") as fp:
+		return _sw_csv(fp, engine=engine)
+
+
+def _sw_csv(fp, engine=None):
+	# Parses the csv data from the binary file object `fp`
+	if engine is None:
+		try:
+			import pyarrow  # noqa: F401
+			engine = "pyarrow"
+		except ImportError:
+			engine = "c"
+	csv = pd.read_csv(fp, engine=engine)
+	ts = pd.to_datetime(csv["DATE"].astype(str).values, format="%Y-%m-%d")
+	sw = {
+		"year": ts.year.values.astype("i4"),
+		"month": ts.month.values.astype("i4"),
+		"day": ts.day.values.astype("i4"),
+	}
+	for _c, _n in _SW_CSV_COLUMNS.items():
+		sw[_n] = csv[_c].values
+	sw["Q"] = csv["F10.7_DATA_TYPE"].map(_SW_CSV_Q).values
+	sw_df = pd.DataFrame(sw, index=ts)
+	# same order and types as from the fixed-width files
+	sw_df = sw_df[_SW_NAMES]
+	for _n, _t in zip(_SW_NAMES, _SW_DTYPE.split(",")):
+		if _t == "i4":
+			sw_df[_n] = sw_df[_n].fillna(-1).astype(_t)
+		else:
+			sw_df[_n] = sw_df[_n].astype(_t)
+	# Adjust Kp to 0...9
+	kpns = list(map("Kp{0}".format, range(0, 23, 3))) + ["Kpsum"]
+	sw_df[kpns] = 0.1 * sw_df[kpns]
+	return sw_df
+
+
+def fetch_sw(swpath=None, url=None):
+	"""Download and parse a space weather index data file in one pass
+
+	Parses the data while downloading, the downloaded content is saved
+	to `swpath` at the same time, such that the data are available
+	as soon as the download finishes. The file is replaced only after
+	the complete download, and compressed as by :func:`update_data()`.
+	If the download fails, the local file is parsed instead.
+
+	Parameters
+	----------
+	swpath: `None` or str, optional, default `None`
+		The local file for the downloaded data, files ending in ".csv"
+		are parsed as csv files. `None` uses the package's default
+		location of the 5-year file.
+	url: `None` or str, optional, default `None`
+		The url of the data file. `None` uses the 5-year file url.
+
+	Returns
+	-------
+	sw_df: pandas.DataFrame
+		The parsed space weather data (daily values),
+		as returned by :func:`read_sw()`.
+		Raises an ``IOError`` if the download fails and the file is not found.
+
+	See Also
+	--------
+	read_sw
+	"""
+	swpath = swpath or SW_PATH_5Y
+	url = url or (DL_URL_5Y_CSV if _is_csv(swpath) else DL_URL_5Y)
+	if _is_csv(swpath):
+		return _fetch(swpath, url, _sw_csv, text=False)
+	return _fetch(swpath, url, lambda fp: _sw_concat(_sw_sections(fp)))
+
+
 # Common arguments for the public daily and 3h interfaces
 _SW_COMMON_PARAMS = """
 Parameters
@@ -254,6 +486,11 @@ update_interval: str, optional, default "30days"
 	By default, no automatic re-download is initiated, set `update` to true.
 	The online data is updated every 3 hours, thus setting this value to
 	a shorter time is not needed and not recommended.
+file_format: `None` or str, optional, default `None`
+	Use the fixed-width text files ("txt") or the csv files ("csv")
+	from the default locations. `None` defaults to "txt".
+	Files passed via `swpath_all` and `swpath_5y` are parsed according
+	to their extension.
 """
 
 
@@ -264,11 +501,26 @@ def _doc_param(**sub):
 	return dec
 
 
+def _sw_rank(df):
+	# observed (and interim) values before predicted values
+	return df["Q"] >= 0
+
+
+@_single_flight
 @_doc_param(params=_SW_COMMON_PARAMS)
-def sw_daily(swpath_all=None, swpath_5y=None, update=False, update_interval="30days"):
+def sw_daily(
+	swpath_all=None, swpath_5y=None,
+	update=False, update_interval="30days",
+	file_format=None,
+):
 	"""Combined daily Ap, Kp, and f10.7 index values
 
 	Combines the "historic" and last-5-year data into one dataframe.
+	For overlapping days, observed values are preferred over predicted
+	values, and the last-5-year data otherwise.
+	The function is thread-safe, concurrent calls with the same arguments
+	share one parse of the files, and the files are replaced atomically
+	by updates.
 
 	All arguments are optional and changing them from the defaults should not
 	be required neither should it be necessary nor is it recommended.
@@ -286,8 +538,14 @@ def sw_daily(swpath_all=None, swpath_5y=None, update=False, update_interval="30d
 	--------
 	ap_kp_3h, read_sw
 	"""
-	swpath_all = swpath_all or SW_PATH_ALL
-	swpath_5y = swpath_5y or SW_PATH_5Y
+	_path_all, _path_5y, _, _ = _SW_FORMATS[file_format or "txt"]
+	swpath_all = swpath_all or _path_all
+	swpath_5y = swpath_5y or _path_5y
+
+	if not update:
+		df = _from_snapshot("celestrak", [swpath_all, swpath_5y])
+		if df is not None:
+			return df
 
 	# ensure that the file exists and is up to date
 	if (
@@ -295,7 +553,9 @@ def sw_daily(swpath_all=None, swpath_5y=None, update=False, update_interval="30d
 		or not os.path.exists(swpath_5y)
 	):
 		warn("Could not find space weather data, trying to download.")
-		update_data(swpath_all=swpath_all, swpath_5y=swpath_5y)
+		update_data(
+			swpath_all=swpath_all, swpath_5y=swpath_5y, file_format=file_format,
+		)
 
 	if (
 		# 1460 = 4 * 365
@@ -303,7 +563,9 @@ def sw_daily(swpath_all=None, swpath_5y=None, update=False, update_interval="30d
 		or get_file_age(swpath_5y) > pd.Timedelta(update_interval)
 	):
 		if update:
-			update_data(swpath_all=swpath_all, swpath_5y=swpath_5y)
+			update_data(
+				swpath_all=swpath_all, swpath_5y=swpath_5y, file_format=file_format,
+			)
 		else:
 			warn(
 				"Local data files are older than {0}, pass `update=True` or "
@@ -314,9 +576,10 @@ def sw_daily(swpath_all=None, swpath_5y=None, update=False, update_interval="30d
 
 	df_all = read_sw(swpath_all)
 	df_5y = read_sw(swpath_5y)
-	return pd.concat([df_all[:df_5y.index[0]], df_5y[1:]])
+	return _merge_frames(df_all, df_5y, rank=_sw_rank)
 
 
+@_single_flight
 @_doc_param(params=_SW_COMMON_PARAMS)
 def ap_kp_3h(*args, **kwargs):
 	"""3h values of Ap and Kp
@@ -0,0 +1,435 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Command line interface, available as ``spaceweather`` after installation
+or as ``python -m spaceweather``. All commands write their results
+as JSON to stdout and exit with a non-zero status on errors.
+
+Commands:
+
+update:
+	Download new data files (in parallel).
+warm:
+	Parse the data once, install a snapshot of the parsed data for
+	the loaders, and build the OMNI Parquet dataset.
+convert:
+	Write the data to Parquet, Feather, or csv files.
+status:
+	File sizes, ages, and the last data line of the local files,
+	compressed files are decompressed for the last line.
+bench:
+	Parse and load timings on the local data files.
+snapshot:
+	Export the parsed data to a snapshot archive, or import
+	(install) or show a snapshot, see :mod:`spaceweather.snapshot`.
+"""
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+from posixpath import join as urljoin
+
+import pandas as pd
+
+from .celestrak import (
+	SW_PATH_ALL, SW_PATH_5Y, read_sw, sw_daily, update_data,
+)
+from .combined import _map
+from .core import (
+	_compression, _dl_file, _open_text, _split_compression,
+)
+from .gfz import (
+	GFZ_PATH_ALL, GFZ_PATH_30D, HP30_PATH_ALL, HP30_PATH_30D,
+	HP60_PATH_ALL, HP60_PATH_30D,
+	gfz_daily, gfz_hp30, gfz_hp60, read_gfz, read_gfz_hp,
+	update_gfz, update_gfz_hp30, update_gfz_hp60,
+)
+from .omni import (
+	OMNI_URL_BASE,
+	_omnie_file, _omnie_years, cache_omnie, omnie_hourly, omnie_to_parquet,
+	read_omnie,
+)
+from .snapshot import (
+	SNAPSHOT_PATH, _load_entry, _loaders, _write_snapshot,
+	export_snapshot, install_snapshot, load_snapshot,
+)
+
+__all__ = [
+	"main",
+]
+
+_timer = getattr(time, "perf_counter", time.time)
+
+
+def _omni_years(args):
+	# The requested years, or the years of the local files,
+	# also the compressed ones (e.g. "dat.gz")
+	if args.years:
+		return sorted(args.years)
+	return _omnie_years()
+
+
+def _omni_files(args):
+	return [_omnie_file(_y)[0] for _y in _omni_years(args)]
+
+
+def _omni_update(args):
+	# `cache_omnie()` only downloads missing files,
+	# existing files are replaced after `min_age`
+	min_age = pd.Timedelta(args.min_age or "1D").total_seconds()
+	for year, path in zip(_omni_years(args), _omni_files(args)):
+		if not os.path.exists(path):
+			cache_omnie(year)
+		elif time.time() - os.path.getmtime(path) >= min_age:
+			basename = _split_compression(os.path.basename(path))[0]
+			_dl_file(path, urljoin(OMNI_URL_BASE, basename))
+
+
+def _omni_load(args):
+	years = _omni_years(args)
+	if not years:
+		raise IOError("No OMNI data files found, use `--years`.")
+	return pd.concat([omnie_hourly(_y, ext=_omnie_file(_y)[1]) for _y in years])
+
+
+# name: (files, update, load, file parser)
+_SOURCES = {
+	"celestrak": (
+		lambda args: [str(SW_PATH_ALL), str(SW_PATH_5Y)],
+		lambda args: update_data(min_age=args.min_age or "3h"),
+		lambda args: sw_daily(),
+		read_sw,
+	),
+	"gfz": (
+		lambda args: [str(GFZ_PATH_ALL), str(GFZ_PATH_30D)],
+		lambda args: update_gfz(min_age=args.min_age or "1D"),
+		lambda args: gfz_daily(),
+		read_gfz,
+	),
+	"hp30": (
+		lambda args: [str(HP30_PATH_ALL), str(HP30_PATH_30D)],
+		lambda args: update_gfz_hp30(min_age=args.min_age or "1D"),
+		lambda args: gfz_hp30(),
+		read_gfz_hp,
+	),
+	"hp60": (
+		lambda args: [str(HP60_PATH_ALL), str(HP60_PATH_30D)],
+		lambda args: update_gfz_hp60(min_age=args.min_age or "1D"),
+		lambda args: gfz_hp60(),
+		read_gfz_hp,
+	),
+	"omni": (_omni_files, _omni_update, _omni_load, read_omnie),
+}
+
+
+def _last_line(path, size=4096, max_compressed=16 * 1024 * 1024):
+	# The last data line (starting with a digit) of the file,
+	# reading only the end of uncompressed files. Compressed files
+	# cannot be read from the end and are decompressed completely
+	# (streamed), `None` for compressed files above `max_compressed` bytes.
+	if _compression(path) is not None:
+		if os.path.getsize(path) > max_compressed:
+			return None
+		with _open_text(path, "rb") as fp:
+			lines = collections.deque(fp, maxlen=64)
+	else:
+		with open(path, "rb") as fp:
+			fp.seek(0, os.SEEK_END)
+			end = fp.tell()
+			fp.seek(max(0, end - size))
+			lines = fp.read().splitlines()
+	lines = [_l.strip() for _l in lines if _l.strip()[:1].isdigit()]
+	return lines[-1].decode("ascii", "replace") if lines else None
+
+
+def _file_status(path):
+	path = str(path)
+	ret = {"path": path, "exists": os.path.exists(path)}
+	if not ret["exists"]:
+		return ret
+	stat = os.stat(path)
+	ret["size"] = stat.st_size
+	ret["modified"] = pd.Timestamp(stat.st_mtime, unit="s", tz="utc").isoformat()
+	ret["age_seconds"] = round(time.time() - stat.st_mtime, 3)
+	ret["last_data_line"] = _last_line(path)
+	return ret
+
+
+def _frame_info(df):
+	ret = {"rows": len(df), "columns": len(df.columns)}
+	if len(df):
+		ret["first"] = df.index[0].isoformat()
+		ret["last"] = df.index[-1].isoformat()
+	return ret
+
+
+def _run_sources(func, args):
+	# Runs `func(name)` for the selected sources (in parallel),
+	# collecting the results and errors.
+	def _run(name):
+		t0 = _timer()
+		try:
+			ret = func(name) or {}
+			ret["ok"] = True
+		except Exception as e:
+			ret = {"ok": False, "error": "{0}: {1}".format(type(e).__name__, e)}
+		ret["seconds"] = round(_timer() - t0, 6)
+		return ret
+	results = _map(_run, args.sources, args.workers)
+	return dict(zip(args.sources, results))
+
+
+def _cmd_update(args):
+	def _update(name):
+		files, update, _, _ = _SOURCES[name]
+		update(args)
+		return {"files": [_file_status(_f) for _f in files(args)]}
+	return _run_sources(_update, args)
+
+
+def _keep_snapshot(path, keys):
+	# The entries of the installed snapshot that are not in `keys`
+	try:
+		snap = load_snapshot(path)
+	except (IOError, OSError, ValueError):
+		return []
+	return [
+		(_k, snap.manifest["sources"][_k]["files"], snap.frame(_k))
+		for _k in snap.keys() if _k not in keys
+	]
+
+
+def _cmd_warm(args):
+	years = _omni_years(args)
+	loaded = {}
+
+	def _warm(name):
+		entries = [_load_entry(_e) for _e in _loaders([name], years, {})]
+		if not entries:
+			raise IOError("No OMNI data files found, use `--years`.")
+		loaded[name] = entries
+		ret = _frame_info(pd.concat([_df for _, _, _df in entries]))
+		if name == "omni" and not args.no_parquet:
+			try:
+				import pyarrow  # noqa: F401
+			except ImportError:
+				ret["parquet"] = None
+			else:
+				ret["parquet"] = omnie_to_parquet(years=years)
+		return ret
+	results = _run_sources(_warm, args)
+	ok = [_n for _n in args.sources if results[_n]["ok"]]
+	if args.no_snapshot or not ok:
+		return results
+	# the loaders use the installed snapshot instead of parsing
+	entries = [_e for _n in ok for _e in loaded[_n]]
+	entries += _keep_snapshot(SNAPSHOT_PATH, [_k for _k, _, _ in entries])
+	try:
+		_write_snapshot(SNAPSHOT_PATH, entries)
+	except Exception as e:
+		for _n in ok:
+			results[_n].update(
+				ok=False, error="{0}: {1}".format(type(e).__name__, e),
+			)
+	else:
+		for _n in ok:
+			results[_n]["snapshot"] = str(SNAPSHOT_PATH)
+	return results
+
+
+def _cmd_convert(args):
+	def _convert(name):
+		_, _, load, _ = _SOURCES[name]
+		out = args.output
+		if len(args.sources) > 1 or os.path.isdir(out):
+			out = os.path.join(out, "{0}.{1}".format(name, args.format))
+		if name == "omni" and args.format == "parquet":
+			# year-partitioned dataset
+			converted = omnie_to_parquet(
+				years=_omni_years(args), dataset_path=out, overwrite=True,
+			)
+			return {"output": out, "years": converted}
+		df = load(args)
+		if args.format == "parquet":
+			df.to_parquet(out)
+		elif args.format == "feather":
+			df.reset_index().to_feather(out)
+		else:
+			df.to_csv(out)
+		ret = _frame_info(df)
+		ret["output"] = out
+		return ret
+	if len(args.sources) > 1 and not os.path.isdir(args.output):
+		os.makedirs(args.output)
+	return _run_sources(_convert, args)
+
+
+def _cmd_status(args):
+	def _status(name):
+		files, _, _, _ = _SOURCES[name]
+		return {"files": [_file_status(_f) for _f in files(args)]}
+	return _run_sources(_status, args)
+
+
+def _cmd_bench(args):
+	def _time(func):
+		times = []
+		for _ in range(args.repeat):
+			t0 = _timer()
+			func()
+			times.append(_timer() - t0)
+		return {"min": round(min(times), 6), "mean": round(sum(times) / len(times), 6)}
+
+	def _bench(name):
+		files, _, load, parse = _SOURCES[name]
+		ret = {"parse": {}}
+		for _f in files(args):
+			ret["parse"][os.path.basename(_f)] = _time(lambda: parse(_f))
+		ret["load"] = _time(lambda: load(args))
+		return ret
+	# sequentially for undisturbed timings
+	args.workers = 1
+	return _run_sources(_bench, args)
+
+
+def _cmd_snapshot(args):
+	# one result per snapshot entry
+	t0 = _timer()
+	try:
+		if args.action == "export":
+			manifest = export_snapshot(
+				args.file, sources=args.sources, omni_years=_omni_years(args),
+				workers=args.workers,
+			)
+		elif args.action == "import":
+			manifest = install_snapshot(args.file, dest=args.dest)
+		else:
+			manifest = load_snapshot(args.file).manifest
+	except Exception as e:
+		return {"snapshot": {
+			"ok": False, "error": "{0}: {1}".format(type(e).__name__, e),
+			"seconds": round(_timer() - t0, 6),
+		}}
+	ret = {}
+	for key, entry in manifest["sources"].items():
+		ret[key] = dict(
+			(_k, entry[_k]) for _k in ["rows", "first", "last", "files"]
+		)
+		ret[key]["columns"] = len(entry["columns"])
+		ret[key]["ok"] = True
+	return ret
+
+
+_COMMANDS = {
+	"update": _cmd_update,
+	"warm": _cmd_warm,
+	"convert": _cmd_convert,
+	"status": _cmd_status,
+	"bench": _cmd_bench,
+	"snapshot": _cmd_snapshot,
+}
+
+
+def _parser():
+	parser = argparse.ArgumentParser(
+		prog="spaceweather",
+		description="Space weather index data tools, the results are written as JSON.",
+	)
+	common = argparse.ArgumentParser(add_help=False)
+	common.add_argument(
+		"-s", "--sources", nargs="+", choices=sorted(_SOURCES.keys()),
+		default=["celestrak", "gfz"],
+		help="The data sources (default: celestrak gfz).",
+	)
+	common.add_argument(
+		"-y", "--years", nargs="+", type=int,
+		help="The OMNI years (default: the years of the local files).",
+	)
+	common.add_argument(
+		"-w", "--workers", type=int, default=None,
+		help="The number of threads for the sources.",
+	)
+	common.add_argument(
+		"--indent", type=int, default=2, help="JSON indentation.",
+	)
+	sub = parser.add_subparsers(dest="command")
+	sub.required = True
+	p = sub.add_parser("update", parents=[common], help="Download new data files.")
+	p.add_argument(
+		"--min-age", default=None,
+		help="Minimum age of the files to update, e.g. 3h (default: per source).",
+	)
+	p = sub.add_parser(
+		"warm", parents=[common],
+		help="Parse the data files once and install a snapshot.",
+	)
+	p.add_argument(
+		"--no-parquet", action="store_true",
+		help="Do not build the OMNI Parquet dataset.",
+	)
+	p.add_argument(
+		"--no-snapshot", action="store_true",
+		help="Do not install a snapshot of the parsed data.",
+	)
+	p = sub.add_parser("convert", parents=[common], help="Convert the data.")
+	p.add_argument(
+		"-f", "--format", choices=["parquet", "feather", "csv"], default="parquet",
+		help="The output format (default: parquet).",
+	)
+	p.add_argument(
+		"-o", "--output", required=True,
+		help="The output file, or directory for several sources.",
+	)
+	sub.add_parser("status", parents=[common], help="Show the local file status.")
+	p = sub.add_parser("bench", parents=[common], help="Time parsing and loading.")
+	p.add_argument(
+		"-n", "--repeat", type=int, default=3,
+		help="The number of repetitions (default: 3).",
+	)
+	p = sub.add_parser(
+		"snapshot", parents=[common],
+		help="Export, import, or show a snapshot of the parsed data.",
+	)
+	p.add_argument(
+		"action", choices=["export", "import", "info"],
+		help="Export the sources to, install, or show the snapshot file.",
+	)
+	p.add_argument("file", help="The snapshot file.")
+	p.add_argument(
+		"--dest", default=None,
+		help="The install location for import (default: the data directory).",
+	)
+	# all sources by default, "omni" needs `--years` or local files
+	p.set_defaults(sources=["celestrak", "gfz", "hp30", "hp60"])
+	return parser
+
+
+def main(argv=None):
+	"""Command line entry point
+
+	Parameters
+	----------
+	argv: `None` or list of str, optional, default `None`
+		The command line arguments, `None` uses `sys.argv`.
+
+	Returns
+	-------
+	status: int
+		0 if all sources succeeded, 1 otherwise.
+	"""
+	args = _parser().parse_args(argv)
+	results = _COMMANDS[args.command](args)
+	ok = all(_r["ok"] for _r in results.values())
+	sys.stdout.write(json.dumps(
+		{"command": args.command, "ok": ok, "sources": results},
+		indent=args.indent, sort_keys=True, default=str,
+	) + "\n")
+	return 0 if ok else 1
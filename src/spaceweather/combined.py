@@ -0,0 +1,266 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Combined space weather data from several sources on a common time grid.
+"""
+import numpy as np
+import pandas as pd
+
+from .celestrak import ap_kp_3h, sw_daily
+from .gfz import gfz_3h, gfz_daily, gfz_hp30, gfz_hp60
+from .omni import _omnie_years, omnie_hourly, omnie_mask_missing
+from .resample import align
+
+__all__ = [
+	"load_combined",
+]
+
+_F107 = ["f107_obs", "f107_adj"]
+_OMNI_COLUMNS = [
+	"B_mag", "B_x", "B_y_GSM", "B_z_GSM", "n_p", "v_plasma", "p_flow",
+	"E", "Kp", "Dst", "AE", "Ap", "f107_adj", "AL", "AU",
+]
+
+
+def _mask_negative(df):
+	# The GFZ and celestrak files use -1 for missing (or not yet
+	# available) index values.
+	return df.where(df >= 0)
+
+
+def _load_gfz(start, end, **kwargs):
+	return _mask_negative(gfz_3h(**kwargs)[["Kp", "Ap"]])
+
+
+def _load_gfz_daily(start, end, **kwargs):
+	return _mask_negative(gfz_daily(**kwargs)[_F107 + ["isn"]])
+
+
+def _load_celestrak(start, end, **kwargs):
+	return _mask_negative(ap_kp_3h(**kwargs)[["Kp", "Ap"]])
+
+
+def _load_celestrak_daily(start, end, **kwargs):
+	df = sw_daily(**kwargs)
+	return _mask_negative(df[df["Apavg"] >= 0][_F107 + ["isn"]])
+
+
+def _load_hp(hp_func, suffix):
+	def _load(start, end, **kwargs):
+		# only the lines of the time window are read
+		df = hp_func(start=start, end=end, columns=["Hp", "ap"], **kwargs)
+		return _mask_negative(df).rename(columns={
+			"Hp": "Hp" + suffix, "ap": "ap" + suffix,
+		})
+	return _load
+
+
+def _load_omni(start, end, **kwargs):
+	if start is None or end is None:
+		# the local files
+		years = _omnie_years(
+			kwargs.get("prefix"), kwargs.get("ext"), kwargs.get("local_path"),
+		)
+		years = [
+			_y for _y in years
+			if (start is None or _y >= start.year)
+			and (end is None or _y <= (end - pd.Timedelta(1)).year)
+		]
+		if not years:
+			raise IOError("No OMNI data files found, pass `start` and `end`.")
+	else:
+		# `end` is excluded
+		years = range(start.year, (end - pd.Timedelta(1)).year + 1)
+	df = pd.concat([omnie_hourly(_y, **kwargs)[_OMNI_COLUMNS] for _y in years])
+	return omnie_mask_missing(df)
+
+
+_SOURCES = {
+	"gfz": _load_gfz,
+	"gfz_daily": _load_gfz_daily,
+	"celestrak": _load_celestrak,
+	"celestrak_daily": _load_celestrak_daily,
+	"hp30": _load_hp(gfz_hp30, "30"),
+	"hp60": _load_hp(gfz_hp60, "60"),
+	"omni": _load_omni,
+}
+
+
+def _map(func, items, max_workers):
+	# Parallel map using threads, the loaders spend most of their time
+	# in file i/o and in the numpy and pandas parsers.
+	try:
+		from concurrent.futures import ThreadPoolExecutor
+	except ImportError:
+		return list(map(func, items))
+	if max_workers == 1 or len(items) < 2:
+		return list(map(func, items))
+	with ThreadPoolExecutor(max_workers=max_workers) as pool:
+		return list(pool.map(func, items))
+
+
+def load_combined(
+	sources=("gfz", "gfz_daily", "hp30", "omni"),
+	start=None,
+	end=None,
+	cadence="3h",
+	precedence=None,
+	how="mean",
+	label=None,
+	max_workers=None,
+):
+	"""Space weather data from several sources on a common time grid
+
+	Loads the data from the selected sources in parallel (threads)
+	and aligns them onto one regular time grid using :func:`align()`,
+	longer intervals (e.g. daily) are repeated and shorter intervals
+	(e.g. Hp30 or OMNI hourly) are reduced using `how`.
+	Quantities provided by several sources are combined according to
+	`precedence`, missing values (NaN) of the first source are filled
+	from the next source and so on.
+
+	The available sources and their quantities are:
+
+	"gfz":
+		"Kp", "Ap" from :func:`gfz_3h()`.
+	"gfz_daily":
+		"f107_obs", "f107_adj", "isn" from :func:`gfz_daily()`.
+	"celestrak":
+		"Kp", "Ap" from :func:`ap_kp_3h()`.
+	"celestrak_daily":
+		"f107_obs", "f107_adj", "isn" from :func:`sw_daily()`,
+		without the monthly predicted values.
+	"hp30", "hp60":
+		"Hp30", "ap30" and "Hp60", "ap60" from :func:`gfz_hp30()`
+		and :func:`gfz_hp60()`, reading only the time window.
+	"omni":
+		"B_mag", "B_x", "B_y_GSM", "B_z_GSM", "n_p", "v_plasma", "p_flow",
+		"E", "Kp", "Dst", "AE", "Ap", "f107_adj", "AL", "AU"
+		from :func:`omnie_hourly()`, with the missing values masked.
+
+	Parameters
+	----------
+	sources: list or dict, optional
+		The source names, or a dict of source names and the keyword
+		arguments for their loaders, e.g. ``{"omni": {"cache": True}}``
+		or ``{"gfz": {"gfzpath_all": "..."}}``.
+		Defaults to ("gfz", "gfz_daily", "hp30", "omni").
+	start: `None`, str, or pandas.Timestamp, optional, default `None`
+		The first time of the grid (interval start).
+		`None` uses the interval of the first valid value of all sources.
+	end: `None`, str, or pandas.Timestamp, optional, default `None`
+		The last time of the grid (interval start), included.
+		`None` uses the interval of the last valid value of all sources.
+		Without `start` or `end`, the "omni" source uses the local files.
+	cadence: str, optional, default "3h"
+		The spacing of the grid.
+	precedence: `None` or dict, optional, default `None`
+		The source order per quantity, e.g. ``{"Kp": ["celestrak", "gfz"]}``,
+		sources that are not listed are used afterwards in the order
+		of `sources`. `None` uses the order of `sources` for all quantities.
+	how: str or dict, optional, default "mean"
+		The reduction for sources with a shorter cadence,
+		see :func:`resample()`, a dict sets the reduction per quantity.
+	label: `None` or str, optional, default `None`
+		The time stamps within the grid intervals, see :func:`resample()`.
+		`None` uses "center" for cadences shorter than a day,
+		matching :func:`gfz_3h()`, and "left" otherwise.
+	max_workers: `None` or int, optional, default `None`
+		The number of loader threads, 1 loads the sources sequentially.
+
+	Returns
+	-------
+	df: pandas.DataFrame
+		The combined data, with one column per quantity and NaN where
+		none of the sources has data. The index is timezone-naive
+		but contains UTC timestamps.
+
+	Raises ``ValueError`` for unknown sources, and ``IOError`` if the
+	data files of a source cannot be found.
+
+	See Also
+	--------
+	align, resample
+	"""
+	if isinstance(sources, dict):
+		names = list(sources.keys())
+	else:
+		names = list(sources)
+		sources = dict((_s, {}) for _s in names)
+	for _s in names:
+		if _s not in _SOURCES:
+			raise ValueError("Unknown source: {0}".format(_s))
+	start = None if start is None else pd.Timestamp(start)
+	end = None if end is None else pd.Timestamp(end)
+	step = pd.Timedelta(cadence)
+	if label is None:
+		label = "center" if step < pd.Timedelta("1D") else "left"
+	offset = pd.Timedelta(
+		{"left": 0, "center": step.value // 2, "right": step.value}.get(label, label)
+	)
+	margin = max(step, pd.Timedelta("1D"))
+
+	def _load(name):
+		# the loaders receive the time window of the grid intervals
+		df = _SOURCES[name](
+			start, None if end is None else end + step, **sources[name]
+		)
+		# only the data needed for the grid, including the daily values
+		# of the first and the last day
+		return df.loc[
+			None if start is None else start - margin:
+			None if end is None else end + margin
+		]
+
+	frames = dict(zip(names, _map(_load, names, max_workers)))
+	if start is None or end is None:
+		# the combined range of the valid values
+		valid = [_df.dropna(how="all").index for _df in frames.values()]
+		valid = [_i for _i in valid if len(_i)]
+		if not valid:
+			raise ValueError("No data found, pass `start` and `end`.")
+		if start is None:
+			start = min(_i[0] for _i in valid).floor(step)
+		if end is None:
+			end = max(_i[-1] for _i in valid).floor(step)
+	grid = pd.date_range(start, end, freq=step) + offset
+
+	def _align(df):
+		df = df.loc[start - margin:end + margin]
+		if len(df) == 0:
+			return pd.DataFrame(
+				np.nan, index=grid, columns=df.columns,
+			)
+		_how = how
+		if isinstance(how, dict):
+			_how = dict((_c, how.get(_c, "mean")) for _c in df.columns)
+		return align(df.astype(np.float64), grid, how=_how, freq=step)
+
+	frames = dict((_s, _align(frames[_s])) for _s in names)
+
+	quantities = []
+	for _s in names:
+		quantities.extend(_c for _c in frames[_s].columns if _c not in quantities)
+	precedence = precedence or {}
+	ret = {}
+	for _q in quantities:
+		order = [_s for _s in precedence.get(_q, []) if _s in frames]
+		order += [_s for _s in names if _s not in order]
+		values = None
+		for _s in order:
+			if _q not in frames[_s].columns:
+				continue
+			_v = frames[_s][_q].values
+			if values is None:
+				values = _v.copy()
+			else:
+				_m = np.isnan(values)
+				values[_m] = _v[_m]
+		ret[_q] = values
+	return pd.DataFrame(ret, index=grid, columns=quantities)
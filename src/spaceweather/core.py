@@ -10,9 +10,17 @@
 General file handling functions for space weather data
 """
 import errno
+import gzip
+import io
+import logging
 import os
+import shutil
+import threading
 import warnings
+from functools import wraps
 
+import numpy as np
+import pandas as pd
 import requests
 
 
@@ -21,8 +29,213 @@ def _assert_file_exists(f):
 		raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), f)
 
 
-def _dl_file(swpath, url):
-	with requests.get(url, stream=True) as r:
+# magic bytes of the supported compression formats
+_MAGIC = [
+	(b"\x1f\x8b", "gzip"),
+	(b"\xfd7zXZ\x00", "xz"),
+	(b"\x28\xb5\x2f\xfd", "zstd"),
+]
+# file extensions selecting the compression of downloaded files
+_COMPRESSION_EXT = {".gz": "gzip", ".xz": "xz", ".zst": "zstd"}
+
+
+def _compression(path):
+	# The compression format of the file from its first bytes,
+	# `None` for uncompressed files.
+	with open(path, "rb") as fp:
+		head = fp.read(6)
+	for magic, fmt in _MAGIC:
+		if head.startswith(magic):
+			return fmt
+	return None
+
+
+def _split_compression(path):
+	# The path without compression extension, and the compression
+	# format selected by the extension (or `None`).
+	base, ext = os.path.splitext(str(path))
+	fmt = _COMPRESSION_EXT.get(ext.lower(), None)
+	if fmt is None:
+		return str(path), None
+	return base, fmt
+
+
+def _zstd_open(path, mode):
+	try:
+		# Python 3.14+
+		from compression import zstd
+		return zstd.open(path, mode)
+	except ImportError:
+		pass
+	try:
+		import zstandard
+	except ImportError:
+		raise ImportError(
+			"Reading or writing zstd compressed files requires "
+			"the `zstandard` package."
+		)
+	return zstandard.open(path, mode)
+
+
+def _open_text(path, mode="r", compression=None):
+	"""Open plain or compressed files
+
+	Reading detects gzip, xz, and zstd compressed files from their
+	first bytes and decompresses them while reading. Writing compresses
+	with `compression` ("gzip", "xz", "zstd", or `None` for plain files).
+
+	Parameters
+	----------
+	path: str
+		The file path.
+	mode: str, optional, default "r"
+		"r" or "w", with "b" for binary streams, text otherwise.
+	compression: `None` or str, optional, default `None`
+		The compression format for writing.
+
+	Returns
+	-------
+	fp: file object
+		The (text or binary) file object.
+	"""
+	binary = "b" in mode
+	mode = mode.replace("b", "").replace("t", "")
+	if mode == "r":
+		_assert_file_exists(path)
+		compression = _compression(path)
+	if compression is None:
+		return open(path, mode + ("b" if binary else ""))
+	if compression == "gzip":
+		fp = gzip.GzipFile(path, mode + "b")
+	elif compression == "xz":
+		import lzma
+		fp = lzma.open(path, mode + "b")
+	elif compression == "zstd":
+		fp = _zstd_open(path, mode + "b")
+	else:
+		raise ValueError("Unsupported compression: {0}".format(compression))
+	if binary:
+		return fp
+	return io.TextIOWrapper(fp)
+
+
+# atomic rename, overwriting an existing file (POSIX) in Python 2
+_replace = getattr(os, "replace", os.rename)
+# pandas copy-on-write, shallow copies are independent
+_COW = int(pd.__version__.split(".")[0]) >= 3
+
+
+class _SingleFlight(object):
+	"""Concurrent call deduplication
+
+	Runs only one call per key at a time, concurrent calls with the same
+	key wait for the running call and share its result (or exception).
+	"""
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._calls = {}
+
+	def do(self, key, func, *args, **kwargs):
+		with self._lock:
+			call = self._calls.get(key)
+			leader = call is None
+			if leader:
+				call = self._calls[key] = {"done": threading.Event()}
+		if not leader:
+			call["done"].wait()
+			if "error" in call:
+				raise call["error"]
+			return _share(call["result"])
+		try:
+			call["result"] = func(*args, **kwargs)
+		except BaseException as e:
+			call["error"] = e
+			raise
+		finally:
+			with self._lock:
+				del self._calls[key]
+			call["done"].set()
+		return call["result"]
+
+
+def _share(ret):
+	# Independent result objects for the callers sharing one call,
+	# with copy-on-write the data are only copied when modified.
+	if isinstance(ret, (pd.DataFrame, pd.Series)):
+		return ret.copy(deep=not _COW)
+	if isinstance(ret, np.ndarray):
+		return ret.copy()
+	if isinstance(ret, dict):
+		return dict((_k, _share(_v)) for _k, _v in ret.items())
+	return ret
+
+
+def _freeze(arg):
+	# hashable version of list arguments, e.g. column lists
+	if isinstance(arg, list):
+		return tuple(map(_freeze, arg))
+	return arg
+
+
+_flights = _SingleFlight()
+
+
+def _single_flight(func):
+	"""Deduplicates concurrent calls of `func` with identical arguments
+
+	Calls with unhashable arguments (e.g. dicts) are not deduplicated.
+	"""
+	name = (func.__module__, func.__name__)
+
+	@wraps(func)
+	def wrapper(*args, **kwargs):
+		key = (
+			name,
+			tuple(map(_freeze, args)),
+			tuple(sorted((_k, _freeze(_v)) for _k, _v in kwargs.items())),
+		)
+		try:
+			hash(key)
+		except TypeError:
+			return func(*args, **kwargs)
+		return _flights.do(key, func, *args, **kwargs)
+	return wrapper
+
+
+def _mirror_urls(url):
+	# The urls of the file at the mirrors given by $SPACEWEATHER_MIRRORS
+	# (separated by whitespace or commas), followed by `url`.
+	mirrors = os.environ.get(MIRRORS_ENV, "").replace(",", " ").split()
+	basename = url.rstrip("/").rsplit("/", 1)[-1]
+	return [_m.rstrip("/") + "/" + basename for _m in mirrors] + [url]
+
+
+def _get(url, ok_codes=(requests.codes.ok,), **kwargs):
+	# GET request trying the mirrors first, returns the first successful
+	# response (status in `ok_codes`), or the response from `url` itself.
+	for _url in _mirror_urls(url)[:-1]:
+		try:
+			r = requests.get(_url, **kwargs)
+		except requests.RequestException as e:
+			logging.info("Mirror %s failed: %s", _url, e)
+			continue
+		if r.status_code in ok_codes:
+			return r
+		logging.info("Mirror %s failed, status code: %s", _url, r.status_code)
+		r.close()
+	return requests.get(url, **kwargs)
+
+
+@_single_flight
+def _dl_file(swpath, url, compression=None):
+	# Downloads to a temporary file in the same directory, which then
+	# replaces `swpath`, such that readers never see a partial file.
+	# The mirrors in $SPACEWEATHER_MIRRORS are tried before `url`.
+	# The file is compressed while downloading by `compression`, or as
+	# selected by the extension of `swpath` (".gz", ".xz", or ".zst").
+	if compression is None:
+		_, compression = _split_compression(swpath)
+	with _get(url, stream=True) as r:
 		if r.status_code != requests.codes.ok:
 			if isinstance(r.status_code, int):
 				warnings.warn(
@@ -31,12 +244,267 @@ def _dl_file(swpath, url):
 					),
 				)
 			return
-		with open(swpath, 'wb') as fd:
-			for chunk in r.iter_content(chunk_size=1024):
-				fd.write(chunk)
+		tmppath = "{0}.{1}.{2}.tmp".format(
+			swpath, os.getpid(), threading.current_thread().ident,
+		)
+		try:
+			with _open_text(tmppath, "wb", compression=compression) as fd:
+				for chunk in r.iter_content(chunk_size=1024):
+					fd.write(chunk)
+			_replace(tmppath, swpath)
+		except BaseException:
+			if os.path.exists(tmppath):
+				os.remove(tmppath)
+			raise
+
+
+class _TeeStream(io.RawIOBase):
+	"""Raw stream of a download, saved to a file while being read
+
+	The content is written to a temporary file, which replaces
+	`path` when the end of the download is reached.
+	Closing the stream before removes the temporary file.
+	"""
+	def __init__(self, response, path, compression=None):
+		self._response = response
+		self._chunks = response.iter_content(chunk_size=64 * 1024)
+		self._buf = memoryview(b"")
+		self._path = path
+		self._tmppath = "{0}.{1}.{2}.tmp".format(
+			path, os.getpid(), threading.current_thread().ident,
+		)
+		self._fd = _open_text(self._tmppath, "wb", compression=compression)
+		self._done = False
+
+	def readable(self):
+		return True
+
+	def readinto(self, b):
+		while not len(self._buf):
+			if self._done:
+				return 0
+			try:
+				chunk = next(self._chunks)
+			except StopIteration:
+				self._fd.close()
+				_replace(self._tmppath, self._path)
+				self._done = True
+				return 0
+			self._fd.write(chunk)
+			self._buf = memoryview(chunk)
+		n = min(len(b), len(self._buf))
+		b[:n] = self._buf[:n]
+		self._buf = self._buf[n:]
+		return n
+
+	def close(self):
+		if not self.closed:
+			if not self._done:
+				self._fd.close()
+				if os.path.exists(self._tmppath):
+					os.remove(self._tmppath)
+			self._response.close()
+		super(_TeeStream, self).close()
+
+
+def _dl_stream(path, url, compression=None):
+	"""Stream the download from `url` while saving it to `path`
+
+	Returns a binary file object of the content, which replaces `path`
+	(compressed as by :func:`_dl_file()`) once it is read completely,
+	or `None` if the download failed.
+	"""
+	if compression is None:
+		_, compression = _split_compression(path)
+	try:
+		r = _get(url, stream=True)
+	except requests.RequestException as e:
+		# e.g. connection errors and timeouts
+		warnings.warn("Failed to download from {0}: {1}".format(url, e))
+		return None
+	if r.status_code != requests.codes.ok:
+		r.close()
+		warnings.warn(
+			"Failed to download from {0}, status code: {1}".format(
+				url, r.status_code,
+			),
+		)
+		return None
+	return io.BufferedReader(_TeeStream(r, path, compression), 64 * 1024)
+
+
+def _fetch(path, url, parse, text=True):
+	"""Download `url` to `path` and parse it while downloading
+
+	`parse` is called with a (text or binary) file object of the
+	downloaded content, which is parsed while the download continues.
+	If the download fails, also when interrupted, the local file
+	is parsed instead.
+	"""
+	stream = _dl_stream(path, url)
+	if stream is not None:
+		try:
+			with stream:
+				if text:
+					fp = io.TextIOWrapper(stream)
+					try:
+						ret = parse(fp)
+					finally:
+						# keeps `stream` open
+						fp.detach()
+				else:
+					ret = parse(stream)
+				# the remaining content, completes the file
+				while stream.read(64 * 1024):
+					pass
+			return ret
+		except requests.RequestException as e:
+			# the partial download is discarded when closing `stream`
+			warnings.warn("Failed to download from {0}: {1}".format(url, e))
+	with _open_text(path, "r" if text else "rb") as fp:
+		return parse(fp)
+
+
+def _dl_range(url, start=0, end=None):
+	"""Download the byte range `start`--`end` (inclusive) from `url`
+
+	Uses HTTP range requests, servers that ignore the `Range` header
+	and send the whole file are handled by slicing the response.
+	The mirrors in $SPACEWEATHER_MIRRORS are tried before `url`.
+	Returns the bytes, an empty bytes object if the range is beyond
+	the end of the file, or `None` if the download failed.
+	"""
+	_range = "bytes={0}-{1}".format(start, "" if end is None else end)
+	r = _get(
+		url,
+		ok_codes=(
+			requests.codes.ok, requests.codes.partial_content,
+			requests.codes.requested_range_not_satisfiable,
+		),
+		headers={"Range": _range},
+	)
+	if r.status_code == requests.codes.partial_content:
+		return r.content
+	if r.status_code == requests.codes.ok:
+		return r.content[start:None if end is None else end + 1]
+	if r.status_code == requests.codes.requested_range_not_satisfiable:
+		return b""
+	warnings.warn(
+		"Failed to download from {0}, status code: {1}".format(
+			url, r.status_code,
+		),
+	)
+	return None
+
+
+def _merge_frames(old, new, rank=None):
+	"""Merge two time-sorted dataframes with overlapping times
+
+	Combines the rows of `old` (e.g. the historic file) and `new`
+	(e.g. the recent file) for any overlap or gap between the two.
+	For times contained in both, the row with the higher `rank` is used,
+	and the row from `new` for equal ranks.
+	The overlapping rows are found by `searchsorted()` on the integer times,
+	and the remaining rows are concatenated in a single step,
+	using views for contiguous row ranges.
+
+	Parameters
+	----------
+	old, new: pandas.DataFrame
+		The data with sorted and unique `pandas.DatetimeIndex`es.
+	rank: `None`, str, or callable, optional, default `None`
+		The column used to rank the rows, e.g. a definitive-data flag,
+		or a function returning the rank array for a dataframe.
+		`None` or a column missing in one of the frames ranks
+		all rows equal, preferring `new`.
+
+	Returns
+	-------
+	df: pandas.DataFrame
+		The merged data, sorted by time.
+	"""
+	dtype = np.promote_types(old.index.dtype, new.index.dtype)
+	t_old = old.index.values.astype(dtype).view(np.int64)
+	t_new = new.index.values.astype(dtype).view(np.int64)
+	n_old = len(t_old)
+	pos = np.searchsorted(t_old, t_new)
+	both = pos < n_old
+	both[both] = t_old[pos[both]] == t_new[both]
+	take_new = np.ones(len(t_new), dtype=bool)
+	if callable(rank):
+		r_old, r_new = np.asarray(rank(old)), np.asarray(rank(new))
+	elif rank is not None and rank in old.columns and rank in new.columns:
+		r_old, r_new = old[rank].values, new[rank].values
+	else:
+		r_old = r_new = None
+	if r_old is not None:
+		take_new[both] = r_new[both] >= r_old[pos[both]]
+	keep_old = np.ones(n_old, dtype=bool)
+	keep_old[pos[both & take_new]] = False
+	i_old = _as_slice(np.flatnonzero(keep_old))
+	i_new = _as_slice(np.flatnonzero(take_new))
+	ret = pd.concat([old.iloc[i_old], new.iloc[i_new]])
+	times = ret.index.values.astype(dtype).view(np.int64)
+	if np.any(times[1:] < times[:-1]):
+		# interleaved rows, only if `new` starts before the end of `old`
+		ret = ret.take(np.argsort(times, kind="stable"))
+	return ret
+
+
+def _as_slice(idx):
+	# Contiguous indices as slice for views instead of copies
+	if len(idx) == 0:
+		return slice(0, 0)
+	if idx[-1] - idx[0] == len(idx) - 1:
+		return slice(idx[0], idx[-1] + 1)
+	return idx
+
+
+# environment variables for the shared data directory and the mirrors
+DATA_DIR_ENV = "SPACEWEATHER_DATA_DIR"
+MIRRORS_ENV = "SPACEWEATHER_MIRRORS"
 
 
 def _resource_filepath(file, subdir="data"):
+	# The location of the data file `file` within the package, or in the
+	# directory given by $SPACEWEATHER_DATA_DIR, seeded with the
+	# packaged files on first use. Falls back to the package location
+	# with a warning if the directory is not usable.
+	filepath = _package_filepath(file, subdir)
+	data_dir = os.environ.get(DATA_DIR_ENV, "")
+	if not data_dir or subdir != "data":
+		return filepath
+	data_dir = os.path.expanduser(data_dir)
+	target = os.path.join(data_dir, file)
+	try:
+		_seed_file(data_dir, str(filepath), target)
+	except (IOError, OSError) as e:
+		warnings.warn(
+			"Could not use the data directory {0}: {1}, "
+			"using the package files instead.".format(data_dir, e)
+		)
+		return filepath
+	return target
+
+
+def _seed_file(data_dir, filepath, target):
+	if not os.path.isdir(data_dir):
+		try:
+			os.makedirs(data_dir)
+		except OSError:
+			# created concurrently
+			if not os.path.isdir(data_dir):
+				raise
+	if os.path.isfile(filepath) and not os.path.exists(target):
+		tmppath = "{0}.{1}.{2}.tmp".format(
+			target, os.getpid(), threading.current_thread().ident,
+		)
+		# keeps the modification time for the file age checks
+		shutil.copy2(filepath, tmppath)
+		_replace(tmppath, target)
+
+
+def _package_filepath(file, subdir="data"):
 	try:
 		from contextlib import ExitStack
 		from importlib import resources
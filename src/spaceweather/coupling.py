@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Solar wind - magnetosphere coupling functions from the OMNI data,
+computed with NaN propagation for missing values.
+"""
+import numpy as np
+import pandas as pd
+
+from .omni import _OMNI_MISSING
+
+__all__ = [
+	"akasofu_epsilon",
+	"borovsky_rate",
+	"coupling_functions",
+	"kan_lee_efield",
+	"newell_dphidt",
+]
+
+# vacuum permeability [H / m]
+_MU0 = 4e-7 * np.pi
+# proton mass [kg]
+_M_P = 1.67262192e-27
+# Earth radius [m]
+_R_E = 6371.2e3
+
+
+def _clock(by, bz):
+	# transverse (GSM y-z) field and sin(theta / 2) of the IMF clock angle
+	bt = np.hypot(by, bz)
+	theta = np.arctan2(by, bz)
+	return bt, np.abs(np.sin(0.5 * theta))
+
+
+def newell_dphidt(v, by, bz):
+	"""Newell et al. (2007) coupling function
+
+	The rate of magnetic flux opened at the magnetopause [#]_,
+	dΦ/dt = v^(4/3) B_T^(2/3) sin^(8/3)(θ/2),
+	with the transverse IMF B_T and the IMF clock angle θ in GSM.
+
+	.. [#] Newell et al., J. Geophys. Res., 112, A01206, 2007,
+		doi:10.1029/2006JA012015
+
+	Parameters
+	----------
+	v: array_like
+		Solar wind speed [km / s].
+	by, bz: array_like
+		IMF y and z components (GSM) [nT].
+
+	Returns
+	-------
+	dphidt: numpy.ndarray
+		dΦ/dt in units of (km / s)^(4/3) nT^(2/3).
+	"""
+	bt, s = _clock(by, bz)
+	return np.cbrt(v**4 * bt**2 * s**8)
+
+
+def akasofu_epsilon(v, by, bz, b_mag):
+	"""Akasofu (1981) ε parameter
+
+	The energy input into the magnetosphere [#]_,
+	ε = (4π / μ0) v B² sin^4(θ/2) l0², with l0 = 7 R_E.
+
+	.. [#] Akasofu, Space Sci. Rev., 28, 121–190, 1981,
+		doi:10.1007/BF00218810
+
+	Parameters
+	----------
+	v: array_like
+		Solar wind speed [km / s].
+	by, bz: array_like
+		IMF y and z components (GSM) [nT].
+	b_mag: array_like
+		IMF magnitude [nT].
+
+	Returns
+	-------
+	epsilon: numpy.ndarray
+		ε in W.
+	"""
+	_, s = _clock(by, bz)
+	l0 = 7 * _R_E
+	return (
+		4 * np.pi / _MU0 * (v * 1e3) * (b_mag * 1e-9)**2 * s**4 * l0**2
+	)
+
+
+def kan_lee_efield(v, by, bz):
+	"""Kan and Lee (1979) reconnection electric field
+
+	The dayside reconnection electric field [#]_,
+	E_KL = v B_T sin²(θ/2).
+
+	.. [#] Kan and Lee, Geophys. Res. Lett., 6, 577–580, 1979,
+		doi:10.1029/GL006i007p00577
+
+	Parameters
+	----------
+	v: array_like
+		Solar wind speed [km / s].
+	by, bz: array_like
+		IMF y and z components (GSM) [nT].
+
+	Returns
+	-------
+	efield: numpy.ndarray
+		E_KL in mV / m.
+	"""
+	bt, s = _clock(by, bz)
+	return 1e-3 * v * bt * s**2
+
+
+def borovsky_rate(v, by, bz, b_mag, n_p, mach_a=None, mach_ms=None):
+	"""Borovsky (2008) reconnection rate
+
+	The dayside reconnection rate [#]_ without the magnetospheric plasma
+	contribution, R = 0.4 (μ0 ρ / C)^(1/2) v² sin²(θ/2) (1 + 0.5 M_ms^-2)
+	(1 + β_s)^(-1/2) ((1 + β_s)^(1/2) + 1)^(-1/2), with the compression
+	ratio C and the magnetosheath beta β_s = 0.032 M_A^1.92
+	derived from the Alfvén Mach number M_A.
+
+	.. [#] Borovsky, J. Geophys. Res., 113, A08228, 2008,
+		doi:10.1029/2007JA012646
+
+	Parameters
+	----------
+	v: array_like
+		Solar wind speed [km / s].
+	by, bz: array_like
+		IMF y and z components (GSM) [nT].
+	b_mag: array_like
+		IMF magnitude [nT].
+	n_p: array_like
+		Proton density [1 / cm³].
+	mach_a: `None` or array_like, optional, default `None`
+		Alfvén Mach number, `None` calculates it from `v`, `b_mag`, and `n_p`.
+	mach_ms: `None` or array_like, optional, default `None`
+		Magnetosonic Mach number, `None` uses the Alfvén Mach number.
+
+	Returns
+	-------
+	rate: numpy.ndarray
+		R in mV / m.
+	"""
+	_, s = _clock(by, bz)
+	rho = n_p * 1e6 * _M_P
+	if mach_a is None:
+		mach_a = v * 1e3 * np.sqrt(_MU0 * rho) / (b_mag * 1e-9)
+	if mach_ms is None:
+		mach_ms = mach_a
+	# the compression ratio formula is valid for M_A >= 1
+	mach_a = np.maximum(mach_a, 1.)
+	c = ((1. / 4)**6 + (1. / (1. + 1.38 * np.log(mach_a)))**6)**(-1. / 6)
+	beta_s = 0.032 * mach_a**1.92
+	return (
+		0.4e3 * np.sqrt(_MU0 * rho / c) * (v * 1e3)**2 * s**2
+		* (1. + 0.5 / mach_ms**2)
+		/ np.sqrt(1. + beta_s) / np.sqrt(np.sqrt(1. + beta_s) + 1.)
+	)
+
+
+# function name: (function, required columns, optional columns)
+_FUNCTIONS = {
+	"newell": (newell_dphidt, ["v_plasma", "B_y_GSM", "B_z_GSM"], []),
+	"epsilon": (akasofu_epsilon, ["v_plasma", "B_y_GSM", "B_z_GSM", "B_mag"], []),
+	"kan_lee": (kan_lee_efield, ["v_plasma", "B_y_GSM", "B_z_GSM"], []),
+	"borovsky": (
+		borovsky_rate,
+		["v_plasma", "B_y_GSM", "B_z_GSM", "B_mag", "n_p"],
+		["mach", "mach_mag"],
+	),
+}
+
+
+def _masked(df, column, rows, dtype):
+	# column values as `dtype` with the OMNI fill values replaced by NaN
+	values = np.asarray(df[column].values[rows], dtype=dtype)
+	missing = _OMNI_MISSING.get(column, None)
+	if missing is not None:
+		values = np.where(values == np.asarray(missing, dtype=dtype), np.nan, values)
+	return values
+
+
+def coupling_functions(
+	df,
+	functions=("newell", "epsilon", "kan_lee", "borovsky"),
+	dtype=np.float64,
+	chunksize=None,
+):
+	"""Solar wind coupling functions from OMNI data
+
+	Calculates the solar wind - magnetosphere coupling functions
+	from the OMNI data, e.g. from :func:`omnie_hourly()` or
+	:func:`read_omni_hro()`. The OMNI fill values are masked as in
+	:func:`omnie_mask_missing()` (without copying the data frame),
+	and missing input values result in NaN.
+
+	The available functions are:
+
+	"newell":
+		dΦ/dt from :func:`newell_dphidt()`.
+	"epsilon":
+		Akasofu's ε from :func:`akasofu_epsilon()`.
+	"kan_lee":
+		The reconnection electric field from :func:`kan_lee_efield()`.
+	"borovsky":
+		The reconnection rate from :func:`borovsky_rate()`,
+		using the Mach numbers "mach" and "mach_mag" if available.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		The OMNI data, with the columns "v_plasma", "B_y_GSM", "B_z_GSM",
+		and "B_mag" and "n_p" for "epsilon" and "borovsky".
+	functions: list of str, optional
+		The coupling functions to calculate, defaults to all.
+	dtype: numpy.dtype, optional, default `numpy.float64`
+		The data type of the calculation and the results,
+		e.g. `numpy.float32` to halve the memory use.
+	chunksize: `None` or int, optional, default `None`
+		Calculate in chunks of `chunksize` rows to limit the memory of the
+		intermediate arrays, `None` calculates all rows at once.
+
+	Returns
+	-------
+	coupling: pandas.DataFrame
+		The coupling functions with the same index as `df`,
+		one column per function.
+
+	Raises ``ValueError`` for unknown functions and
+	``KeyError`` for missing input columns.
+	"""
+	for _f in functions:
+		if _f not in _FUNCTIONS:
+			raise ValueError("Unknown coupling function: {0}".format(_f))
+	n = len(df)
+	chunksize = chunksize or max(n, 1)
+	ret = dict((_f, np.empty(n, dtype=dtype)) for _f in functions)
+	for i0 in range(0, n, chunksize):
+		rows = slice(i0, min(i0 + chunksize, n))
+		cache = {}
+
+		def _get(column):
+			if column not in cache:
+				cache[column] = _masked(df, column, rows, dtype)
+			return cache[column]
+
+		for _f in functions:
+			func, required, optional = _FUNCTIONS[_f]
+			args = [_get(_c) for _c in required]
+			args += [_get(_c) if _c in df.columns else None for _c in optional]
+			with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+				ret[_f][rows] = func(*args)
+	return pd.DataFrame(ret, index=df.index, columns=list(functions))
@@ -0,0 +1,186 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Gap filling for regularly spaced space weather data, for example
+the OMNI hourly data or the daily F10.7 fluxes.
+The bracketing valid values of the gaps are found from the positions
+of the missing values, and only the missing values are touched.
+"""
+import numpy as np
+import pandas as pd
+
+from .arrays import _index_ns
+from .omni import _OMNI_MISSING
+
+__all__ = [
+	"fill_gaps",
+]
+
+
+def _fill_column(values, times, method, max_gap):
+	# Fills the NaN of the contiguous column `values` in place,
+	# returns the mask of the filled values.
+	missing = np.isnan(values)
+	rows = np.flatnonzero(missing)
+	valid = np.flatnonzero(~missing)
+	fill = np.zeros(len(values), dtype=bool)
+	if len(rows) == 0 or len(valid) == 0:
+		return fill
+	# positions of the next valid values within `valid`, equal to the
+	# number of valid values before each missing value
+	k = rows - np.arange(len(rows))
+	ok = k > 0
+	if method != "persistence":
+		# only within the data range
+		ok &= k < len(valid)
+	rows, k = rows[ok], k[ok]
+	i0 = valid[k - 1]
+	if max_gap is not None:
+		i1 = np.append(valid, len(values))[k]
+		ok = (i1 - i0 - 1) <= max_gap
+		rows, k, i0 = rows[ok], k[ok], i0[ok]
+	fill[rows] = True
+	if method == "persistence":
+		values[rows] = values[i0]
+		return fill
+	i1 = valid[k]
+	t, t0, t1 = times[rows], times[i0], times[i1]
+	if method == "nearest":
+		values[rows] = values[np.where(t - t0 <= t1 - t, i0, i1)]
+	else:
+		w = (t - t0) / (t1 - t0).astype(np.float64)
+		values[rows] = (1. - w) * values[i0] + w * values[i1]
+	return fill
+
+
+def _max_gap(max_gap, times):
+	# The maximum gap as number of samples
+	if max_gap is None or isinstance(max_gap, (int, np.integer)):
+		return max_gap
+	dt = np.diff(times)
+	step = dt[dt > 0].min() if len(dt) else 1
+	return int(pd.Timedelta(max_gap).value // step)
+
+
+def fill_gaps(
+	data,
+	method="linear",
+	max_gap=None,
+	columns=None,
+	missing=None,
+	inplace=False,
+	return_mask=False,
+):
+	"""Fill gaps in regularly spaced data
+
+	Fills the missing values (NaN or the values given by `missing`)
+	by linear interpolation, by the nearest valid value, or by the
+	last valid value (persistence), for example in the OMNI hourly data
+	from :func:`omnie_hourly()` or the F10.7 fluxes from :func:`sw_daily()`.
+	The selected columns are converted once to a column-major
+	float array, and each column is filled in place.
+
+	Parameters
+	----------
+	data: pandas.DataFrame, pandas.Series, or numpy.ndarray
+		The data, regularly spaced in time. Data frames and series
+		use their `pandas.DatetimeIndex` for the interpolation weights,
+		arrays are treated as equally spaced along the first axis.
+	method: str, optional, default "linear"
+		The fill method, "linear", "nearest", or "persistence".
+		"linear" and "nearest" fill only the gaps between valid values,
+		"persistence" also fills the values after the last valid value.
+	max_gap: `None`, int, or str, optional, default `None`
+		The longest gap to fill, as number of consecutive missing values
+		or a time span such as "6h", longer gaps are left missing.
+		`None` fills all gaps.
+	columns: `None` or list of str, optional, default `None`
+		The data frame columns to fill, `None` fills all columns.
+	missing: `None`, "omni", dict, or array_like, optional, default `None`
+		Additional missing values besides NaN, either a dict of column
+		names and fill values, "omni" for the OMNI fill values
+		(see :func:`omnie_mask_missing()`), or a boolean array
+		of the missing times, e.g. ``df["Q"] == 3`` for the days
+		without an F10.7 observation in :func:`sw_daily()`
+		(``df["Q"] == 4`` marks the CSSI-interpolated fluxes).
+	inplace: bool, optional, default False
+		Fill the values of `data` directly. For float arrays no copy
+		is made, data frame columns are replaced by the filled
+		(float) columns. Series are always returned as a new series.
+	return_mask: bool, optional, default False
+		Additionally return the mask of the filled values.
+
+	Returns
+	-------
+	filled: same type as `data`
+		The data with the gaps filled, integer columns are converted
+		to float. Missing values that are not filled are NaN.
+	mask: pandas.DataFrame, pandas.Series, or numpy.ndarray
+		The boolean mask of the filled values, if `return_mask` is set.
+
+	Raises ``ValueError`` for unknown methods.
+
+	Examples
+	--------
+	>>> import numpy as np
+	>>> fill_gaps(np.array([1., np.nan, np.nan, 4., np.nan]))
+	array([ 1.,  2.,  3.,  4., nan])
+	>>> fill_gaps(np.array([1., np.nan, np.nan, 4., np.nan]), method="persistence", max_gap=1)
+	array([ 1., nan, nan,  4.,  4.])
+	"""
+	if method not in ["linear", "nearest", "persistence"]:
+		raise ValueError("Unsupported method: {0}".format(method))
+	if isinstance(missing, str) and missing == "omni":
+		missing = _OMNI_MISSING
+	if isinstance(data, (pd.DataFrame, pd.Series)):
+		frame = data.to_frame() if isinstance(data, pd.Series) else data
+		columns = list(columns if columns is not None else frame.columns)
+		times = _index_ns(frame.index)
+		values = np.array(frame[columns].values, dtype=np.float64, order="F")
+	else:
+		values = np.asarray(data)
+		if not inplace or values.dtype.kind != "f":
+			values = values.astype(np.float64)
+		times = np.arange(values.shape[0], dtype=np.int64)
+	values2d = values.reshape(values.shape[0], -1)
+
+	if isinstance(missing, dict):
+		for _i, _c in enumerate(columns or []):
+			if missing.get(_c, None) is not None:
+				_v = values2d[:, _i]
+				_v[_v == missing[_c]] = np.nan
+	elif missing is not None:
+		values2d[np.asarray(missing, dtype=bool)] = np.nan
+
+	max_gap = _max_gap(max_gap, times)
+	mask = np.zeros(values2d.shape, dtype=bool)
+	for _j in range(values2d.shape[1]):
+		# the columns are views, filled in place
+		mask[:, _j] = _fill_column(values2d[:, _j], times, method, max_gap)
+
+	if not isinstance(data, (pd.DataFrame, pd.Series)):
+		ret = data if values is data else values2d.reshape(values.shape)
+		if return_mask:
+			return ret, mask.reshape(values.shape)
+		return ret
+	if isinstance(data, pd.Series):
+		ret = pd.Series(values2d[:, 0], index=data.index, name=data.name)
+		mask = pd.Series(mask[:, 0], index=data.index, name=data.name)
+	elif not inplace and columns == list(data.columns):
+		# the column-major array is used without copying
+		ret = pd.DataFrame(values2d, index=data.index, columns=columns, copy=False)
+		mask = pd.DataFrame(mask, index=data.index, columns=columns)
+	else:
+		ret = data if inplace else data.copy(deep=False)
+		for _i, _c in enumerate(columns):
+			ret[_c] = values2d[:, _i]
+		mask = pd.DataFrame(mask, index=data.index, columns=columns)
+	if return_mask:
+		return ret, mask
+	return ret
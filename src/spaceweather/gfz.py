@@ -17,16 +17,26 @@ For the file formats, see the `gfz_xxx_format.txt` files.
 """
 import os
 import logging
+from io import StringIO
 from warnings import warn
 
 import numpy as np
 import pandas as pd
-
-from .core import _assert_file_exists, _dl_file, _resource_filepath
+try:
+	from pandas.errors import EmptyDataError
+except ImportError:  # pandas < 0.20
+	from pandas.io.common import EmptyDataError
+
+from .arrays import AggregateIndex
+from .core import (
+	_assert_file_exists, _compression, _dl_file, _dl_range, _fetch, _merge_frames,
+	_open_text, _resource_filepath, _single_flight,
+)
+from .snapshot import _from_snapshot
 
 __all__ = [
-	"gfz_daily", "gfz_3h", "read_gfz",
-	"read_gfz_hp",
+	"gfz_daily", "gfz_3h", "read_gfz", "fetch_gfz", "fetch_gfz_hp",
+	"read_gfz_hp", "gfz_hp30", "gfz_hp60", "HpNowcastFollower",
 	"get_gfz_age", "update_gfz",
 	"update_gfz_hp30", "update_gfz_hp60",
 	"GFZ_PATH_ALL", "GFZ_PATH_30D",
@@ -75,8 +85,7 @@ def get_gfz_age(gfzpath, relative=True):
 		of `relative` above.
 		Raises ``IOError`` if the file is not found.
 	"""
-	_assert_file_exists(gfzpath)
-	with open(gfzpath) as fp:
+	with _open_text(gfzpath) as fp:
 		for line in fp:
 			# forward to last line
 			pass
@@ -97,6 +106,8 @@ def update_gfz(
 	given that the 30-day file is older than `min_age`,
 	or the combined (large) file is older than 30 days.
 	If the data is missing for some reason, a download will be attempted nonetheless.
+	Paths ending in ".gz", ".xz", or ".zst" store the files compressed,
+	the readers decompress them transparently.
 
 	All arguments are optional and changing them from the defaults should
 	neither be necessary nor is it recommended.
@@ -247,8 +258,14 @@ def read_gfz(gfzpath):
 			2: Kp and SN definitive
 	"""
 	_assert_file_exists(gfzpath)
+	with _open_text(gfzpath) as fp:
+		return _parse_gfz(fp)
+
+
+def _parse_gfz(fp):
+	# Parses the daily data from the lines of `fp`
 	gfz = np.genfromtxt(
-		gfzpath,
+		fp,
 		skip_header=3,
 		delimiter=[
 		#  yy mm dd dd dm br db kp kp kp kp kp kp kp kp
@@ -324,28 +341,64 @@ def read_gfz_hp(gfzhppath):
 			Reserved for future use, D = 0 for now.
 	"""
 	_assert_file_exists(gfzhppath)
-	hp = np.genfromtxt(
-		gfzhppath,
-		delimiter=[
-		#  yy mm dd hh hm ddd ddm hp ap  D
-			4, 3, 3, 5, 6, 12, 12, 7, 5, 2,
-		],
-		dtype=(
-			"i4,i4,i4,f4,f4,f4,f4,f4,i4,i4"
-		),
-		names=[
-			"year", "month", "day", "hh_h", "hh_m", "days", "days_m", "Hp", "ap", "D",
-		]
-	)
-	hp = hp[hp["year"] != -1]
-	ts = pd.to_datetime([
-		"{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}".format(
-			yy, mm, dd, int(np.floor(hh_m)), int(60 * (hh_m - np.floor(hh_m)))
+	return _parse_gfz_hp(gfzhppath)
+
+
+_HP_NAMES = [
+	"year", "month", "day", "hh_h", "hh_m", "days", "days_m", "Hp", "ap", "D",
+]
+_HP_DTYPE = "i4,i4,i4,f4,f4,f4,f4,f4,i4,i4"
+_HP_DTYPES = dict(zip(_HP_NAMES, _HP_DTYPE.split(",")))
+# columns required for the time index and for merging
+_HP_BASE = ["year", "month", "day", "hh_m", "D"]
+
+
+def _hp_times(year, month, day, hh_m):
+	# Middle times of the intervals as datetime64[ns],
+	# computed from the date and the hours (multiples of 15 min)
+	months = (np.asarray(year, dtype=np.int64) - 1970) * 12 + month - 1
+	days = months.astype("M8[M]").astype("M8[D]") + (np.asarray(day) - 1)
+	minutes = np.rint(np.asarray(hh_m, dtype=np.float64) * 60).astype(np.int64)
+	return days.astype("M8[ns]") + minutes.astype("m8[m]")
+
+
+def _parse_gfz_hp(fname, columns=None):
+	# Parses a Hp30/Hp60 file, a list of lines, or a (binary) file object,
+	# shared by `read_gfz_hp()`, `gfz_hp30()`, and the nowcast follower.
+	names = _HP_NAMES
+	if columns is not None:
+		names = [_n for _n in _HP_NAMES if _n in columns or _n in _HP_BASE]
+	if isinstance(fname, list):
+		fp = StringIO(u"".join(
+			_l if _l.endswith("\n") else _l + "\n" for _l in fname
+		))
+	elif hasattr(fname, "read"):
+		fp = fname
+	else:
+		fp = _open_text(fname, "rb")
+	try:
+		hp = pd.read_csv(
+			fp,
+			sep=r"\s+",
+			comment="#",
+			header=None,
+			names=_HP_NAMES,
+			usecols=names,
+			dtype=dict((_n, _HP_DTYPES[_n]) for _n in names),
 		)
-		for yy, mm, dd, hh_m in hp[["year", "month", "day", "hh_m"]]
-	])
-	hp_df = pd.DataFrame(hp, index=ts)
-	return hp_df
+	except EmptyDataError:
+		hp = pd.DataFrame(dict(
+			(_n, np.empty(0, dtype=_HP_DTYPES[_n])) for _n in names
+		))
+	finally:
+		if fp is not fname:
+			# file objects are closed by the caller
+			fp.close()
+	ts = _hp_times(
+		hp["year"].values, hp["month"].values, hp["day"].values, hp["hh_m"].values,
+	)
+	hp.index = pd.DatetimeIndex(ts)
+	return hp[names]
 
 
 def read_gfz_wdc(gfzpath):
@@ -395,26 +448,27 @@ def read_gfz_wdc(gfzpath):
 			The contracted scale for Cp with only 1 digit, from 0 to 9.
 	"""
 	_assert_file_exists(gfzpath)
-	gfz = np.genfromtxt(
-		gfzpath,
-		skip_header=3,
-		delimiter=[
-		#  yy mm dd br db kp kp kp kp kp kp kp kp kps
-			2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3,
-		#  ap ap ap ap ap ap ap ap Ap Cp C9
-			3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1,
-		],
-		dtype=(
-			"i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,"
-			"i4,i4,i4,i4,i4,i4,i4,i4,i4,f8,i4,"
-		),
-		names=[
-			"year", "month", "day", "bsrn", "rotd",
-			"Kp0", "Kp3", "Kp6", "Kp9", "Kp12", "Kp15", "Kp18", "Kp21", "Kpsum",
-			"Ap0", "Ap3", "Ap6", "Ap9", "Ap12", "Ap15", "Ap18", "Ap21", "Apavg",
-			"Cp", "C9",
-		]
-	)
+	with _open_text(gfzpath) as fp:
+		gfz = np.genfromtxt(
+			fp,
+			skip_header=3,
+			delimiter=[
+			#  yy mm dd br db kp kp kp kp kp kp kp kp kps
+				2, 2, 2, 4, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3,
+			#  ap ap ap ap ap ap ap ap Ap Cp C9
+				3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 1,
+			],
+			dtype=(
+				"i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,i4,"
+				"i4,i4,i4,i4,i4,i4,i4,i4,i4,f8,i4,"
+			),
+			names=[
+				"year", "month", "day", "bsrn", "rotd",
+				"Kp0", "Kp3", "Kp6", "Kp9", "Kp12", "Kp15", "Kp18", "Kp21", "Kpsum",
+				"Ap0", "Ap3", "Ap6", "Ap9", "Ap12", "Ap15", "Ap18", "Ap21", "Apavg",
+				"Cp", "C9",
+			]
+		)
 	gfz = gfz[gfz["year"] != -1]
 	ts = pd.to_datetime([
 		"{0:04d}-{1:02d}-{2:02d}".format(2000 + yy if yy < 32 else 1900 + yy, mm, dd)
@@ -428,6 +482,69 @@ def read_gfz_wdc(gfzpath):
 	return gfz_df
 
 
+def fetch_gfz(gfzpath=None, url=None):
+	"""Download and parse a GFZ index data file in one pass
+
+	Parses the data while downloading, the downloaded content is saved
+	to `gfzpath` at the same time, such that the data are available
+	as soon as the download finishes. The file is replaced only after
+	the complete download, and compressed as by :func:`update_gfz()`.
+	If the download fails, the local file is parsed instead.
+
+	Parameters
+	----------
+	gfzpath: `None` or str, optional, default `None`
+		The local file for the downloaded data.
+		`None` uses the package's default location of the 30-day file.
+	url: `None` or str, optional, default `None`
+		The url of the data file. `None` uses the 30-day file url.
+
+	Returns
+	-------
+	gfz_df: pandas.DataFrame
+		The parsed space weather data (daily values),
+		as returned by :func:`read_gfz()`.
+		Raises an ``IOError`` if the download fails and the file is not found.
+
+	See Also
+	--------
+	read_gfz
+	"""
+	return _fetch(gfzpath or GFZ_PATH_30D, url or GFZ_URL_30D, _parse_gfz)
+
+
+def fetch_gfz_hp(gfzhppath=None, url=None):
+	"""Download and parse a GFZ Hp30 or Hp60 index data file in one pass
+
+	Parses the data while downloading, the downloaded content is saved
+	to `gfzhppath` at the same time, such that the data are available
+	as soon as the download finishes. The file is replaced only after
+	the complete download, and compressed as by :func:`update_gfz()`.
+	If the download fails, the local file is parsed instead.
+
+	Parameters
+	----------
+	gfzhppath: `None` or str, optional, default `None`
+		The local file for the downloaded data.
+		`None` uses the package's default location of the Hp30 nowcast file.
+	url: `None` or str, optional, default `None`
+		The url of the data file. `None` uses the Hp30 nowcast file url.
+
+	Returns
+	-------
+	hp_df: pandas.DataFrame
+		The parsed Hp30 or Hp60 data, as returned by :func:`read_gfz_hp()`.
+		Raises an ``IOError`` if the download fails and the file is not found.
+
+	See Also
+	--------
+	read_gfz_hp
+	"""
+	return _fetch(
+		gfzhppath or HP30_PATH_30D, url or HP30_URL_30D, _parse_gfz_hp, text=False,
+	)
+
+
 # Common arguments for the public daily and 3h interfaces
 _GFZ_COMMON_PARAMS = """
 Parameters
@@ -471,6 +588,31 @@ def _doc_param(**sub):
 	return dec
 
 
+def _check_files(gfzpath_all, gfzpath_30d, update, update_interval, update_func):
+	# ensure that the file exists and is up to date
+	if (
+		not os.path.exists(gfzpath_all)
+		or not os.path.exists(gfzpath_30d)
+	):
+		warn("Could not find space weather data, trying to download.")
+		update_func(gfzpath_all=gfzpath_all, gfzpath_30d=gfzpath_30d)
+
+	if (
+		get_gfz_age(gfzpath_all) > pd.Timedelta("30days")
+		or get_gfz_age(gfzpath_30d) > pd.Timedelta(update_interval)
+	):
+		if update:
+			update_func(gfzpath_all=gfzpath_all, gfzpath_30d=gfzpath_30d)
+		else:
+			warn(
+				"Local data files are older than {0}, pass `update=True` or "
+				"run `gfz.update_gfz()` manually if you need newer data.".format(
+					update_interval
+				)
+			)
+
+
+@_single_flight
 @_doc_param(params=_GFZ_COMMON_PARAMS)
 def gfz_daily(
 	gfzpath_all=None,
@@ -478,14 +620,23 @@ def gfz_daily(
 	update=False,
 	update_interval="10days",
 	gfz_format=None,
+	f107_avg=False,
 ):
 	"""Combined daily Ap, Kp, and f10.7 index values
 
 	Combines the "historic" and last-30-day data into one dataframe.
+	For overlapping times, definitive values (flag "D") are preferred,
+	and the last-30-day data otherwise.
+	Concurrent calls with identical arguments, e.g. from the threads of
+	a web service, are thread-safe and share a single parse.
 
 	All arguments are optional and changing them from the defaults should not
 	be required neither should it be necessary nor is it recommended.
-	{params}
+	{params}f107_avg: bool, optional, default False
+	Add the 81-day and 27-day (Bartels rotation) averages of the
+	observed and adjusted F10.7 fluxes, only for the standard GFZ format,
+	raises ``ValueError`` for the "wdc", "hp30", and "hp60" formats.
+
 	Returns
 	-------
 	gfz_df: pandas.DataFrame
@@ -495,6 +646,20 @@ def gfz_daily(
 		To convert to a timezone-aware index, use
 		:meth:`pandas.DataFrame.tz_localize()`: ``gfz_df.tz_localize("utc")``.
 
+		With `f107_avg` set, the dataframe contains the additional columns:
+
+		"f107_81ctr_obs", "f107_81ctr_adj":
+			Centred 81-day average of the observed and adjusted F10.7.
+		"f107_81lst_obs", "f107_81lst_adj":
+			Last 81-day average (including the current day)
+			of the observed and adjusted F10.7.
+		"f107_27bsrn_obs", "f107_27bsrn_adj":
+			Average of the observed and adjusted F10.7 over the 27-day
+			Bartels solar rotation of the day.
+
+		Missing F10.7 values are excluded from the averages,
+		windows that extend beyond the data use the available days only.
+
 	See Also
 	--------
 	gfz_3h, read_gfz
@@ -503,33 +668,52 @@ def gfz_daily(
 	gfzpath_30d = gfzpath_30d or GFZ_PATH_30D
 	gfz_format = gfz_format or "gfz"
 	parse_func, update_func = _PARSERS[gfz_format.lower()]
-	# ensure that the file exists and is up to date
-	if (
-		not os.path.exists(gfzpath_all)
-		or not os.path.exists(gfzpath_30d)
-	):
-		warn("Could not find space weather data, trying to download.")
-		update_func(gfzpath_all=gfzpath_all, gfzpath_30d=gfzpath_30d)
-
-	if (
-		get_gfz_age(gfzpath_all) > pd.Timedelta("30days")
-		or get_gfz_age(gfzpath_30d) > pd.Timedelta(update_interval)
-	):
-		if update:
-			update_func(gfzpath_all=gfzpath_all, gfzpath_30d=gfzpath_30d)
-		else:
-			warn(
-				"Local data files are older than {0}, pass `update=True` or "
-				"run `gfz.update_gfz()` manually if you need newer data.".format(
-					update_interval
-				)
-			)
-
-	df_all = parse_func(gfzpath_all)
-	df_30d = parse_func(gfzpath_30d)
-	return pd.concat([df_all, df_30d[df_all.index[-1]:].iloc[1:]])
-
-
+	# the Kp, Ap, and F10.7 files, not "wdc", "hp30", or "hp60"
+	standard = _PARSERS[gfz_format.lower()] == _PARSERS["gfz"]
+	if f107_avg and not standard:
+		raise ValueError(
+			"The F10.7 averages are only available for the standard GFZ format, "
+			"not for the '{0}' format.".format(gfz_format)
+		)
+	df = None
+	# snapshots contain the data of the standard format files
+	if not update and standard:
+		df = _from_snapshot("gfz", [gfzpath_all, gfzpath_30d])
+	if df is None:
+		_check_files(gfzpath_all, gfzpath_30d, update, update_interval, update_func)
+		df_all = parse_func(gfzpath_all)
+		df_30d = parse_func(gfzpath_30d)
+		# definitive values (flag "D") before preliminary values
+		df = _merge_frames(df_all, df_30d, rank="D")
+	if f107_avg:
+		df = _add_f107_avg(df)
+	return df
+
+
+def _add_f107_avg(df):
+	# 81-day and Bartels rotation averages of F10.7,
+	# the windows are evaluated using cumulative sums.
+	f107ns = ["f107_obs", "f107_adj"]
+	f107 = df[f107ns].where(df[f107ns] >= 0)
+	agg = AggregateIndex(f107, freq="1D", minmax=False)
+	ts = df.index
+	ctr = agg.mean(ts - pd.Timedelta("40D"), ts + pd.Timedelta("40D"))
+	lst = agg.mean(ts - pd.Timedelta("80D"), ts)
+	# Bartels rotation averages by bin counting
+	bsrn = df["bsrn"].values - df["bsrn"].values.min()
+	valid = np.isfinite(f107.values)
+	df = df.copy()
+	for i, _n in enumerate(["obs", "adj"]):
+		df["f107_81ctr_" + _n] = ctr[:, i]
+		df["f107_81lst_" + _n] = lst[:, i]
+		_sum = np.bincount(bsrn, weights=np.where(valid[:, i], f107.values[:, i], 0.))
+		_cnt = np.bincount(bsrn, weights=valid[:, i])
+		with np.errstate(invalid="ignore", divide="ignore"):
+			df["f107_27bsrn_" + _n] = (_sum / _cnt)[bsrn]
+	return df
+
+
+@_single_flight
 @_doc_param(params=_GFZ_COMMON_PARAMS)
 def gfz_3h(*args, **kwargs):
 	"""3h values of Ap and Kp
@@ -568,3 +752,340 @@ def gfz_3h(*args, **kwargs):
 	gfz_kp = pd.concat(map(ret.__getitem__, kpns))
 	df = pd.DataFrame({"Ap": gfz_ap, "Kp": gfz_kp})
 	return df.reindex(df.index.sort_values())
+
+
+def _read_hp_window(fname, step, start=None, end=None, columns=None):
+	# Reads the intervals with middle times in [start, end] from a Hp30/Hp60
+	# file. The data lines have a fixed width and a fixed spacing, so only
+	# the needed part of the file is read, the file is parsed completely
+	# if the layout does not match.
+	_assert_file_exists(fname)
+	if start is None and end is None:
+		return _parse_gfz_hp(fname, columns=columns)
+	if _compression(fname) is not None:
+		# no random access into compressed files
+		return _slice_times(_parse_gfz_hp(fname, columns=columns), start, end)
+	with open(fname, "rb") as fp:
+		hlen = 0
+		line = fp.readline()
+		while line.startswith(b"#"):
+			hlen += len(line)
+			line = fp.readline()
+		llen = len(line)
+		size = os.fstat(fp.fileno()).st_size
+		if llen == 0 or not line.endswith(b"\n") or (size - hlen) % llen:
+			return _slice_times(_parse_gfz_hp(fname, columns=columns), start, end)
+		t_first = _parse_gfz_hp([line.decode()]).index[0]
+		nlines = (size - hlen) // llen
+		i0, i1 = 0, nlines
+		if start is not None:
+			i0 = min(max(0, -((t_first - start) // step)), nlines)
+		if end is not None:
+			i1 = min(max(i0, (end - t_first) // step + 1), nlines)
+		fp.seek(hlen + i0 * llen)
+		content = fp.read((i1 - i0) * llen).decode()
+	hp = _parse_gfz_hp(content.splitlines(True), columns=columns)
+	if len(hp) != i1 - i0 or (
+		len(hp) and hp.index[0] != t_first + i0 * step
+	):
+		# not regularly spaced
+		return _slice_times(_parse_gfz_hp(fname, columns=columns), start, end)
+	return hp
+
+
+def _slice_times(df, start=None, end=None):
+	# Rows with times in [start, end], by position for sorted times
+	times = df.index.values
+	i0 = 0 if start is None else np.searchsorted(times, np.datetime64(start), "left")
+	i1 = len(df) if end is None else np.searchsorted(times, np.datetime64(end), "right")
+	return df.iloc[i0:i1]
+
+
+_HP_PARAMS = """
+	start: `None` or str or datetime, optional, default `None`
+		The first time to return (interval middle times), `None` for all.
+	end: `None` or str or datetime, optional, default `None`
+		The last time to return (interval middle times, included),
+		`None` for all. Dates without a time refer to 00:00.
+	columns: `None` or list of str, optional, default `None`
+		The columns to return, e.g. ``["Hp", "ap"]``, `None` returns all.
+	raw: bool, optional, default False
+		Return a dict of numpy arrays with the times (`numpy.datetime64`)
+		as "time" instead of a `pandas.DataFrame`.
+	gfzpath_all: str, optional, default depending on package install location
+		Filename for the complete series, defaults to the package data location.
+	gfzpath_30d: str, optional, default depending on package install location
+		Filename for the nowcast data, defaults to the package data location.
+	update: bool, optional, default False
+		Attempt to update the local data if it is older than `update_interval`.
+	update_interval: str, optional, default "1days"
+		The time after which the data are considered "old".
+		By default, no automatic re-download is initiated, set `update` to true.
+		The online data is updated every 30 minutes, thus setting this value to
+		a shorter time is not needed and not recommended.
+"""
+
+
+@_single_flight
+def _gfz_hp(
+	hp_format, step, path_all, path_30d,
+	start, end, columns, raw,
+	gfzpath_all, gfzpath_30d, update, update_interval,
+):
+	gfzpath_all = gfzpath_all or path_all
+	gfzpath_30d = gfzpath_30d or path_30d
+	step = pd.Timedelta(step)
+	start = None if start is None else pd.Timestamp(start)
+	end = None if end is None else pd.Timestamp(end)
+	df = None
+	if not update:
+		df = _from_snapshot(hp_format, [gfzpath_all, gfzpath_30d])
+	if df is not None:
+		df = _slice_times(df, start, end)
+	else:
+		_check_files(
+			gfzpath_all, gfzpath_30d, update, update_interval,
+			_PARSERS[hp_format][1],
+		)
+		df_all = _read_hp_window(gfzpath_all, step, start, end, columns=columns)
+		df_30d = _read_hp_window(gfzpath_30d, step, start, end, columns=columns)
+		# definitive values (flag "D") before preliminary values
+		df = _merge_frames(df_all, df_30d, rank="D")
+	if columns is not None:
+		df = df[list(columns)]
+	if raw:
+		ret = dict((_c, df[_c].values) for _c in df.columns)
+		ret["time"] = df.index.values
+		return ret
+	return df
+
+
+@_doc_param(params=_HP_PARAMS)
+def gfz_hp30(
+	start=None,
+	end=None,
+	columns=None,
+	raw=False,
+	gfzpath_all=None,
+	gfzpath_30d=None,
+	update=False,
+	update_interval="1days",
+):
+	"""Combined Hp30 and ap30 index values
+
+	Combines the complete series and the nowcast Hp30 data,
+	preferring definitive values for overlapping intervals.
+	With `start` or `end` set, only the needed lines of the
+	(fixed-width) files are read and parsed.
+	Identical concurrent calls are thread-safe and share a single read.
+
+	Parameters
+	----------{params}
+	Returns
+	-------
+	hp_df: pandas.DataFrame or dict
+		The Hp30 data, see :func:`read_gfz_hp()` for the columns,
+		missing values are marked by -1.
+		Raises ``IOError`` if the data files cannot be found.
+		The index (middle times of the intervals) is returned timezone-naive
+		but contains UTC timestamps.
+
+	See Also
+	--------
+	gfz_hp60, read_gfz_hp
+	"""
+	return _gfz_hp(
+		"hp30", "30min", HP30_PATH_ALL, HP30_PATH_30D,
+		start, end, columns, raw,
+		gfzpath_all, gfzpath_30d, update, update_interval,
+	)
+
+
+@_doc_param(params=_HP_PARAMS)
+def gfz_hp60(
+	start=None,
+	end=None,
+	columns=None,
+	raw=False,
+	gfzpath_all=None,
+	gfzpath_30d=None,
+	update=False,
+	update_interval="1days",
+):
+	"""Combined Hp60 and ap60 index values
+
+	Combines the complete series and the nowcast Hp60 data,
+	see :func:`gfz_hp30()`.
+
+	Parameters
+	----------{params}
+	Returns
+	-------
+	hp_df: pandas.DataFrame or dict
+		The Hp60 data, see :func:`read_gfz_hp()` for the columns,
+		missing values are marked by -1.
+		Raises ``IOError`` if the data files cannot be found.
+		The index (middle times of the intervals) is returned timezone-naive
+		but contains UTC timestamps.
+
+	See Also
+	--------
+	gfz_hp30, read_gfz_hp
+	"""
+	return _gfz_hp(
+		"hp60", "60min", HP60_PATH_ALL, HP60_PATH_30D,
+		start, end, columns, raw,
+		gfzpath_all, gfzpath_30d, update, update_interval,
+	)
+
+
+class HpNowcastFollower(object):
+	"""Tail follower for the GFZ Hp30 and Hp60 nowcast files
+
+	Polls the online Hp30 or Hp60 nowcast file and fetches only the
+	lines after the last valid (not missing) interval using HTTP range
+	requests. The nowcast files are fixed-width and regularly spaced,
+	so the byte offset of the first new interval is computed from the
+	file's header length and the time of its first data line.
+	This keeps working when the 30-day window moves forward and when
+	the trailing placeholder lines (-1) are replaced by actual values.
+
+	The newly parsed intervals are appended to the in-memory
+	:class:`pandas.DataFrame` in :attr:`df` and are also available by
+	iterating over the follower, either synchronously with ``for row in
+	follower`` or asynchronously with ``async for row in follower``.
+	Iteration never ends on its own, the follower sleeps for `interval`
+	between polls that did not yield new data.
+
+	Parameters
+	----------
+	hp_format: str, optional, default "hp30"
+		Which index to follow, "hp30" or "hp60".
+	url: `None` or str, optional, default `None`
+		The url of the nowcast data file.
+		`None` uses the default url for `hp_format`.
+	df: `None` or pandas.DataFrame, optional, default `None`
+		Already available data, e.g. from :func:`read_gfz_hp()`,
+		only intervals after the last valid one will be fetched.
+	interval: str, optional, default "5min"
+		Time to wait between polls when iterating.
+	head_bytes: int, optional, default 4096
+		Number of bytes to fetch to determine the header length and
+		the first interval of the remote file.
+
+	Attributes
+	----------
+	df: pandas.DataFrame
+		The valid intervals retrieved so far, in the same format as
+		returned by :func:`read_gfz_hp()`.
+
+	See Also
+	--------
+	read_gfz_hp
+	"""
+	_URLS = {"hp30": HP30_URL_30D, "hp60": HP60_URL_30D}
+	_STEPS = {"hp30": "30min", "hp60": "60min"}
+
+	def __init__(
+		self,
+		hp_format="hp30",
+		url=None,
+		df=None,
+		interval="5min",
+		head_bytes=4096,
+	):
+		hp_format = hp_format.lower()
+		self.url = url or self._URLS[hp_format]
+		self.step = pd.Timedelta(self._STEPS[hp_format])
+		self.interval = pd.Timedelta(interval)
+		self.head_bytes = head_bytes
+		if df is None:
+			df = _parse_gfz_hp([])
+		self.df = df[df["Hp"] >= 0]
+		self._pending = []
+
+	def _next_time(self):
+		# Middle time of the first interval that is not known yet
+		if len(self.df) == 0:
+			return None
+		return self.df.index[-1] + self.step
+
+	def _head(self):
+		# Header length in bytes, line length, and time of the first line
+		head = _dl_range(self.url, 0, self.head_bytes - 1)
+		if not head:
+			return None
+		hlen = 0
+		for line in head.splitlines(True):
+			if not line.startswith(b"#"):
+				if not line.endswith(b"\n"):
+					return None
+				first = _parse_gfz_hp([line.decode()])
+				return hlen, len(line), first.index[0]
+			hlen += len(line)
+		return None
+
+	def _fetch(self, offset):
+		content = _dl_range(self.url, offset) or b""
+		# only complete lines
+		content = content[:content.rfind(b"\n") + 1]
+		lines = [
+			_l for _l in content.decode().splitlines()
+			if _l.strip() and not _l.startswith("#")
+		]
+		return _parse_gfz_hp(lines)
+
+	def poll(self):
+		"""Fetch and parse new intervals
+
+		Returns
+		-------
+		new_df: pandas.DataFrame
+			The newly retrieved valid intervals, may be empty.
+		"""
+		t_next = self._next_time()
+		offset = 0
+		head = self._head() if t_next is not None else None
+		if head is not None:
+			hlen, llen, t_first = head
+			# starting at the last known interval, such that idle polls
+			# still return one line to check the offset
+			nskip = max(0, (t_next - t_first) // self.step - 1)
+			t_check = t_first + nskip * self.step
+			offset = hlen + nskip * llen
+		new_df = self._fetch(offset)
+		if offset > 0 and (len(new_df) == 0 or new_df.index[0] != t_check):
+			# the file layout changed or the file was truncated,
+			# fall back to reading all of it
+			new_df = self._fetch(0)
+		new_df = new_df[new_df["Hp"] >= 0]
+		if t_next is not None:
+			new_df = new_df[new_df.index >= t_next]
+		if len(new_df):
+			self.df = pd.concat([self.df, new_df]) if len(self.df) else new_df
+		return new_df
+
+	def __iter__(self):
+		return self
+
+	def __next__(self):
+		from time import sleep
+		polled = False
+		while not self._pending:
+			if polled:
+				sleep(self.interval.total_seconds())
+			self._pending.extend(self.poll().itertuples())
+			polled = True
+		return self._pending.pop(0)
+
+	next = __next__
+
+	def __aiter__(self):
+		return self
+
+	def __anext__(self):
+		# Runs the blocking poll-and-sleep in the default executor
+		import asyncio
+		# `get_running_loop()` is python 3.7+
+		loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+		return loop.run_in_executor(None, self.__next__)
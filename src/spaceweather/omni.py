@@ -14,6 +14,7 @@ Omni2 [#]_ space weather data interface for python.
 """
 import os
 import logging
+import re
 from warnings import warn
 
 from posixpath import join as urljoin
@@ -21,12 +22,23 @@ from posixpath import join as urljoin
 import numpy as np
 import pandas as pd
 
-from .core import _assert_file_exists, _dl_file, _resource_filepath
+from .core import (
+	_COMPRESSION_EXT,
+	_assert_file_exists, _dl_file, _fetch, _open_text, _replace,
+	_resource_filepath, _single_flight, _split_compression,
+)
+from .snapshot import _from_snapshot
 
 __all__ = [
 	"cache_omnie",
+	"cache_omni_hro",
+	"fetch_omnie",
+	"omni_hro_range",
 	"omnie_hourly",
 	"omnie_mask_missing",
+	"omnie_query",
+	"omnie_to_parquet",
+	"read_omni_hro",
 	"read_omnie",
 ]
 
@@ -35,6 +47,15 @@ OMNI_PREFIX, OMNI_EXT = "omni2", "dat"
 OMNI_SUBDIR = "omni_extended"
 LOCAL_PATH = _resource_filepath(OMNI_SUBDIR)
 
+OMNI_HRO_URL_BASE = "https://spdf.gsfc.nasa.gov/pub/data/omni/high_res_omni"
+OMNI_HRO_PREFIX = {"1min": "omni_min", "5min": "omni_5min"}
+OMNI_HRO_EXT = "asc"
+OMNI_HRO_SUBDIR = "omni_hro"
+HRO_LOCAL_PATH = _resource_filepath(OMNI_HRO_SUBDIR)
+
+OMNI_PARQUET_SUBDIR = "omni_parquet"
+PARQUET_PATH = _resource_filepath(OMNI_PARQUET_SUBDIR)
+
 _OMNI_MISSING = {
 	"year": None,
 	"doy": None,
@@ -103,6 +124,37 @@ def _doc_param(**sub):
 	return dec
 
 
+def _omnie_file(year, prefix=None, ext=None, local_path=None):
+	# The local file of `year` and its extension, `ext` or, if only
+	# compressed files exist, `ext` with the compression suffix.
+	prefix = prefix or OMNI_PREFIX
+	ext = ext or OMNI_EXT
+	local_path = local_path or LOCAL_PATH
+	path = os.path.join(local_path, "{0}_{1:04d}.{2}".format(prefix, year, ext))
+	if not os.path.exists(path):
+		for suffix in sorted(_COMPRESSION_EXT):
+			if os.path.exists(path + suffix):
+				return path + suffix, ext + suffix
+	return path, ext
+
+
+def _omnie_years(prefix=None, ext=None, local_path=None):
+	# The years of the local files, also the compressed ones (e.g. "dat.gz")
+	prefix = prefix or OMNI_PREFIX
+	ext = ext or OMNI_EXT
+	local_path = local_path or LOCAL_PATH
+	pattern = re.compile(r"^{0}_(\d{{4}})\.{1}({2})?$".format(
+		re.escape(prefix), re.escape(ext),
+		"|".join(map(re.escape, sorted(_COMPRESSION_EXT))),
+	))
+	if not os.path.isdir(local_path):
+		return []
+	return sorted(set(
+		int(_m.group(1)) for _m in map(pattern.match, os.listdir(local_path))
+		if _m
+	))
+
+
 @_doc_param(prefix=OMNI_PREFIX, ext=OMNI_EXT)
 def cache_omnie(
 	year,
@@ -126,7 +178,8 @@ def cache_omnie(
 		`None` defaults to '{prefix}'.
 	ext: `None` or str, optional, default `None`
 		File extension for constructing the file name as <prefix>_year.<ext>.
-		`None` defaults to '{ext}'.
+		`None` defaults to '{ext}'. Downloaded files are stored compressed
+		with the extensions "dat.gz", "dat.xz", or "dat.zst".
 	local_path: `None` or str, optional, default `None`
 		Path to the locally stored data yearly files, defaults to the
 		data location within the package.
@@ -151,11 +204,72 @@ def cache_omnie(
 
 	omnie_file = os.path.join(local_path, basename)
 	if not os.path.exists(omnie_file):
-		url = urljoin(url_base, basename)
+		# compressed local files, e.g. with `ext="dat.gz"`
+		url = urljoin(url_base, _split_compression(basename)[0])
 		logging.info("%s not found, downloading from %s.", omnie_file, url)
 		_dl_file(omnie_file, url)
 
 
+@_doc_param(prefix=OMNI_PREFIX, ext=OMNI_EXT)
+def fetch_omnie(
+	year,
+	prefix=None,
+	ext=None,
+	local_path=None,
+	url_base=None,
+):
+	"""Download and parse an OMNI2 yearly file in one pass
+
+	Parses the OMNI2 (extended) data while downloading, the downloaded
+	content is saved to the local cache at the same time, such that the
+	data are available as soon as the download finishes.
+	The file is replaced only after the complete download.
+	If the download fails, the locally cached file is parsed instead.
+
+	Parameters
+	----------
+	year: int
+		Year of the data.
+	prefix: `None` or str, optional, default `None`
+		File prefix for constructing the file name as <prefix>_year.<ext>.
+		`None` defaults to '{prefix}'.
+	ext: `None` or str, optional, default `None`
+		File extension for constructing the file name as <prefix>_year.<ext>.
+		`None` defaults to '{ext}'. Downloaded files are stored compressed
+		with the extensions "dat.gz", "dat.xz", or "dat.zst".
+	local_path: `None` or str, optional, default `None`
+		Path to the locally stored data yearly files, defaults to the
+		data location within the package.
+		`None` uses the package's default file location.
+	url_base: `None` or str, optional, default `None`
+		URL for the directory that contains the yearly files.
+		`None` uses the default base url.
+
+	Returns
+	-------
+	omnie_df: pandas.DataFrame
+		The parsed OMNI2 data, as returned by :func:`read_omnie()`.
+		Raises an ``IOError`` if the download fails and the file is not found.
+
+	See Also
+	--------
+	read_omnie
+	"""
+	prefix = prefix or OMNI_PREFIX
+	ext = ext or OMNI_EXT
+	local_path = local_path or LOCAL_PATH
+	url_base = url_base or OMNI_URL_BASE
+
+	basename = "{0}_{1:04d}.{2}".format(prefix, year, ext)
+
+	if not os.path.exists(local_path):
+		os.makedirs(local_path)
+
+	omnie_file = os.path.join(local_path, basename)
+	url = urljoin(url_base, _split_compression(basename)[0])
+	return _fetch(omnie_file, url, _parse_omnie)
+
+
 def omnie_mask_missing(df):
 	"""Mask missing values with NaN
 
@@ -323,13 +437,19 @@ def read_omnie(omnie_file):
 			Proton QI
 	"""
 	_assert_file_exists(omnie_file)
+	with _open_text(omnie_file) as fp:
+		return _parse_omnie(fp)
+
+
+def _parse_omnie(fp):
+	# Parses the hourly data from the lines of `fp`
 	# FORMAT(
 	#     2I4,I3,I5,2I3,2I4,14F6.1,F9.0,F6.1,F6.0,2F6.1,F6.3,F6.2,
 	#     F9.0,F6.1,F6.0,2F6.1,F6.3,2F7.2,F6.1,I3,I4,I6,I5,F10.2,
 	#     5F9.2,I3,I4,2F6.1,2I6,F5.1,F9.6,F7.4
 	# )
 	sw = np.genfromtxt(
-		omnie_file,
+		fp,
 		skip_header=0,
 		delimiter=[
 		#   1  2  3  4  5  6  7  8  9 10 11 12 13 14 15 16 17 18 19 20
@@ -375,6 +495,7 @@ def read_omnie(omnie_file):
 	return sw_df
 
 
+@_single_flight
 @_doc_param(prefix=OMNI_PREFIX, ext=OMNI_EXT)
 def omnie_hourly(
 	year,
@@ -390,6 +511,7 @@ def omnie_hourly(
 	from the locally cached data.
 	Use `local_path` to set a custom location if you
 	have the omni data already available.
+	Threads requesting the same year at the same time share one parse.
 
 	Parameters
 	----------
@@ -400,7 +522,8 @@ def omnie_hourly(
 		`None` defaults to '{prefix}'.
 	ext: `None` or str, optional, default `None`
 		File extension for constructing the file name as <prefix>_year.<ext>.
-		`None` defaults to '{ext}'.
+		`None` defaults to '{ext}'. Downloaded files are stored compressed
+		with the extensions "dat.gz", "dat.xz", or "dat.zst".
 	local_path: `None` or str, optional, default `None`
 		Path to the locally stored data yearly files, defaults to the
 		data location within the package.
@@ -433,6 +556,10 @@ def omnie_hourly(
 	basename = "{0}_{1:04d}.{2}".format(prefix, year, ext)
 	omnie_file = os.path.join(local_path, basename)
 
+	df = _from_snapshot("omni_{0:04d}".format(year), [omnie_file])
+	if df is not None:
+		return df
+
 	# ensure that the file exists
 	if not os.path.exists(omnie_file):
 		warn("Could not find OMNI2 data {0}.".format(omnie_file))
@@ -449,3 +576,610 @@ def omnie_hourly(
 			)
 
 	return read_omnie(omnie_file)
+
+
+# HRO columns and fill values (the largest value of the field format),
+# https://spdf.gsfc.nasa.gov/pub/data/omni/high_res_omni/hroformat.txt
+_OMNI_HRO_COLUMNS = [
+	("year", None),
+	("doy", None),
+	("hour", None),
+	("minute", None),
+	("id_imf", 99),
+	("id_sw", 99),
+	("n_imf", 999),
+	("n_plasma", 999),
+	("interp", 999),
+	("timeshift", 999999),
+	("sigma_timeshift", 999999),
+	("sigma_phase", 99.99),
+	("dt_obs", 999999),
+	("B_mag", 9999.99),
+	("B_x", 9999.99),
+	("B_y_GSE", 9999.99),
+	("B_z_GSE", 9999.99),
+	("B_y_GSM", 9999.99),
+	("B_z_GSM", 9999.99),
+	("sigma_B_mag", 9999.99),
+	("sigma_B_vec", 9999.99),
+	("v_plasma", 99999.9),
+	("v_x", 99999.9),
+	("v_y", 99999.9),
+	("v_z", 99999.9),
+	("n_p", 999.99),
+	("T_p", 9999999.),
+	("p_flow", 99.99),
+	("E", 999.99),
+	("beta_plasma", 999.99),
+	("mach", 999.9),
+	("x_sc", 9999.99),
+	("y_sc", 9999.99),
+	("z_sc", 9999.99),
+	("x_bsn", 9999.99),
+	("y_bsn", 9999.99),
+	("z_bsn", 9999.99),
+	("AE", 99999),
+	("AL", 99999),
+	("AU", 99999),
+	("SYM_D", 99999),
+	("SYM_H", 99999),
+	("ASY_D", 99999),
+	("ASY_H", 99999),
+	("PC", 999.99),
+	("mach_mag", 99.9),
+]
+# additional columns of the 5-min files
+_OMNI_HRO_COLUMNS_5MIN = [
+	("p_10MeV", 99999.99),
+	("p_30MeV", 99999.99),
+	("p_60MeV", 99999.99),
+]
+_OMNI_HRO_TIME = ["year", "doy", "hour", "minute"]
+
+
+def _hro_basename(year, res):
+	return "{0}{1:04d}.{2}".format(OMNI_HRO_PREFIX[res], year, OMNI_HRO_EXT)
+
+
+def cache_omni_hro(
+	year,
+	res="1min",
+	local_path=None,
+	url_base=None,
+):
+	"""Download OMNI high-resolution data to local cache
+
+	Downloads the OMNI high-resolution (HRO) 1-min or 5-min data file
+	from [#]_ to the local location.
+
+	.. [#] https://spdf.gsfc.nasa.gov/pub/data/omni/high_res_omni/
+
+	Parameters
+	----------
+	year: int
+		Year of the data.
+	res: str, optional, default "1min"
+		The time resolution, "1min" or "5min".
+	local_path: `None` or str, optional, default `None`
+		Path to the locally stored data yearly files, defaults to the
+		data location within the package.
+		`None` uses the package's default file location.
+	url_base: `None` or str, optional, default `None`
+		URL for the directory that contains the yearly files.
+		`None` uses the default base url.
+
+	Returns
+	-------
+	Nothing.
+	"""
+	local_path = local_path or HRO_LOCAL_PATH
+	url_base = url_base or OMNI_HRO_URL_BASE
+
+	basename = _hro_basename(year, res)
+
+	if not os.path.exists(local_path):
+		os.makedirs(local_path)
+
+	omni_file = os.path.join(local_path, basename)
+	if not os.path.exists(omni_file):
+		url = urljoin(url_base, basename)
+		logging.info("%s not found, downloading from %s.", omni_file, url)
+		_dl_file(omni_file, url)
+
+
+def _hro_columns(omni_file):
+	# The 5-min files have three additional columns, detected from
+	# the number of fields in the first line.
+	with _open_text(omni_file) as fp:
+		nfields = len(fp.readline().split())
+	columns = list(_OMNI_HRO_COLUMNS)
+	if nfields > len(columns):
+		columns += _OMNI_HRO_COLUMNS_5MIN
+	return columns
+
+
+def _hro_chunks(
+	omni_file,
+	columns=None,
+	mask_missing=True,
+	start=None,
+	end=None,
+	chunksize=100000,
+):
+	# Generator of the parsed (and masked) chunks of an HRO file
+	_assert_file_exists(omni_file)
+	all_columns = _hro_columns(omni_file)
+	names = [_n for _n, _ in all_columns]
+	usecols = _OMNI_HRO_TIME + [
+		_n for _n in (columns if columns is not None else names)
+		if _n not in _OMNI_HRO_TIME
+	]
+	na_values = {}
+	if mask_missing:
+		na_values = dict(
+			(_n, [_m]) for _n, _m in all_columns
+			if _m is not None and _n in usecols
+		)
+	with _open_text(omni_file, "rb") as fp:
+		reader = pd.read_csv(
+			fp,
+			sep=r"\s+",
+			header=None,
+			names=names,
+			usecols=usecols,
+			na_values=na_values,
+			keep_default_na=False,
+			dtype=dict((_n, np.int32) for _n in _OMNI_HRO_TIME),
+			chunksize=chunksize,
+		)
+		for chunk in reader:
+			days = (chunk["year"].values - 1970).astype("M8[Y]").astype("M8[D]")
+			days = days + (chunk["doy"].values - 1)
+			minutes = chunk["hour"].values * 60 + chunk["minute"].values
+			chunk.index = pd.DatetimeIndex(
+				days.astype("M8[ns]") + minutes.astype("m8[m]")
+			)
+			if start is not None:
+				chunk = chunk[chunk.index >= start]
+			if end is not None:
+				if len(chunk) and chunk.index[0] > end:
+					break
+				chunk = chunk[chunk.index <= end]
+			if len(chunk):
+				yield chunk[usecols]
+
+
+def _hro_read(chunks, freq=None, how="mean", src_freq=None):
+	# Combines the chunks, downsampling each of them to `freq`.
+	# The rows after the last complete `freq` interval of a chunk
+	# are carried over to the next chunk.
+	from .resample import resample
+
+	parts = []
+	carry = None
+	for chunk in chunks:
+		if freq is None:
+			parts.append(chunk)
+			continue
+		# the time columns are replaced by the resampled index
+		chunk = chunk.drop(columns=_OMNI_HRO_TIME)
+		if carry is not None:
+			chunk = pd.concat([carry, chunk])
+		cutoff = chunk.index[-1].floor(freq)
+		carry = chunk[chunk.index >= cutoff]
+		done = chunk[chunk.index < cutoff]
+		if len(done):
+			parts.append(resample(done, freq, how=how, src_freq=src_freq))
+	if freq is not None and carry is not None and len(carry):
+		parts.append(resample(carry, freq, how=how, src_freq=src_freq))
+	if not parts:
+		return pd.DataFrame()
+	return pd.concat(parts)
+
+
+def read_omni_hro(
+	omni_file,
+	columns=None,
+	mask_missing=True,
+	freq=None,
+	how="mean",
+	chunksize=100000,
+):
+	"""Read and parse OMNI high-resolution (1-min or 5-min) files [#]_
+
+	Parses the OMNI high-resolution (HRO) yearly ASCII files,
+	available at [#]_, into a :class:`pandas.DataFrame`.
+	The files are parsed in chunks of `chunksize` lines, and each chunk
+	is masked and optionally downsampled before the next one is parsed,
+	which keeps the memory use bounded by the chunk size and the result.
+
+	.. [#] https://omniweb.gsfc.nasa.gov/html/HROdocum.html
+	.. [#] https://spdf.gsfc.nasa.gov/pub/data/omni/high_res_omni/
+
+	Parameters
+	----------
+	omni_file: str
+		File to parse, absolute path or relative to the current dir.
+	columns: `None` or list of str, optional, default `None`
+		The columns to parse, `None` parses all columns.
+		The time columns ("year", "doy", "hour", "minute") are always included.
+	mask_missing: bool, optional, default True
+		Replace the fill values (e.g. 9999.99) by NaN while parsing.
+	freq: `None` or str, optional, default `None`
+		Downsample the data to `freq`, e.g. "5min" or "1h",
+		using :func:`resample()`. `None` keeps the original resolution.
+		The downsampled data do not contain the time columns.
+	how: str or dict, optional, default "mean"
+		The downsampling reduction, see :func:`resample()`.
+	chunksize: int, optional, default 100000
+		The number of lines to parse at once.
+
+	Returns
+	-------
+	omni_df: pandas.DataFrame
+		The parsed OMNI high-resolution data.
+		Details in
+		https://spdf.gsfc.nasa.gov/pub/data/omni/high_res_omni/hroformat.txt
+
+		Raises an ``IOError`` if the file is not found.
+		The index (start times of the intervals) is returned timezone-naive
+		but contains UTC timestamps.
+
+		The dataframe contains the following columns:
+
+		year, doy, hour, minute:
+			The observation time, start of the interval
+		id_imf, id_sw:
+			ID for the IMF and the SW plasma spacecraft
+		n_imf, n_plasma:
+			Number of points in the IMF and plasma averages
+		interp:
+			Percentage of interpolation
+		timeshift, sigma_timeshift:
+			Time shift and its RMS in seconds
+		sigma_phase:
+			RMS of the phase front normal
+		dt_obs:
+			Time between observations in seconds
+		B_mag:
+			Magnetic field magnitude average
+		B_x, B_y_GSE, B_z_GSE, B_y_GSM, B_z_GSM:
+			Magnetic field components (GSE, GSM)
+		sigma_B_mag, sigma_B_vec:
+			RMS standard deviation of the field magnitude and vector
+		v_plasma, v_x, v_y, v_z:
+			Plasma flow speed and the GSE velocity components
+		n_p, T_p:
+			Proton density and temperature
+		p_flow:
+			Flow pressure
+		E:
+			Electric field
+		beta_plasma:
+			Plasma beta
+		mach:
+			Alfvén Mach number
+		x_sc, y_sc, z_sc:
+			Spacecraft position (GSE) in Earth radii
+		x_bsn, y_bsn, z_bsn:
+			Bow shock nose position (GSE) in Earth radii
+		AE, AL, AU, SYM_D, SYM_H, ASY_D, ASY_H:
+			Geomagnetic index values
+		PC:
+			PC(N) index value
+		mach_mag:
+			Magnetosonic Mach number
+
+		The 5-min files contain the additional columns:
+
+		p_10MeV, p_30MeV, p_60MeV:
+			Proton fluxes >10 MeV, >30 MeV, >60 MeV
+
+	See Also
+	--------
+	omni_hro_range
+	"""
+	_assert_file_exists(omni_file)
+	# the cadence from the file type, single-row intervals have no spacing
+	src_freq = "1min"
+	if len(_hro_columns(omni_file)) > len(_OMNI_HRO_COLUMNS):
+		src_freq = "5min"
+	return _hro_read(
+		_hro_chunks(
+			omni_file, columns=columns, mask_missing=mask_missing,
+			chunksize=chunksize,
+		),
+		freq=freq, how=how, src_freq=src_freq,
+	)
+
+
+def omni_hro_range(
+	start,
+	end,
+	res="1min",
+	columns=None,
+	mask_missing=True,
+	freq=None,
+	how="mean",
+	local_path=None,
+	url_base=None,
+	cache=False,
+	chunksize=100000,
+):
+	"""OMNI high-resolution data for a time range
+
+	Loads the OMNI 1-min or 5-min data between `start` and `end`
+	from the locally cached yearly files, see :func:`read_omni_hro()`.
+	Only the rows within the time range are kept from each chunk.
+
+	Parameters
+	----------
+	start: str or datetime
+		The first time (interval start).
+	end: str or datetime
+		The last time (interval start), included.
+	res: str, optional, default "1min"
+		The time resolution, "1min" or "5min".
+	columns: `None` or list of str, optional, default `None`
+		The columns to parse, `None` parses all columns.
+	mask_missing: bool, optional, default True
+		Replace the fill values by NaN while parsing.
+	freq: `None` or str, optional, default `None`
+		Downsample the data to `freq`, see :func:`read_omni_hro()`.
+	how: str or dict, optional, default "mean"
+		The downsampling reduction, see :func:`resample()`.
+	local_path: `None` or str, optional, default `None`
+		Path to the locally stored data yearly files, defaults to the
+		data location within the package.
+		`None` uses the package's default file location.
+	url_base: `None` or str, optional, default `None`
+		URL for the directory that contains the yearly files.
+		`None` uses the default base url.
+	cache: boolean, optional, default False
+		Download files locally if they are not already available.
+	chunksize: int, optional, default 100000
+		The number of lines to parse at once.
+
+	Returns
+	-------
+	omni_df: pandas.DataFrame
+		The parsed OMNI high-resolution data, see :func:`read_omni_hro()`.
+		Raises an ``IOError`` if a file is not available.
+
+	See Also
+	--------
+	read_omni_hro
+	"""
+	local_path = local_path or HRO_LOCAL_PATH
+	start = pd.Timestamp(start)
+	end = pd.Timestamp(end)
+
+	def _chunks():
+		for year in range(start.year, end.year + 1):
+			omni_file = os.path.join(local_path, _hro_basename(year, res))
+			# ensure that the file exists
+			if not os.path.exists(omni_file):
+				warn("Could not find OMNI HRO data {0}.".format(omni_file))
+				if cache:
+					cache_omni_hro(
+						year, res=res, local_path=local_path, url_base=url_base,
+					)
+				else:
+					warn(
+						"Local data files not found, pass `cache=True` "
+						"or run `sw.cache_omni_hro()` to download the file."
+					)
+			for chunk in _hro_chunks(
+				omni_file, columns=columns, mask_missing=mask_missing,
+				start=start, end=end, chunksize=chunksize,
+			):
+				yield chunk
+
+	return _hro_read(_chunks(), freq=freq, how=how, src_freq=res)
+
+
+def _parquet_part(dataset_path, year):
+	return os.path.join(
+		dataset_path, "year={0:04d}".format(year), "part-0.parquet",
+	)
+
+
+@_doc_param(prefix=OMNI_PREFIX, ext=OMNI_EXT)
+def omnie_to_parquet(
+	years=None,
+	prefix=None,
+	ext=None,
+	local_path=None,
+	dataset_path=None,
+	row_group_size=744,
+	overwrite=False,
+):
+	"""Convert the OMNI2 yearly files to a partitioned Parquet dataset
+
+	Converts the locally cached OMNI2 extended yearly files
+	(see :func:`cache_omnie()`) to a Parquet dataset partitioned by year
+	(``year=YYYY/part-0.parquet``), which can be queried with
+	:func:`omnie_query()` without parsing the text files.
+	The missing values are masked (see :func:`omnie_mask_missing()`),
+	and the rows are written in time order in row groups of `row_group_size`
+	rows with column statistics, such that queries can skip the row groups
+	outside of the time range or the `where` condition.
+	Years that are already converted are only converted again
+	if the text file is newer than the Parquet file.
+
+	Requires `pyarrow`.
+
+	Parameters
+	----------
+	years: `None` or list of int, optional, default `None`
+		The years to convert, `None` converts all yearly files
+		found in `local_path`, also the compressed ones.
+	prefix: `None` or str, optional, default `None`
+		File prefix for constructing the file name as <prefix>_year.<ext>.
+		`None` defaults to '{prefix}'.
+	ext: `None` or str, optional, default `None`
+		File extension for constructing the file name as <prefix>_year.<ext>.
+		`None` defaults to '{ext}'. Downloaded files are stored compressed
+		with the extensions "dat.gz", "dat.xz", or "dat.zst".
+	local_path: `None` or str, optional, default `None`
+		Path to the locally stored data yearly files, defaults to the
+		data location within the package.
+		`None` uses the package's default file location.
+	dataset_path: `None` or str, optional, default `None`
+		Path to the Parquet dataset, defaults to the data location
+		within the package.
+	row_group_size: int, optional, default 744
+		The number of rows per row group, 744 hours are 31 days.
+	overwrite: bool, optional, default False
+		Convert all selected years, also if they are up to date.
+
+	Returns
+	-------
+	years: list of int
+		The converted years.
+
+	See Also
+	--------
+	omnie_query
+	"""
+	import pyarrow as pa
+	import pyarrow.parquet as pq
+
+	prefix = prefix or OMNI_PREFIX
+	ext = ext or OMNI_EXT
+	local_path = local_path or LOCAL_PATH
+	dataset_path = dataset_path or PARQUET_PATH
+
+	if years is None:
+		years = _omnie_years(prefix, ext, local_path)
+	converted = []
+	for year in years:
+		omnie_file = _omnie_file(year, prefix, ext, local_path)[0]
+		_assert_file_exists(omnie_file)
+		part = _parquet_part(dataset_path, year)
+		if (
+			not overwrite and os.path.exists(part)
+			and os.path.getmtime(part) >= os.path.getmtime(omnie_file)
+		):
+			continue
+		df = omnie_mask_missing(read_omnie(omnie_file))
+		# the year is stored in the partition path
+		df = df.drop(columns=["year"]).sort_index()
+		df.index.name = "time"
+		table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+		if not os.path.exists(os.path.dirname(part)):
+			os.makedirs(os.path.dirname(part))
+		# write to a temporary file, an interrupted conversion
+		# does not leave a partial partition behind
+		pq.write_table(table, part + ".tmp", row_group_size=row_group_size)
+		_replace(part + ".tmp", part)
+		converted.append(year)
+	return converted
+
+
+_WHERE_TERM = re.compile(r"^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*(\S+)\s*$")
+
+
+def _where_expr(where):
+	# Parses conditions like "Dst < -100 and Kp >= 5" to a dataset expression
+	import operator
+	import pyarrow.dataset as ds
+
+	ops = {
+		"<": operator.lt, "<=": operator.le, ">": operator.gt,
+		">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+	}
+	expr = None
+	for term in re.split(r"\s+and\s+|\s*&\s*", where.strip()):
+		m = _WHERE_TERM.match(term)
+		if m is None:
+			raise ValueError("Unsupported condition: {0}".format(term))
+		name, op, value = m.groups()
+		_e = ops[op](ds.field(name), float(value))
+		expr = _e if expr is None else expr & _e
+	return expr
+
+
+def omnie_query(
+	start=None,
+	end=None,
+	columns=None,
+	where=None,
+	dataset_path=None,
+):
+	"""Query the OMNI2 Parquet dataset
+
+	Reads the OMNI2 hourly data between `start` and `end` from the
+	Parquet dataset created by :func:`omnie_to_parquet()`.
+	Only the partitions (years) within the time range are opened,
+	and only the requested columns and the row groups whose statistics
+	match the time range and the `where` condition are read.
+
+	Requires `pyarrow`.
+
+	Parameters
+	----------
+	start: `None`, str, or datetime, optional, default `None`
+		The first time, `None` starts at the beginning of the data.
+	end: `None`, str, or datetime, optional, default `None`
+		The last time, included, `None` reads to the end of the data.
+	columns: `None` or list of str, optional, default `None`
+		The columns to read, `None` reads all columns,
+		see :func:`read_omnie()`.
+	where: `None`, str, or `pyarrow.dataset.Expression`, optional
+		Row condition, either a dataset expression or a string
+		of comparisons of columns and numbers combined with "and",
+		e.g. "Dst < -100" or "Kp >= 5 and v_plasma > 600".
+		Missing values do not match any condition.
+	dataset_path: `None` or str, optional, default `None`
+		Path to the Parquet dataset, defaults to the data location
+		within the package.
+
+	Returns
+	-------
+	omni_df: pandas.DataFrame
+		The selected OMNI2 hourly data with the missing values masked
+		(NaN), "year" is included as integer column.
+		The index is returned timezone-naive but contains UTC timestamps.
+		Raises an ``IOError`` if the dataset is not found.
+
+	See Also
+	--------
+	omnie_to_parquet
+	"""
+	import pyarrow as pa
+	import pyarrow.dataset as ds
+
+	dataset_path = dataset_path or PARQUET_PATH
+	_assert_file_exists(dataset_path)
+	dataset = ds.dataset(
+		dataset_path,
+		format="parquet",
+		partitioning=ds.partitioning(pa.schema([("year", pa.int32())]), flavor="hive"),
+	)
+	time_type = dataset.schema.field("time").type
+	expr = None
+	if start is not None:
+		start = pd.Timestamp(start)
+		expr = (ds.field("year") >= start.year) & (
+			ds.field("time") >= pa.scalar(start.to_pydatetime(), type=time_type)
+		)
+	if end is not None:
+		end = pd.Timestamp(end)
+		_e = (ds.field("year") <= end.year) & (
+			ds.field("time") <= pa.scalar(end.to_pydatetime(), type=time_type)
+		)
+		expr = _e if expr is None else expr & _e
+	if where is not None:
+		if not isinstance(where, ds.Expression):
+			where = _where_expr(where)
+		expr = where if expr is None else expr & where
+	if columns is not None:
+		columns = ["time"] + [_c for _c in columns if _c != "time"]
+	table = dataset.to_table(columns=columns, filter=expr)
+	df = table.to_pandas().sort_values("time").set_index("time")
+	df.index.name = None
+	if columns is None:
+		# the same column order as from the text files
+		df = df[["year"] + [_c for _c in df.columns if _c != "year"]]
+	return df
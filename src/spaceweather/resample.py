@@ -0,0 +1,308 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Resampling of regularly spaced space weather data between cadences,
+for example the Hp30/Hp60 data or the OMNI hourly data onto the 3h
+or daily grids. Because the cadences are integer multiples of each other,
+each target interval corresponds to a fixed-size block of rows,
+and the reductions are computed on (column, block, row) reshaped arrays.
+"""
+from warnings import catch_warnings, simplefilter
+
+import numpy as np
+import pandas as pd
+
+from .arrays import _index_ns, _regular_positions
+
+__all__ = [
+	"align",
+	"resample",
+]
+
+
+def _accumulate(func, blocks, dtype=None):
+	# Reduces the last axis of `blocks` using the binary ufunc `func`.
+	# For short blocks, accumulating the k row slices is faster than
+	# the numpy reductions over the (short) last axis.
+	k = blocks.shape[-1]
+	if k > blocks.shape[-2]:
+		return func.reduce(blocks, axis=-1, dtype=dtype)
+	ret = blocks[..., 0].astype(dtype or blocks.dtype)
+	for _j in range(1, k):
+		func(ret, blocks[..., _j], out=ret)
+	return ret
+
+
+def _take_last(blocks, pos):
+	# The elements at `pos` along the last axis,
+	# np.take_along_axis() requires numpy >= 1.15
+	idx = np.ix_(*[np.arange(_n) for _n in pos.shape])
+	return blocks[idx + (pos,)]
+
+
+def _reduce(blocks, how, min_count):
+	# NaN-aware reductions over the last axis of (column, block, row) arrays,
+	# `blocks` is modified for "sum" and "mean".
+	nan = np.isnan(blocks)
+	k = blocks.shape[-1]
+	# the NaN counts in the smallest sufficient integer type
+	ctype = np.uint8 if k < 256 else np.uint16 if k < 65536 else np.int64
+	count = k - _accumulate(np.add, nan.view(np.uint8), ctype).astype(np.int64)
+	if how == "count":
+		return count
+	if how in ["sum", "mean"]:
+		np.copyto(blocks, 0., where=nan)
+		# the row sums as (BLAS) matrix-vector product
+		ret = np.dot(blocks.reshape(-1, k), np.ones(k)).reshape(blocks.shape[:-1])
+		if how == "mean":
+			with np.errstate(invalid="ignore", divide="ignore"):
+				ret /= count
+	elif how in ["min", "max"]:
+		ret = _accumulate(np.fmin if how == "min" else np.fmax, blocks)
+	elif how in ["first", "last"]:
+		k = blocks.shape[-1]
+		if how == "first":
+			pos = np.argmin(nan, axis=-1)
+		else:
+			pos = k - 1 - np.argmin(nan[..., ::-1], axis=-1)
+		ret = _take_last(blocks, pos)
+	elif how == "median":
+		# NaN sort to the end, the median is taken from the valid values
+		srt = np.sort(blocks, axis=-1)
+		lo = np.clip((count - 1) // 2, 0, None)
+		hi = np.clip(count // 2, 0, blocks.shape[-1] - 1)
+		ret = 0.5 * (_take_last(srt, lo) + _take_last(srt, hi))
+	elif how == "std":
+		with catch_warnings():
+			# all-NaN slices and single values
+			simplefilter("ignore", RuntimeWarning)
+			ret = np.nanstd(blocks, axis=-1, ddof=1)
+	else:
+		raise ValueError("Unsupported reduction: {0}".format(how))
+	if how == "sum" or min_count > 1:
+		# the other reductions are already NaN without valid values
+		ret = np.where(count >= max(min_count, 1), ret, np.nan)
+	return ret
+
+
+def _label_offset(label, step):
+	# Time offset of the labels relative to the interval starts
+	if label == "left":
+		return 0
+	if label == "center":
+		return step // 2
+	if label == "right":
+		return step
+	return pd.Timedelta(label).value
+
+
+def _resample_values(df, freq, how, columns, label, min_count, src_freq):
+	# Returns the first label time, the target spacing,
+	# and the resampled values as dict of arrays.
+	columns = list(columns if columns is not None else df.columns)
+	if not isinstance(how, dict):
+		how = dict((_c, how) for _c in columns)
+	t0, step, pos = _regular_positions(df, freq=src_freq)
+	nt = len(df) if pos is None else pos[-1] + 1
+	target = pd.Timedelta(freq).value
+	if target >= step:
+		if target % step:
+			raise ValueError(
+				"The target spacing is not a multiple of the data spacing."
+			)
+		k = target // step
+		# rows before the first sample in its target interval,
+		# time stamps within the intervals (e.g. centred) are allowed
+		lead = (t0 % target) // step
+		start = t0 - t0 % target
+		n = -(-(lead + nt) // k)
+		ret = {}
+		for _how in set(how[_c] for _c in columns):
+			_cols = [_c for _c in columns if how[_c] == _how]
+			# (column, time) layout for contiguous reductions
+			if pos is None:
+				# only the padding is filled with NaN
+				blocks = np.empty((len(_cols), n * k))
+				blocks[:, :lead] = np.nan
+				blocks[:, lead + nt:] = np.nan
+				blocks[:, lead:lead + nt] = df[_cols].values.T
+			else:
+				blocks = np.full((len(_cols), n * k), np.nan)
+				blocks[:, lead + pos] = df[_cols].values.T
+			blocks = _reduce(blocks.reshape(len(_cols), n, k), _how, min_count)
+			ret.update(zip(_cols, blocks))
+		ret = dict((_c, ret[_c]) for _c in columns)
+	else:
+		if step % target:
+			raise ValueError(
+				"The data spacing is not a multiple of the target spacing."
+			)
+		# upsampling, each data interval is repeated
+		k = step // target
+		start = t0 - t0 % step
+		ret = {}
+		for _c in columns:
+			values = np.full(nt, np.nan)
+			values[slice(None) if pos is None else pos] = df[_c].values
+			ret[_c] = np.repeat(values, k)
+	return start + _label_offset(label, target), target, ret
+
+
+def resample(
+	df, freq,
+	how="mean",
+	columns=None,
+	label="left",
+	min_count=1,
+	src_freq=None,
+):
+	"""Resample regularly spaced data to a different cadence
+
+	Reduces the data to longer intervals (downsampling), for example
+	the Hp30 data from :func:`read_gfz_hp()` or the OMNI hourly data from
+	:func:`omnie_hourly()` to 3h or daily intervals, or repeats the values
+	for shorter intervals (upsampling), for example the 3h Kp values to 30 min.
+	The target intervals start at multiples of `freq` since 1970-01-01,
+	which are the midnight UTC boundaries for the 3h and daily cadences.
+	The data time stamps may lie anywhere within their intervals,
+	for example in the centre as in the Hp30 and the 3h data.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		Regularly spaced data with a `pandas.DatetimeIndex`, missing time
+		steps are allowed. Missing-value markers should already be replaced
+		by NaN, e.g. using :func:`omnie_mask_missing()` for the OMNI data.
+	freq: str
+		The target cadence, e.g. "3h" or "1D", an integer multiple
+		(or an integer fraction for upsampling) of the data spacing.
+	how: str or dict, optional, default "mean"
+		The reduction for downsampling, one of "mean", "sum", "min", "max",
+		"count", "first", "last", "median", or "std".
+		Use a dict to set the reduction per column, e.g.
+		``{"Hp": "max", "ap": "mean"}``.
+	columns: `None` or list of str, optional, default `None`
+		The columns to resample, `None` uses all columns
+		(or the keys of `how` if that is a dict).
+	label: str, optional, default "left"
+		The time stamps of the resampled data within the target intervals,
+		"left", "center", "right", or a time offset such as "90min".
+		Use "center" to match the 3h grid of :func:`gfz_3h()` and
+		:func:`ap_kp_3h()` (01:30, 04:30, ...).
+	min_count: int, optional, default 1
+		The minimum number of valid values for a result, NaN otherwise.
+	src_freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the smallest time difference.
+
+	Returns
+	-------
+	resampled: pandas.DataFrame
+		The resampled data, with float values except for "count",
+		including all intervals from the first to the last data interval.
+		The index is timezone-naive.
+
+	Notes
+	-----
+	Equivalent to ``df.resample(freq, label=..., origin="epoch").agg(how)``
+	with NaN-skipping reductions and ``min_count`` for "sum",
+	but without sorting and grouping the index.
+
+	See Also
+	--------
+	align
+	"""
+	if columns is None and isinstance(how, dict):
+		columns = list(how.keys())
+	start, step, ret = _resample_values(
+		df, freq, how, columns, label, min_count, src_freq,
+	)
+	n = len(next(iter(ret.values()))) if ret else 0
+	index = pd.to_datetime(start + step * np.arange(n, dtype=np.int64), unit="ns")
+	return pd.DataFrame(ret, index=index, columns=list(ret.keys()))
+
+
+def align(
+	df, index,
+	how="mean",
+	columns=None,
+	min_count=1,
+	src_freq=None,
+	freq=None,
+):
+	"""Align regularly spaced data to a regular time index
+
+	Resamples the data to the cadence of `index` using :func:`resample()`
+	and selects the time stamps of `index`, for example to put the
+	Hp30 or the OMNI hourly data onto the 3h grid of :func:`gfz_3h()`
+	or onto the daily grid of :func:`gfz_daily()`.
+	The intervals of the `index` time stamps are derived from their
+	position relative to the cadence, e.g. the 3h intervals of
+	01:30, 04:30, ... start at 00:00, 03:00, ... .
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		Regularly spaced data with a `pandas.DatetimeIndex`,
+		see :func:`resample()`.
+	index: pandas.DatetimeIndex
+		The target time stamps, regularly spaced (missing steps allowed).
+	how: str or dict, optional, default "mean"
+		The reduction, see :func:`resample()`.
+	columns: `None` or list of str, optional, default `None`
+		The columns to align, `None` uses all columns.
+	min_count: int, optional, default 1
+		The minimum number of valid values for a result, NaN otherwise.
+	src_freq: `None` or str, optional, default `None`
+		The spacing of the data, `None` uses the smallest time difference.
+	freq: `None` or str, optional, default `None`
+		The cadence of `index`, e.g. "3h" or "1D", `None` uses the
+		smallest time difference. Required for a single time stamp.
+
+	Returns
+	-------
+	aligned: pandas.DataFrame
+		The aligned data with `index` as index,
+		NaN for the times outside of the data range.
+
+	See Also
+	--------
+	resample
+	"""
+	if columns is None and isinstance(how, dict):
+		columns = list(how.keys())
+	index = pd.DatetimeIndex(index)
+	times = _index_ns(index)
+	if freq is not None:
+		target = pd.Timedelta(freq).value
+	elif len(times) > 1 and np.any(np.diff(times) > 0):
+		dt = np.diff(times)
+		target = int(dt[dt > 0].min())
+	elif len(times) == 0:
+		return pd.DataFrame(
+			index=index, columns=list(df.columns if columns is None else columns),
+			dtype=float,
+		)
+	else:
+		raise ValueError(
+			"Cannot infer the cadence of a single time stamp, pass `freq`."
+		)
+	offset = int(times[0] % target)
+	start, step, ret = _resample_values(
+		df, pd.Timedelta(target, unit="ns"), how, columns, offset,
+		min_count, src_freq,
+	)
+	pos = (times - start) // step
+	n = len(next(iter(ret.values()))) if ret else 0
+	valid = (pos >= 0) & (pos < n) & ((times - start) % step == 0)
+	pos = np.where(valid, pos, 0)
+	aligned = {}
+	for _c, _v in ret.items():
+		_v = _v[pos] if n else np.full(len(times), np.nan)
+		aligned[_c] = np.where(valid, _v, np.nan)
+	return pd.DataFrame(aligned, index=index, columns=list(ret.keys()))
@@ -0,0 +1,519 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Lightweight HTTP query service for the space weather indices (Python 3.7+),
+using the standard library `http.server`. The data are loaded once
+into memory and reloaded when the data files change.
+
+Run with ``python -m spaceweather.server --port 8000``.
+
+Endpoints:
+
+GET /datasets:
+	The available datasets, their columns, and time ranges.
+GET /query?dataset=kp3h&start=...&end=...&columns=Kp,Ap:
+	The values within the time range (included).
+GET /query?dataset=kp3h&t=...&t=...:
+	The values of the intervals containing the given times.
+POST /query:
+	Batched queries, a JSON object with "dataset", "times"
+	or "start" and "end", and optionally "columns".
+
+The results are JSON objects with "time" and one list per column,
+missing values are `null`. Pass ``format=arrow`` (or send
+``Accept: application/vnd.apache.arrow.stream``) for Arrow IPC streams.
+
+This module is not imported by ``import spaceweather``.
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import Request, urlopen
+
+import numpy as np
+import pandas as pd
+
+from .arrays import _index_ns
+from .celestrak import SW_PATH_ALL, SW_PATH_5Y, sw_daily
+from .gfz import (
+	GFZ_PATH_ALL, GFZ_PATH_30D, HP30_PATH_ALL, HP30_PATH_30D,
+	gfz_3h, gfz_hp30,
+)
+
+__all__ = [
+	"IndexStore",
+	"bench_server",
+	"make_server",
+	"serve",
+]
+
+_ARROW_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _load_kp3h(gfzpath_all=None, gfzpath_30d=None):
+	return gfz_3h(gfzpath_all=gfzpath_all, gfzpath_30d=gfzpath_30d)[["Kp", "Ap"]]
+
+
+def _load_daily(swpath_all=None, swpath_5y=None):
+	df = sw_daily(swpath_all=swpath_all, swpath_5y=swpath_5y)
+	return df[[
+		"Apavg", "Kpsum", "isn",
+		"f107_obs", "f107_adj", "f107_81ctr_obs", "f107_81lst_obs",
+	]]
+
+
+def _load_hp30(gfzpath_all=None, gfzpath_30d=None):
+	return gfz_hp30(
+		gfzpath_all=gfzpath_all, gfzpath_30d=gfzpath_30d, columns=["Hp", "ap"],
+	)
+
+
+# name: (loader, default files, offset of the index within the intervals)
+_DATASETS = {
+	"kp3h": (
+		_load_kp3h,
+		{"gfzpath_all": GFZ_PATH_ALL, "gfzpath_30d": GFZ_PATH_30D},
+		"90min",
+	),
+	"daily": (
+		_load_daily,
+		{"swpath_all": SW_PATH_ALL, "swpath_5y": SW_PATH_5Y},
+		"0h",
+	),
+	"hp30": (
+		_load_hp30,
+		{"gfzpath_all": HP30_PATH_ALL, "gfzpath_30d": HP30_PATH_30D},
+		"15min",
+	),
+}
+
+
+class _Dataset(object):
+	# Immutable in-memory data of one dataset
+	def __init__(self, df, offset, mtimes):
+		self.times = _index_ns(df.index)
+		self.starts = self.times - pd.Timedelta(offset).value
+		dt = np.diff(self.times)
+		self.step = int(dt[dt > 0].min()) if len(dt) else 1
+		self.columns = list(df.columns)
+		# the negative values mark missing values in all sources
+		self.values = dict(
+			(_c, np.where(df[_c].values >= 0, df[_c].values, np.nan).astype(np.float64))
+			for _c in self.columns
+		)
+		self.mtimes = mtimes
+
+	def points(self, times):
+		pos = np.searchsorted(self.starts, times, side="right") - 1
+		valid = pos >= 0
+		valid[valid] = times[valid] - self.starts[pos[valid]] < self.step
+		return np.where(valid, pos, -1)
+
+	def between(self, start, end):
+		i0 = np.searchsorted(self.times, start, side="left")
+		i1 = np.searchsorted(self.times, end, side="right")
+		return np.arange(i0, i1)
+
+
+class IndexStore(object):
+	"""In-memory store of the space weather indices
+
+	Loads the datasets on first use and reloads them when the
+	modification time of one of their files changes.
+
+	The datasets are:
+
+	"kp3h":
+		"Kp" and "Ap" from :func:`gfz_3h()`.
+	"daily":
+		"Apavg", "Kpsum", "isn", "f107_obs", "f107_adj", "f107_81ctr_obs",
+		and "f107_81lst_obs" from :func:`sw_daily()`.
+	"hp30":
+		"Hp" and "ap" from :func:`gfz_hp30()`.
+
+	Negative values (missing values in the data files) are returned
+	as missing (NaN or `null`).
+
+	Parameters
+	----------
+	files: `None` or dict, optional, default `None`
+		The file arguments per dataset, e.g.
+		``{"kp3h": {"gfzpath_all": "...", "gfzpath_30d": "..."}}``,
+		`None` uses the package's default files.
+	datasets: `None` or list of str, optional, default `None`
+		The datasets to provide, `None` provides all.
+	check_interval: float, optional, default 5
+		The minimum time in seconds between checks of the file times.
+	"""
+	def __init__(self, files=None, datasets=None, check_interval=5.):
+		files = files or {}
+		self.datasets = list(datasets or sorted(_DATASETS.keys()))
+		self.files = {}
+		for name in self.datasets:
+			if name not in _DATASETS:
+				raise ValueError("Unknown dataset: {0}".format(name))
+			_files = dict(_DATASETS[name][1])
+			_files.update(files.get(name, {}))
+			self.files[name] = dict((_k, str(_v)) for _k, _v in _files.items())
+		self.check_interval = check_interval
+		self._data = {}
+		self._checked = {}
+		self._locks = dict((_n, threading.Lock()) for _n in self.datasets)
+
+	def _mtimes(self, name):
+		return tuple(
+			os.path.getmtime(_f) if os.path.exists(_f) else None
+			for _f in sorted(self.files[name].values())
+		)
+
+	def _load(self, name):
+		loader, _, offset = _DATASETS[name]
+		mtimes = self._mtimes(name)
+		data = _Dataset(loader(**self.files[name]), offset, mtimes)
+		self._data[name] = data
+		self._checked[name] = time.time()
+		logging.info("loaded %s (%d rows).", name, len(data.times))
+		return data
+
+	def get(self, name):
+		"""The current data of dataset `name`, (re)loaded if needed"""
+		if name not in self._locks:
+			raise KeyError(name)
+		data = self._data.get(name)
+		if data is None:
+			with self._locks[name]:
+				data = self._data.get(name) or self._load(name)
+			return data
+		if time.time() - self._checked[name] < self.check_interval:
+			return data
+		# one thread reloads, the others use the current data meanwhile
+		if self._locks[name].acquire(False):
+			try:
+				self._checked[name] = time.time()
+				if self._mtimes(name) != data.mtimes:
+					data = self._load(name)
+			finally:
+				self._locks[name].release()
+		return data
+
+	def info(self):
+		"""The datasets, their columns, and time ranges"""
+		ret = {}
+		for name in self.datasets:
+			data = self.get(name)
+			ret[name] = {
+				"columns": data.columns,
+				"rows": len(data.times),
+				"first": _iso(data.times[:1]),
+				"last": _iso(data.times[-1:]),
+			}
+		return ret
+
+	def query(self, dataset, times=None, start=None, end=None, columns=None):
+		"""Query the values at `times` or between `start` and `end`
+
+		Parameters
+		----------
+		dataset: str
+			The dataset name.
+		times: `None` or list, optional, default `None`
+			The times to look up, the values of the intervals containing
+			the times are returned.
+		start, end: `None`, str, or datetime, optional, default `None`
+			The time range (index times, included),
+			used if `times` is `None`.
+		columns: `None` or list of str, optional, default `None`
+			The columns to return, `None` returns all.
+
+		Returns
+		-------
+		times: numpy.ndarray
+			The (requested or index) times as `datetime64[ns]`.
+		values: dict
+			The values per column, NaN for missing values.
+		"""
+		data = self.get(dataset)
+		columns = list(columns or data.columns)
+		for _c in columns:
+			if _c not in data.values:
+				raise KeyError(_c)
+		if times is not None:
+			times = _index_ns(_to_index(times))
+			pos = data.points(times)
+			values = dict(
+				(_c, np.where(pos >= 0, data.values[_c][pos], np.nan))
+				for _c in columns
+			)
+		else:
+			start = np.iinfo(np.int64).min if start is None else pd.Timestamp(start).value
+			end = np.iinfo(np.int64).max if end is None else pd.Timestamp(end).value
+			pos = data.between(start, end)
+			times = data.times[pos]
+			values = dict((_c, data.values[_c][pos]) for _c in columns)
+		return times.astype("M8[ns]"), values
+
+
+def _to_index(times):
+	times = list(times)
+	try:
+		return pd.DatetimeIndex(pd.to_datetime(times))
+	except ValueError:
+		# mixed formats
+		return pd.DatetimeIndex([pd.Timestamp(_t) for _t in times])
+
+
+def _iso(times):
+	if len(times) == 0:
+		return None
+	return pd.Timestamp(int(times[0])).isoformat()
+
+
+def _to_json(times, values):
+	ret = {"time": [pd.Timestamp(_t).isoformat() for _t in times]}
+	for _c, _v in values.items():
+		ret[_c] = np.where(np.isnan(_v), None, _v).tolist()
+	return json.dumps(ret).encode("utf-8")
+
+
+def _to_arrow(times, values):
+	import pyarrow as pa
+
+	table = pa.table(
+		dict([("time", pa.array(times))] + [
+			(_c, pa.array(_v, from_pandas=True)) for _c, _v in values.items()
+		])
+	)
+	sink = pa.BufferOutputStream()
+	with pa.ipc.new_stream(sink, table.schema) as writer:
+		writer.write_table(table)
+	return sink.getvalue().to_pybytes()
+
+
+class _Handler(BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+
+	def log_message(self, fmt, *args):
+		logging.debug(fmt, *args)
+
+	def _send(self, status, body, content_type="application/json"):
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def _error(self, status, msg):
+		self._send(status, json.dumps({"error": msg}).encode("utf-8"))
+
+	def _query(self, params):
+		store = self.server.store
+		fmt = params.get("format")
+		if fmt is None:
+			fmt = "arrow" if _ARROW_TYPE in self.headers.get("Accept", "") else "json"
+		try:
+			times, values = store.query(
+				params["dataset"],
+				times=params.get("times"),
+				start=params.get("start"),
+				end=params.get("end"),
+				columns=params.get("columns"),
+			)
+		except KeyError as e:
+			return self._error(404, "Unknown dataset or column: {0}".format(e))
+		except (TypeError, ValueError) as e:
+			return self._error(400, str(e))
+		if fmt == "arrow":
+			return self._send(200, _to_arrow(times, values), _ARROW_TYPE)
+		return self._send(200, _to_json(times, values))
+
+	def do_GET(self):
+		url = urlsplit(self.path)
+		if url.path == "/datasets":
+			return self._send(200, json.dumps(self.server.store.info()).encode("utf-8"))
+		if url.path != "/query":
+			return self._error(404, "Not found: {0}".format(url.path))
+		qs = parse_qs(url.query)
+		params = dict((_k, _v[-1]) for _k, _v in qs.items())
+		if "t" in qs:
+			params["times"] = qs["t"]
+		if "columns" in params:
+			params["columns"] = params["columns"].split(",")
+		if "dataset" not in params:
+			return self._error(400, "Missing dataset.")
+		return self._query(params)
+
+	def do_POST(self):
+		if urlsplit(self.path).path != "/query":
+			return self._error(404, "Not found: {0}".format(self.path))
+		length = int(self.headers.get("Content-Length", 0))
+		try:
+			params = json.loads(self.rfile.read(length).decode("utf-8"))
+		except ValueError as e:
+			return self._error(400, "Invalid JSON: {0}".format(e))
+		if not isinstance(params, dict) or "dataset" not in params:
+			return self._error(400, "Missing dataset.")
+		columns = params.get("columns")
+		if isinstance(columns, str):
+			# as for GET, "Kp,Ap"
+			params["columns"] = columns.split(",")
+		elif columns is not None and not isinstance(columns, list):
+			return self._error(400, "Invalid columns: {0!r}".format(columns))
+		return self._query(params)
+
+
+def make_server(store=None, host="127.0.0.1", port=8000):
+	"""Create the query server
+
+	Parameters
+	----------
+	store: `None` or IndexStore, optional, default `None`
+		The data store, `None` uses a store with the default files.
+	host: str, optional, default "127.0.0.1"
+		The address to listen on.
+	port: int, optional, default 8000
+		The port to listen on, 0 selects a free port.
+
+	Returns
+	-------
+	server: http.server.ThreadingHTTPServer
+		The server (not yet running), use ``server.serve_forever()``
+		and ``server.server_address`` for the address.
+	"""
+	server = ThreadingHTTPServer((host, port), _Handler)
+	server.daemon_threads = True
+	server.store = store or IndexStore()
+	return server
+
+
+def serve(store=None, host="127.0.0.1", port=8000):
+	"""Run the query server until interrupted
+
+	See :func:`make_server()` for the parameters.
+	"""
+	server = make_server(store=store, host=host, port=port)
+	logging.info("serving on %s:%d.", *server.server_address[:2])
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+
+
+def bench_server(
+	url,
+	dataset="kp3h",
+	requests=1000,
+	concurrency=8,
+	batch=100,
+	seed=None,
+):
+	"""Load test of a running query server
+
+	Sends `requests` POST queries of `batch` random times
+	from `concurrency` threads and measures the latencies.
+
+	Parameters
+	----------
+	url: str
+		The server URL, e.g. "http://127.0.0.1:8000".
+	dataset: str, optional, default "kp3h"
+		The dataset to query.
+	requests: int, optional, default 1000
+		The total number of requests.
+	concurrency: int, optional, default 8
+		The number of concurrent clients.
+	batch: int, optional, default 100
+		The number of times per request.
+	seed: `None` or int, optional, default `None`
+		Seed for the random times.
+
+	Returns
+	-------
+	stats: dict
+		The number of requests and errors, the throughput ("rps"),
+		and the mean, median, 99th percentile, and maximum latencies
+		in seconds.
+	"""
+	url = url.rstrip("/")
+	with urlopen(url + "/datasets") as r:
+		info = json.loads(r.read().decode("utf-8"))[dataset]
+	t0 = pd.Timestamp(info["first"]).value
+	t1 = pd.Timestamp(info["last"]).value
+	# np.random.default_rng() requires numpy >= 1.17
+	rng = np.random.RandomState(seed)
+	bodies = [
+		json.dumps({
+			"dataset": dataset,
+			"times": [
+				pd.Timestamp(int(_t)).isoformat()
+				for _t in rng.randint(t0, t1, size=batch, dtype=np.int64)
+			],
+		}).encode("utf-8")
+		for _ in range(requests)
+	]
+
+	def _request(body):
+		req = Request(
+			url + "/query", data=body, headers={"Content-Type": "application/json"},
+		)
+		start = time.time()
+		try:
+			with urlopen(req) as r:
+				r.read()
+				ok = r.status == 200
+		except Exception:
+			ok = False
+		return time.time() - start, ok
+
+	start = time.time()
+	with ThreadPoolExecutor(max_workers=concurrency) as pool:
+		results = list(pool.map(_request, bodies))
+	total = time.time() - start
+	lat = np.array([_r[0] for _r in results])
+	return {
+		"requests": requests,
+		"errors": sum(not _r[1] for _r in results),
+		"seconds": total,
+		"rps": requests / total,
+		"mean": float(lat.mean()),
+		"p50": float(np.percentile(lat, 50)),
+		"p99": float(np.percentile(lat, 99)),
+		"max": float(lat.max()),
+	}
+
+
+def main(argv=None):
+	"""Command line entry point, ``python -m spaceweather.server``"""
+	parser = argparse.ArgumentParser(
+		prog="python -m spaceweather.server",
+		description="Space weather index query server.",
+	)
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=8000)
+	parser.add_argument(
+		"--datasets", nargs="+", choices=sorted(_DATASETS.keys()), default=None,
+	)
+	parser.add_argument("--check-interval", type=float, default=5.)
+	args = parser.parse_args(argv)
+	logging.basicConfig(level=logging.INFO)
+	serve(
+		IndexStore(datasets=args.datasets, check_interval=args.check_interval),
+		host=args.host, port=args.port,
+	)
+
+
+if __name__ == "__main__":
+	main()
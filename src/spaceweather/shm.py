@@ -0,0 +1,251 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Sharing of loaded space weather data with worker processes via
+`multiprocessing.shared_memory` (Python 3.8+). The data are copied once
+into a shared memory block, and the workers receive a small handle
+that provides numpy views of the block without copying.
+"""
+import sys
+import weakref
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+	"SharedFrame",
+	"SharedFrameHandle",
+	"share_frame",
+]
+
+# alignment of the column arrays within the shared block
+_ALIGN = 64
+
+# attached blocks of this process, the views keep the mapping in use
+_attached = {}
+# weak references to the views of the attached blocks, closing a block
+# with live views does not reliably raise and leaves them dangling
+_views = {}
+
+
+def _live_views(name):
+	# The references of the live views of the block, the dead ones
+	# are dropped so that repeated attaching does not grow the list
+	views = [_r for _r in _views.get(name, []) if _r() is not None]
+	_views[name] = views
+	return views
+
+
+def _attach(name):
+	from multiprocessing import shared_memory
+
+	shm = _attached.get(name)
+	if shm is None:
+		if sys.version_info >= (3, 13):
+			# the owner is responsible for unlinking
+			shm = shared_memory.SharedMemory(name=name, track=False)
+		else:
+			shm = shared_memory.SharedMemory(name=name)
+		_attached[name] = shm
+	return shm
+
+
+class SharedFrameHandle(object):
+	"""Picklable handle of shared data
+
+	Passed to the worker processes instead of the data, the pickled size
+	does not depend on the size of the data. Created by :func:`share_frame()`.
+
+	Attributes
+	----------
+	name: str
+		The name of the shared memory block.
+	nrows: int
+		The number of rows.
+	layout: list of tuple
+		The (column, dtype, offset) of the arrays in the block,
+		the index is stored as column `None`.
+	"""
+	def __init__(self, name, nrows, layout, index_name=None):
+		self.name = name
+		self.nrows = nrows
+		self.layout = layout
+		self.index_name = index_name
+
+	def __repr__(self):
+		return "{0}(name={1!r}, nrows={2}, columns={3})".format(
+			self.__class__.__name__, self.name, self.nrows,
+			[_c for _c, _, _ in self.layout if _c is not None],
+		)
+
+	def arrays(self):
+		"""Zero-copy views of the shared data
+
+		Attaches to the shared memory block (once per process)
+		and returns read-only numpy views of the columns.
+
+		Returns
+		-------
+		arrays: dict
+			The column arrays, and the index values as "index".
+		"""
+		shm = _attach(self.name)
+		views = _live_views(self.name)
+		ret = {}
+		for column, dtype, offset in self.layout:
+			arr = np.ndarray(
+				(self.nrows,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset,
+			)
+			arr.flags.writeable = False
+			views.append(weakref.ref(arr))
+			ret["index" if column is None else column] = arr
+		return ret
+
+	def to_frame(self):
+		"""The shared data as data frame
+
+		Returns
+		-------
+		df: pandas.DataFrame
+			The data frame using the read-only shared arrays without copying,
+			use :meth:`pandas.DataFrame.copy()` to modify the data.
+		"""
+		arrays = self.arrays()
+		index = pd.Index(arrays.pop("index"), name=self.index_name)
+		return pd.DataFrame(arrays, index=index, copy=False)
+
+	def detach(self):
+		"""Release the mapping of the block in this process
+
+		All views returned by :meth:`arrays()` and :meth:`to_frame()`
+		must be deleted before, otherwise ``BufferError`` is raised
+		and the block stays attached.
+		"""
+		shm = _attached.get(self.name)
+		if shm is None:
+			return
+		# derived views and frames keep the original views alive
+		views = _live_views(self.name)
+		if views:
+			raise BufferError(
+				"{0} views of {1} are still in use.".format(len(views), self.name)
+			)
+		shm.close()
+		del _attached[self.name]
+		_views.pop(self.name, None)
+
+
+class SharedFrame(object):
+	"""Shared memory copy of a data frame
+
+	Owns the shared memory block, which is released by :meth:`close()`
+	or when leaving the context, the workers receive :attr:`handle`.
+	Created by :func:`share_frame()`.
+	"""
+	def __init__(self, shm, handle):
+		self._shm = shm
+		self._unlinked = False
+		self.handle = handle
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def close(self):
+		"""Release and remove the shared memory block
+
+		The block is removed first, so that no new workers can attach,
+		and then released in this process. The arrays and frames that
+		were attached in this process, using :meth:`SharedFrameHandle.arrays()`
+		or :meth:`SharedFrameHandle.to_frame()`, must be deleted before,
+		otherwise ``BufferError`` is raised; call :meth:`close()` again
+		after deleting them.
+		"""
+		if self._shm is None:
+			return
+		if not self._unlinked:
+			self._shm.unlink()
+			self._unlinked = True
+		try:
+			self.handle.detach()
+		except BufferError:
+			raise BufferError(
+				"The shared block {0} is still in use by arrays or frames of "
+				"this process, delete them and call close() again.".format(
+					self.handle.name,
+				)
+			)
+		self._shm.close()
+		self._shm = None
+
+
+def share_frame(df, columns=None):
+	"""Copy a data frame into shared memory
+
+	Publishes the numeric (and datetime) columns and the index of `df`,
+	e.g. from :func:`sw_daily()` or :func:`ap_kp_3h()`, in one
+	`multiprocessing.shared_memory` block for use in worker processes,
+	e.g. with `concurrent.futures.ProcessPoolExecutor`.
+	Pass the :attr:`SharedFrame.handle` to the tasks, which attach to
+	the block with :meth:`SharedFrameHandle.arrays()` or
+	:meth:`SharedFrameHandle.to_frame()`.
+
+	Parameters
+	----------
+	df: pandas.DataFrame
+		The data to share.
+	columns: `None` or list of str, optional, default `None`
+		The columns to share, `None` shares all columns.
+
+	Returns
+	-------
+	shared: SharedFrame
+		The owner of the shared block, keep it (or its context)
+		open while the workers use the data.
+
+	Raises ``TypeError`` for columns with object or string data.
+
+	Examples
+	--------
+	>>> from concurrent.futures import ProcessPoolExecutor
+	>>> import spaceweather as sw
+	>>> def task(handle, i):
+	...     return handle.arrays()["Apavg"][i]
+	>>> with sw.share_frame(sw.sw_daily()) as shared:  # doctest: +SKIP
+	...     with ProcessPoolExecutor() as pool:
+	...         res = list(pool.map(task, [shared.handle] * 10, range(10)))
+	"""
+	from multiprocessing import shared_memory
+
+	columns = list(columns if columns is not None else df.columns)
+	arrays = [(None, df.index.values)]
+	arrays += [(_c, df[_c].values) for _c in columns]
+	layout = []
+	size = 0
+	for column, values in arrays:
+		values = np.asarray(values)
+		if values.dtype.kind not in "biufcmM":
+			raise TypeError(
+				"Cannot share {0} with dtype {1}.".format(
+					"index" if column is None else column, values.dtype,
+				)
+			)
+		layout.append((column, values.dtype.str, size))
+		size += -(-values.nbytes // _ALIGN) * _ALIGN
+	shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+	handle = SharedFrameHandle(shm.name, len(df), layout, df.index.name)
+	for (column, values), (_, dtype, offset) in zip(arrays, layout):
+		dest = np.ndarray(
+			(len(df),), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset,
+		)
+		dest[:] = values
+		del dest
+	return SharedFrame(shm, handle)
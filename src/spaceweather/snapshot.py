@@ -0,0 +1,436 @@
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Python interface for space weather indices
+
+Snapshots of the parsed data in one columnar archive (numpy `.npz`),
+with a manifest of the source files, their sizes and content hashes.
+Imported snapshots are used by :func:`sw_daily()`, :func:`gfz_daily()`,
+:func:`gfz_3h()`, :func:`gfz_hp30()`, :func:`gfz_hp60()`, and
+:func:`omnie_hourly()` instead of parsing the text files, as long as
+the source files have the same contents as at the export.
+The files are matched by name, size, and hash, such that the snapshot
+also applies to copies of the files in other directories or on other
+hosts, e.g. the files seeded into `SPACEWEATHER_DATA_DIR`.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .core import _replace, _resource_filepath, _share
+
+__all__ = [
+	"Snapshot",
+	"SNAPSHOT_PATH",
+	"export_snapshot",
+	"import_snapshot",
+	"install_snapshot",
+	"load_snapshot",
+]
+
+SNAPSHOT_FILE = "snapshot.npz"
+# installed snapshot, used automatically if it exists
+SNAPSHOT_PATH = _resource_filepath(SNAPSHOT_FILE)
+# environment variable for the snapshot file
+SNAPSHOT_ENV = "SPACEWEATHER_SNAPSHOT"
+SNAPSHOT_VERSION = 2
+
+_SOURCES = ["celestrak", "gfz", "hp30", "hp60"]
+
+
+class Snapshot(object):
+	"""Parsed space weather data from a snapshot archive
+
+	Created by :func:`load_snapshot()`, the data of each entry
+	are read from the archive on first access.
+
+	Attributes
+	----------
+	path: str
+		The archive file.
+	manifest: dict
+		The snapshot manifest, with the entries in "sources",
+		each with "columns", "rows", "first", "last", and the
+		source "files" with their "name", "path", "size", and "sha256".
+	"""
+	def __init__(self, path):
+		self.path = str(path)
+		with np.load(self.path) as npz:
+			self.manifest = json.loads(npz["manifest"].tobytes().decode("utf-8"))
+		if self.manifest.get("version") != SNAPSHOT_VERSION:
+			raise ValueError(
+				"Unsupported snapshot version: {0}".format(self.manifest.get("version"))
+			)
+		self._frames = {}
+		self._lock = threading.Lock()
+
+	def __repr__(self):
+		return "{0}(path={1!r}, entries={2})".format(
+			self.__class__.__name__, self.path, self.keys(),
+		)
+
+	def keys(self):
+		"""The entry names, such as "gfz" or "omni_2020"
+		"""
+		return sorted(self.manifest["sources"].keys())
+
+	def frame(self, key):
+		"""The data of entry `key`
+
+		Parameters
+		----------
+		key: str
+			The entry, see :meth:`keys()`.
+
+		Returns
+		-------
+		df: pandas.DataFrame
+			The data as returned by the loader at the time of the export.
+		"""
+		with self._lock:
+			df = self._frames.get(key)
+			if df is None:
+				entry = self.manifest["sources"][key]
+				with np.load(self.path) as npz:
+					index = pd.DatetimeIndex(
+						npz["{0}/index".format(key)], name=entry["index_name"],
+					)
+					df = pd.DataFrame(
+						dict(
+							(_c, npz["{0}/{1}".format(key, _i)])
+							for _i, _c in enumerate(entry["columns"])
+						),
+						index=index,
+						columns=entry["columns"],
+					)
+				self._frames[key] = df
+		return _share(df)
+
+	def is_current(self, key, files):
+		"""Checks whether entry `key` can be used for `files`
+
+		Parameters
+		----------
+		key: str
+			The entry, see :meth:`keys()`.
+		files: list of str
+			The source files of the requested data.
+
+		Returns
+		-------
+		current: bool
+			True if the entry was exported from files with the same
+			names, and the existing `files` have the same size and
+			contents (hash) as at the export.
+		"""
+		entry = self.manifest["sources"].get(key)
+		if entry is None:
+			return False
+		recorded = entry["files"]
+		if len(files) != len(recorded):
+			return False
+		for fname, rec in zip(files, recorded):
+			fname = str(fname)
+			if os.path.basename(fname) != rec["name"]:
+				return False
+			if not os.path.exists(fname):
+				# e.g. not yet downloaded on new systems
+				continue
+			if rec["sha256"] is None:
+				return False
+			if (
+				os.path.getsize(fname) != rec["size"]
+				or _file_hash(fname) != rec["sha256"]
+			):
+				# updated since the export
+				return False
+		return True
+
+
+def load_snapshot(path):
+	"""Load a snapshot archive
+
+	Parameters
+	----------
+	path: str
+		The archive written by :func:`export_snapshot()`.
+
+	Returns
+	-------
+	snapshot: Snapshot
+		The snapshot, use :meth:`Snapshot.frame()` for the data.
+	"""
+	return Snapshot(path)
+
+
+# file hashes by (path, mtime, size), to hash unchanged files only once
+_hashes = {}
+_hashes_lock = threading.Lock()
+
+
+def _file_hash(path):
+	stat = os.stat(path)
+	key = (os.path.abspath(path), stat.st_mtime, stat.st_size)
+	with _hashes_lock:
+		ret = _hashes.get(key)
+	if ret is None:
+		sha = hashlib.sha256()
+		with open(path, "rb") as fp:
+			for chunk in iter(lambda: fp.read(1 << 20), b""):
+				sha.update(chunk)
+		ret = sha.hexdigest()
+		with _hashes_lock:
+			_hashes[key] = ret
+	return ret
+
+
+# `False` until checked for an installed snapshot
+_active = False
+_active_lock = threading.Lock()
+
+
+def _active_snapshot():
+	global _active
+	with _active_lock:
+		if _active is False:
+			path = os.environ.get(SNAPSHOT_ENV, None)
+			if path is None and os.path.exists(str(SNAPSHOT_PATH)):
+				path = str(SNAPSHOT_PATH)
+			_active = Snapshot(path) if path else None
+		return _active
+
+
+def _from_snapshot(key, files):
+	# The data of `key` from the active snapshot, `None` if
+	# unavailable or if the source files changed since the export.
+	snap = _active_snapshot()
+	if snap is None or not snap.is_current(key, files):
+		return None
+	return snap.frame(key)
+
+
+def import_snapshot(path):
+	"""Use a snapshot for loading the data
+
+	The loaders :func:`sw_daily()`, :func:`gfz_daily()`, :func:`gfz_3h()`,
+	:func:`gfz_hp30()`, :func:`gfz_hp60()`, and :func:`omnie_hourly()`
+	return the snapshot data instead of parsing the source files,
+	if they are called for files with the same names (e.g. the default
+	files) without `update=True`, and the files have the same contents
+	as at the export, in any directory. Missing source files are fine,
+	e.g. on newly installed systems.
+
+	Without calling this function, the snapshot from the environment
+	variable `SPACEWEATHER_SNAPSHOT` or an installed snapshot
+	(see :func:`install_snapshot()`) is used.
+
+	Parameters
+	----------
+	path: str or `None`
+		The archive written by :func:`export_snapshot()`,
+		`None` disables the use of snapshots.
+
+	Returns
+	-------
+	snapshot: Snapshot or `None`
+		The active snapshot.
+	"""
+	global _active
+	snap = None if path is None else Snapshot(path)
+	with _active_lock:
+		_active = snap
+	return snap
+
+
+def install_snapshot(path, dest=None):
+	"""Install a snapshot for automatic use
+
+	Copies the archive to the data directory (see `SPACEWEATHER_DATA_DIR`),
+	where it is used by the loaders of later sessions.
+
+	Parameters
+	----------
+	path: str
+		The archive written by :func:`export_snapshot()`.
+	dest: `None` or str, optional, default `None`
+		The destination, `None` uses :data:`SNAPSHOT_PATH`.
+
+	Returns
+	-------
+	manifest: dict
+		The manifest of the installed snapshot.
+	"""
+	dest = str(dest or SNAPSHOT_PATH)
+	# validates the archive
+	snap = Snapshot(path)
+	tmppath = "{0}.{1}.{2}.tmp".format(
+		dest, os.getpid(), threading.current_thread().ident,
+	)
+	shutil.copyfile(str(path), tmppath)
+	_replace(tmppath, dest)
+	return snap.manifest
+
+
+def _loaders(sources, omni_years, files):
+	# The (key, loader, source files) of the entries to export
+	from .celestrak import SW_PATH_ALL, SW_PATH_5Y, sw_daily
+	from .gfz import (
+		GFZ_PATH_ALL, GFZ_PATH_30D,
+		HP30_PATH_ALL, HP30_PATH_30D, HP60_PATH_ALL, HP60_PATH_30D,
+		gfz_daily, gfz_hp30, gfz_hp60,
+	)
+	from .omni import _omnie_file, omnie_hourly
+
+	specs = {
+		"celestrak": (
+			sw_daily, ("swpath_all", SW_PATH_ALL), ("swpath_5y", SW_PATH_5Y),
+		),
+		"gfz": (
+			gfz_daily, ("gfzpath_all", GFZ_PATH_ALL), ("gfzpath_30d", GFZ_PATH_30D),
+		),
+		"hp30": (
+			gfz_hp30, ("gfzpath_all", HP30_PATH_ALL), ("gfzpath_30d", HP30_PATH_30D),
+		),
+		"hp60": (
+			gfz_hp60, ("gfzpath_all", HP60_PATH_ALL), ("gfzpath_30d", HP60_PATH_30D),
+		),
+	}
+	ret = []
+	for name in sources:
+		kwargs = dict(files.get(name, {}))
+		if name == "omni":
+			for year in omni_years or []:
+				# also the compressed files if `ext` is not given
+				fname, ext = _omnie_file(
+					year, kwargs.get("prefix", None), kwargs.get("ext", None),
+					kwargs.get("local_path", None),
+				)
+				ret.append((
+					"omni_{0:04d}".format(year),
+					(lambda y=year, kw=dict(kwargs, ext=ext): omnie_hourly(y, **kw)),
+					[fname],
+				))
+			continue
+		func, (arg_all, path_all), (arg_recent, path_recent) = specs[name]
+		paths = [kwargs.get(arg_all, None) or path_all, kwargs.get(arg_recent, None) or path_recent]
+		ret.append((name, (lambda f=func, kw=kwargs: f(**kw)), paths))
+	return ret
+
+
+def _file_info(path):
+	path = os.path.abspath(str(path))
+	ret = {"name": os.path.basename(path), "path": path}
+	if not os.path.exists(path):
+		ret.update(size=None, sha256=None)
+		return ret
+	stat = os.stat(path)
+	ret.update(
+		modified=pd.Timestamp(stat.st_mtime, unit="s", tz="utc").isoformat(),
+		size=stat.st_size,
+		sha256=_file_hash(path),
+	)
+	return ret
+
+
+def export_snapshot(
+	path,
+	sources=None,
+	omni_years=None,
+	files=None,
+	compress=True,
+	workers=None,
+):
+	"""Export the parsed data to a snapshot archive
+
+	Loads the data of all sources (in parallel) and writes them with a
+	manifest of the source files, their sizes and hashes, into one
+	numpy `.npz` archive, one array per column.
+
+	Parameters
+	----------
+	path: str
+		The archive file to write, replaced atomically.
+	sources: `None` or list of str, optional, default `None`
+		The sources, "celestrak", "gfz", "hp30", "hp60", and "omni".
+		`None` exports all, "omni" only if `omni_years` are given.
+	omni_years: `None` or list of int, optional, default `None`
+		The OMNI years to export.
+	files: `None` or dict, optional, default `None`
+		Arguments for the loaders per source, e.g. the files
+		``{"gfz": {"gfzpath_all": "...", "gfzpath_30d": "..."}}``
+		or ``{"omni": {"local_path": "..."}}``,
+		`None` uses the package's default files.
+	compress: bool, optional, default True
+		Compress the archive (zip deflate).
+	workers: `None` or int, optional, default `None`
+		The number of threads to load the sources.
+
+	Returns
+	-------
+	manifest: dict
+		The manifest stored in the archive.
+	"""
+	from .combined import _map
+
+	if sources is None:
+		sources = _SOURCES + (["omni"] if omni_years else [])
+	entries = _loaders(sources, omni_years, files or {})
+	return _write_snapshot(path, _map(_load_entry, entries, workers), compress)
+
+
+def _load_entry(entry):
+	# The (key, file infos, data) of an entry from `_loaders()`
+	key, load, files = entry
+	# file hashes before loading, such that updates during the
+	# export invalidate the snapshot
+	info = [_file_info(_f) for _f in files]
+	return key, info, load()
+
+
+def _write_snapshot(path, loaded, compress=True):
+	# Writes the loaded (key, file infos, data) entries to `path`
+	manifest = {
+		"version": SNAPSHOT_VERSION,
+		"created": pd.Timestamp.now("UTC").isoformat(),
+		"sources": {},
+	}
+	arrays = {}
+	for key, info, df in loaded:
+		columns = [str(_c) for _c in df.columns]
+		manifest["sources"][key] = {
+			"columns": columns,
+			"index_name": df.index.name,
+			"rows": len(df),
+			"first": df.index[0].isoformat() if len(df) else None,
+			"last": df.index[-1].isoformat() if len(df) else None,
+			"files": info,
+		}
+		arrays["{0}/index".format(key)] = np.asarray(df.index.values)
+		for _i, _c in enumerate(df.columns):
+			arrays["{0}/{1}".format(key, _i)] = np.asarray(df[_c].values)
+	arrays["manifest"] = np.frombuffer(
+		json.dumps(manifest).encode("utf-8"), dtype=np.uint8,
+	)
+
+	# `np.savez()` appends ".npz" to file names
+	tmppath = "{0}.{1}.{2}.tmp.npz".format(
+		path, os.getpid(), threading.current_thread().ident,
+	)
+	save = np.savez_compressed if compress else np.savez
+	try:
+		save(tmppath, **arrays)
+		_replace(tmppath, str(path))
+	except BaseException:
+		if os.path.exists(tmppath):
+			os.remove(tmppath)
+		raise
+	return manifest
@@ -1,5 +1,12 @@
+import sys
+
 import pytest
 
+# test modules using the python 3.7+ asyncio and http.server apis
+collect_ignore = []
+if sys.version_info < (3, 7):
+	collect_ignore += ["test_aio.py", "test_fetch.py", "test_server.py"]
+
 
 def pytest_addoption(parser):
 	parser.addoption(
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Async loader tests
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+import pytest
+
+from spaceweather import aio, omnie_hourly
+from spaceweather.celestrak import read_sw
+
+_TEST_PATH = os.path.join(".", "tests")
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+	def __init__(self, *args, **kwargs):
+		super(_CountingExecutor, self).__init__(*args, **kwargs)
+		self.submitted = 0
+
+	def submit(self, *args, **kwargs):
+		self.submitted += 1
+		return super(_CountingExecutor, self).submit(*args, **kwargs)
+
+
+def test_coalesce(mocker):
+	calls = []
+
+	def _slow_read(swpath):
+		calls.append(swpath)
+		time.sleep(0.1)
+		return read_sw(swpath)
+
+	mocker.patch("spaceweather.celestrak.read_sw", side_effect=_slow_read)
+	executor = _CountingExecutor(max_workers=4)
+	loader = aio.AsyncLoader(executor=executor)
+
+	async def _main():
+		results = await asyncio.gather(*[loader.sw_daily() for _ in range(10)])
+		# warm
+		results.append(await loader.sw_daily())
+		return results
+
+	results = asyncio.run(_main())
+	assert executor.submitted == 1
+	assert len(calls) == 2
+	for df in results[1:]:
+		pd.testing.assert_frame_equal(df, results[0])
+	results[1].iloc[0, 0] = -9999
+	assert results[0].iloc[0, 0] != -9999
+	# expired or invalidated results are loaded again
+	loader.invalidate(aio._sw_daily)
+	asyncio.run(loader.sw_daily())
+	assert executor.submitted == 2
+	loader.ttl = 0
+	asyncio.run(loader.sw_daily())
+	asyncio.run(loader.sw_daily())
+	assert executor.submitted == 4
+	executor.shutdown()
+
+
+def test_process_executor():
+	kwargs = dict(local_path=_TEST_PATH, prefix="omni2t")
+	with ProcessPoolExecutor(max_workers=1) as executor:
+		loader = aio.AsyncLoader(executor=executor)
+		df = asyncio.run(loader.omnie_hourly(2000, **kwargs))
+	pd.testing.assert_frame_equal(df, omnie_hourly(2000, **kwargs))
+
+
+def test_module_loader():
+	kwargs = dict(local_path=_TEST_PATH, prefix="omni2t")
+	df = asyncio.run(aio.omnie_hourly(2000, **kwargs))
+	pd.testing.assert_frame_equal(df, omnie_hourly(2000, **kwargs))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Space weather data analysis tests
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import (
+	ap_kp_3h, gfz_3h,
+	event_catalogue, find_events,
+	superposed_epoch, superposed_epoch_stats,
+)
+
+GFZ_PATH_ALL = os.path.join("tests", "Kp_ap_Ap_SN_F107_since_2024.txt")
+GFZ_PATH_30D = os.path.join("tests", "Kp_ap_Ap_SN_F107_nowcast.txt")
+
+
+@pytest.fixture(scope="module")
+def df_3h():
+	return gfz_3h(gfzpath_all=GFZ_PATH_ALL, gfzpath_30d=GFZ_PATH_30D)
+
+
+def test_superposed_epoch(df_3h):
+	# with a gap
+	df = df_3h.drop(df_3h.index[100:110])
+	events = pd.to_datetime(["2024-01-02 04:00", "2024-01-15 00:00", "2024-02-12 12:00"])
+	epochs, lags = superposed_epoch(
+		df, events, window=("-1D", "2D"), columns=["Kp", "Ap"],
+	)
+	assert epochs.shape == (3, 25, 2)
+	assert lags[0] == pd.Timedelta("-1D")
+	assert lags[-1] == pd.Timedelta("2D")
+	for ev, ep in zip(events, epochs):
+		# closest 3h value
+		t0 = (ev - pd.Timedelta("1.5h")).round("3h") + pd.Timedelta("1.5h")
+		ref = df.reindex(t0 + lags)[["Kp", "Ap"]].values
+		np.testing.assert_allclose(ep, ref)
+	# the gap and the data end
+	assert np.isnan(epochs[1]).any()
+	assert np.isnan(epochs[2, -1]).all()
+	# a single row needs the spacing
+	with pytest.raises(ValueError):
+		superposed_epoch(df.iloc[:1], events[:1], window=("-1D", "2D"))
+	epochs, _ = superposed_epoch(
+		df.iloc[8:9], df.index[8:9], window=("-1D", "2D"),
+		columns=["Kp", "Ap"], freq="3h",
+	)
+	np.testing.assert_allclose(epochs[0, 8], df.iloc[8][["Kp", "Ap"]].values)
+	assert np.isnan(np.delete(epochs[0], 8, axis=0)).all()
+
+
+def test_superposed_epoch_stats():
+	epochs = np.arange(24.).reshape(4, 3, 2)
+	epochs[0, 0, 0] = np.nan
+	epochs[:, 2, 1] = np.nan
+	stats = superposed_epoch_stats(epochs, quantiles=[0.5, 0.25])
+	np.testing.assert_allclose(
+		stats["quantiles"][1, 1:], np.percentile(epochs[:, 1:], 25, axis=0),
+	)
+	np.testing.assert_allclose(stats["mean"][0, 0], 12.)
+	np.testing.assert_allclose(stats["mean"][1:, 0], epochs[:, 1:, 0].mean(axis=0))
+	np.testing.assert_allclose(stats["quantiles"][0], stats["median"])
+	assert np.isnan(stats["mean"][2, 1])
+	np.testing.assert_array_equal(stats["count"], [[3, 4], [4, 4], [4, 0]])
+
+
+@pytest.fixture(scope="module")
+def df_sw3h():
+	df = ap_kp_3h()
+	return df[df["Ap"] >= 0]
+
+
+@pytest.mark.parametrize("above", [True, False])
+def test_find_events(above, df_3h):
+	threshold = 3. if above else 1.
+	events = find_events(df_3h, "Kp", threshold, above=above, integrate="Ap")
+	# reference with a python loop
+	ref = []
+	cur = None
+	for t, (kp, ap) in zip(df_3h.index, df_3h[["Kp", "Ap"]].values):
+		if (kp >= threshold) if above else (kp <= threshold):
+			if cur is None:
+				cur = [t, t, t, kp, 0, 0.]
+			cur[1] = t
+			if (kp > cur[3]) if above else (kp < cur[3]):
+				cur[2:4] = [t, kp]
+			cur[4] += 1
+			cur[5] += 3 * ap
+		elif cur is not None:
+			ref.append(cur)
+			cur = None
+	if cur is not None:
+		ref.append(cur)
+	assert len(events) == len(ref)
+	for (_, ev), r in zip(events.iterrows(), ref):
+		assert ev["start"] == r[0]
+		assert ev["end"] == r[1]
+		assert ev["peak_time"] == r[2]
+		assert ev["peak"] == r[3]
+		assert ev["duration"] == r[4] * pd.Timedelta("3h")
+		assert ev["integral"] == r[5]
+
+
+@pytest.mark.parametrize("split", [1000, 10000, 100000, 200000])
+def test_event_catalogue(split, df_sw3h, tmpdir):
+	cache_file = os.path.join(str(tmpdir), "events.csv")
+	kwargs = dict(min_duration="6h", integrate="Ap", cache_file=cache_file)
+	ref = find_events(df_sw3h, "Kp", 5., min_duration="6h", integrate="Ap")
+	ev0 = event_catalogue(df_sw3h.iloc[:split], "Kp", 5., **kwargs)
+	assert ev0.iloc[-1]["end"] < df_sw3h.index[split]
+	ev1 = event_catalogue(df_sw3h, "Kp", 5., **kwargs)
+	pd.testing.assert_frame_equal(ev1, ref, check_dtype=False)
+	# unchanged data
+	ev2 = event_catalogue(df_sw3h, "Kp", 5., **kwargs)
+	pd.testing.assert_frame_equal(ev2, ref, check_dtype=False)
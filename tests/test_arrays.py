@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Array access tests
+
+Direct time indexing tests for regularly spaced data.
+"""
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import AggregateIndex, SpaceWeatherArray, ap_kp_3h, sw_daily
+
+
+@pytest.fixture(scope="module")
+def df_d():
+	df = sw_daily()
+	# without the monthly predictions
+	return df[df["Apavg"] >= 0]
+
+
+@pytest.fixture(scope="module")
+def df_3h():
+	df = ap_kp_3h()
+	return df[df["Ap"] >= 0]
+
+
+def test_daily(df_d):
+	swa = SpaceWeatherArray(df_d)
+	assert len(swa) == len(df_d)
+	np.testing.assert_array_equal(swa.times, df_d.index.values)
+	for t in ["1957-10-01", "2000-01-01 12:00", "2024-02-29 23:59"]:
+		rec = swa.at_day(t)
+		ref = df_d.loc[pd.Timestamp(t).normalize()]
+		assert rec.time == pd.Timestamp(t).normalize()
+		np.testing.assert_allclose(rec.values, ref.values.astype(float))
+		assert rec.Apavg == ref["Apavg"]
+		assert rec["f107_obs"] == ref["f107_obs"]
+	with pytest.raises(KeyError):
+		swa.at_day("1957-09-30")
+	with pytest.raises(ValueError):
+		swa.at_3h("2000-01-01")
+
+
+def test_3h(df_3h):
+	swa = SpaceWeatherArray(df_3h, columns=["Ap", "Kp"])
+	# 3h intervals centred at 01:30, 04:30, ...
+	ts = pd.date_range("2000-01-01 00:00", "2000-01-02 00:00", freq="20min")
+	ref = df_3h.loc[ts.floor("3h") + pd.Timedelta("1.5h")]
+	for t, (_, row) in zip(ts, ref.iterrows()):
+		rec = swa.at_3h(t)
+		assert rec.Ap == row["Ap"]
+		assert rec.Kp == row["Kp"]
+		np.testing.assert_array_equal(swa.row(t), row.values)
+	np.testing.assert_allclose(swa.take(ts), ref.values)
+	np.testing.assert_allclose(swa.take(ts.values, columns=["Kp"]), ref[["Kp"]].values)
+	vals = swa.take(["1900-01-01", "2000-01-01 01:00"])
+	assert np.isnan(vals[0]).all()
+	np.testing.assert_allclose(vals[1], [56, 5.3])
+
+
+def test_not_regular(df_d):
+	with pytest.raises(ValueError):
+		SpaceWeatherArray(df_d.drop(df_d.index[10]))
+
+
+def test_aggregate(df_3h):
+	df = df_3h.copy()
+	df.iloc[100:130, 0] = np.nan
+	df = df.drop(df.index[200:230])
+	agg = AggregateIndex(df, columns=["Ap", "Kp"])
+	rng = np.random.RandomState(42)
+	t0 = df.index[0] - pd.Timedelta("2D")
+	starts = t0 + pd.to_timedelta(rng.randint(0, 200 * 24, 500), unit="h")
+	ends = starts + pd.to_timedelta(rng.randint(0, 10 * 24, 500), unit="h")
+	# empty window
+	starts = starts[:-1].append(pd.DatetimeIndex([ends[-1] + pd.Timedelta("1h")]))
+	res = {
+		_f: getattr(agg, _f)(starts, ends)
+		for _f in ["count", "sum", "mean", "min", "max"]
+	}
+	for i, (t1, t2) in enumerate(zip(starts, ends)):
+		ref = df.loc[t1:t2, ["Ap", "Kp"]]
+		np.testing.assert_array_equal(res["count"][i], ref.count().values)
+		np.testing.assert_allclose(res["sum"][i], ref.sum().values)
+		np.testing.assert_allclose(res["mean"][i], ref.mean().values)
+		np.testing.assert_allclose(res["min"][i], ref.min().values)
+		np.testing.assert_allclose(res["max"][i], ref.max().values)
+	np.testing.assert_allclose(agg.max(starts, ends, "Kp"), res["max"][:, 1])
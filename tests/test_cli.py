@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Command line interface tests
+"""
+import json
+import os
+import time
+
+import pandas as pd
+import requests
+
+import pytest
+
+from spaceweather import import_snapshot, sw_daily
+from spaceweather.celestrak import DL_URL_5Y
+from spaceweather.cli import main
+from spaceweather.omni import OMNI_URL_BASE
+
+
+def _run(capsys, *argv):
+	status = main(list(argv))
+	return status, json.loads(capsys.readouterr().out)
+
+
+def test_status(capsys):
+	status, ret = _run(capsys, "status", "-s", "celestrak")
+	assert status == 0
+	assert ret["ok"]
+	files = ret["sources"]["celestrak"]["files"]
+	assert all(_f["exists"] for _f in files)
+	last = sw_daily().index[-1]
+	assert files[0]["last_data_line"].startswith(last.strftime("%Y %m %d"))
+
+
+def test_update(mocker, capsys):
+	mocker.patch("requests.get")
+	status, ret = _run(capsys, "update", "-s", "celestrak", "--min-age", "0h")
+	assert status == 0
+	requests.get.assert_called_with(DL_URL_5Y, stream=True)
+
+
+def test_update_omni(mocker, capsys, tmpdir):
+	mocker.patch("spaceweather.omni.LOCAL_PATH", str(tmpdir))
+	dl = mocker.patch("spaceweather.cli._dl_file")
+	path = tmpdir.join("omni2_2000.dat")
+	path.write("")
+	status, ret = _run(capsys, "update", "-s", "omni", "-y", "2000")
+	assert status == 0
+	assert not dl.called
+	mtime = time.time() - 2 * 86400
+	os.utime(str(path), (mtime, mtime))
+	status, ret = _run(capsys, "update", "-s", "omni", "-y", "2000")
+	assert status == 0
+	dl.assert_called_once_with(str(path), OMNI_URL_BASE + "/omni2_2000.dat")
+
+
+def test_omni_compressed(mocker, capsys, tmpdir):
+	import gzip
+	mocker.patch("spaceweather.omni.LOCAL_PATH", str(tmpdir))
+	mocker.patch("spaceweather.omni.OMNI_PREFIX", "omni2t")
+	fname = os.path.join("tests", "omni2t_2000.dat")
+	path = os.path.join(str(tmpdir), "omni2t_2000.dat.gz")
+	with open(fname, "rb") as fp, gzip.open(path, "wb") as fc:
+		fc.write(fp.read())
+	status, ret = _run(capsys, "status", "-s", "omni")
+	assert status == 0
+	files = ret["sources"]["omni"]["files"]
+	assert [_f["path"] for _f in files] == [path]
+	with open(fname) as fp:
+		last = [_l.strip() for _l in fp if _l.strip()][-1]
+	assert files[0]["last_data_line"] == last
+	snapshot = os.path.join(str(tmpdir), "snapshot.npz")
+	status, ret = _run(capsys, "snapshot", "export", snapshot, "-s", "omni")
+	assert status == 0
+	assert list(ret["sources"].keys()) == ["omni_2000"]
+	assert ret["sources"]["omni_2000"]["files"][0]["name"] == "omni2t_2000.dat.gz"
+
+
+def test_warm_convert(mocker, capsys, tmpdir):
+	snapshot = os.path.join(str(tmpdir), "snapshot.npz")
+	mocker.patch("spaceweather.cli.SNAPSHOT_PATH", snapshot)
+	status, ret = _run(capsys, "warm", "-s", "celestrak")
+	assert status == 0
+	df = sw_daily()
+	assert ret["sources"]["celestrak"]["rows"] == len(df)
+	assert ret["sources"]["celestrak"]["snapshot"] == snapshot
+	out = os.path.join(str(tmpdir), "sw.csv")
+	status, ret = _run(capsys, "convert", "-s", "celestrak", "-f", "csv", "-o", out)
+	assert status == 0
+	conv = pd.read_csv(out, index_col=0, parse_dates=True)
+	pd.testing.assert_frame_equal(conv, df, check_dtype=False, check_index_type=False)
+	# served from the installed snapshot
+	import_snapshot(snapshot)
+	try:
+		read = mocker.patch("spaceweather.celestrak.read_sw")
+		pd.testing.assert_frame_equal(sw_daily(), df)
+		assert not read.called
+	finally:
+		import_snapshot(None)
+
+
+def test_bench(capsys):
+	status, ret = _run(capsys, "bench", "-s", "celestrak", "-n", "1")
+	assert status == 0
+	res = ret["sources"]["celestrak"]
+	assert sorted(res["parse"].keys()) == ["SW-All.txt", "SW-Last5Years.txt"]
+	assert res["load"]["min"] > 0
+
+
+def test_error(mocker, capsys, tmpdir):
+	mocker.patch("requests.get")
+	mocker.patch("spaceweather.omni.LOCAL_PATH", str(tmpdir))
+	mocker.patch(
+		"spaceweather.cli.SNAPSHOT_PATH", os.path.join(str(tmpdir), "snapshot.npz"),
+	)
+	status, ret = _run(capsys, "warm", "-s", "celestrak", "omni")
+	assert status == 1
+	assert not ret["ok"]
+	assert ret["sources"]["celestrak"]["ok"]
+	assert ret["sources"]["omni"]["error"].startswith("OSError")
+	with pytest.raises(SystemExit):
+		main(["convert", "-s", "celestrak"])
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Combined data tests
+
+Multi-source data on a common time grid.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import (
+	ap_kp_3h, gfz_3h, gfz_daily, gfz_hp30, load_combined, omnie_hourly,
+	read_gfz_hp, sw_daily,
+)
+from spaceweather.combined import _SOURCES, _load_hp
+
+GFZ_PATHS = {
+	"gfzpath_all": os.path.join("tests", "Kp_ap_Ap_SN_F107_since_2024.txt"),
+	"gfzpath_30d": os.path.join("tests", "Kp_ap_Ap_SN_F107_nowcast.txt"),
+}
+HP30_PATHS = {
+	"gfzpath_all": os.path.join("tests", "Hp30_ap30_complete_series.txt"),
+	"gfzpath_30d": os.path.join("tests", "Hp30_ap30_nowcast.txt"),
+}
+OMNI_KWARGS = {"local_path": os.path.join(".", "tests"), "prefix": "omni2t"}
+
+
+def test_omni_celestrak():
+	sources = {"celestrak": {}, "celestrak_daily": {}, "omni": OMNI_KWARGS}
+	df = load_combined(sources, "2000-01-01", "2000-01-10 21:00", max_workers=3)
+	idx = pd.date_range("2000-01-01 01:30", "2000-01-10 22:30", freq="3h")
+	np.testing.assert_array_equal(df.index, idx)
+	assert "Kp" in df.columns and "Dst" in df.columns and "f107_obs" in df.columns
+	# Kp from celestrak, and the daily F10.7 repeated for the 3h intervals
+	np.testing.assert_allclose(df["Kp"], ap_kp_3h().loc[idx, "Kp"])
+	sw = sw_daily().loc["2000-01-01":"2000-01-10"]
+	np.testing.assert_allclose(
+		df["f107_obs"], np.repeat(sw["f107_obs"].values, 8),
+	)
+	# hourly Dst averaged over the 3h intervals
+	omni = omnie_hourly(2000, **OMNI_KWARGS)
+	np.testing.assert_allclose(
+		df["Dst"].values[:2],
+		[omni["Dst"].iloc[:3].mean(), omni["Dst"].iloc[3:6].mean()],
+	)
+	# OMNI first, filled from celestrak after the end of the OMNI test data
+	omni_first = load_combined(
+		sources, "2000-01-01", "2000-01-10 21:00",
+		precedence={"Kp": ["omni"]}, max_workers=1,
+	)
+	np.testing.assert_allclose(omni_first["Kp"][:8], omni["Kp"].values[:24:3])
+	pd.testing.assert_frame_equal(omni_first, df)
+
+
+def test_precedence(monkeypatch):
+	idx = pd.date_range("2001-01-01", periods=16, freq="90min")
+	a = pd.DataFrame({"x": np.arange(16.), "y": 1.}, index=idx)
+	a.iloc[8:, 0] = np.nan
+	b = pd.DataFrame({"x": -np.arange(16.), "z": 2.}, index=idx)
+	monkeypatch.setitem(_SOURCES, "a", lambda start, end: a)
+	monkeypatch.setitem(_SOURCES, "b", lambda start, end: b)
+	kwargs = dict(start="2001-01-01", end="2001-01-01 21:00", how="max")
+	df = load_combined(["a", "b"], **kwargs)
+	assert list(df.columns) == ["x", "y", "z"]
+	np.testing.assert_allclose(df["x"], [1, 3, 5, 7, -8, -10, -12, -14])
+	df = load_combined(["a", "b"], precedence={"x": ["b"]}, **kwargs)
+	np.testing.assert_allclose(df["x"], [0, -2, -4, -6, -8, -10, -12, -14])
+	df = load_combined(["b", "a"], **kwargs)
+	np.testing.assert_allclose(df["x"], [0, -2, -4, -6, -8, -10, -12, -14])
+	assert list(df.columns) == ["x", "z", "y"]
+
+
+def test_gfz_hp30(mocker):
+	sources = {"gfz": GFZ_PATHS, "celestrak": {}, "hp30": HP30_PATHS}
+	m_hp = mocker.Mock(wraps=gfz_hp30)
+	mocker.patch.dict(_SOURCES, {"hp30": _load_hp(m_hp, "30")})
+	df = load_combined(sources, "2024-02-10", "2025-06-30", how={"Hp30": "max"})
+	# the time window is read, not the whole series
+	assert m_hp.call_args[1]["start"] == pd.Timestamp("2024-02-10")
+	assert m_hp.call_args[1]["end"] == pd.Timestamp("2025-06-30 03:00")
+	# GFZ first, filled from celestrak after the end of the GFZ test data
+	gfz = gfz_3h(**GFZ_PATHS)
+	gfz = gfz[gfz["Kp"] >= 0]
+	gfz = gfz.loc["2024-02-10":]
+	np.testing.assert_allclose(df.loc[gfz.index, "Kp"], gfz["Kp"])
+	after = df.index[(df.index > gfz.index[-1]) & (df.index < "2025-06-01")]
+	np.testing.assert_allclose(df.loc[after, "Kp"], ap_kp_3h().loc[after, "Kp"])
+	# Hp30 maxima over the 3h intervals
+	hp = read_gfz_hp(HP30_PATHS["gfzpath_all"])
+	hp = hp.loc["2025-06-20":"2025-06-20 02:59", "Hp"]
+	assert df.loc["2025-06-20 01:30", "Hp30"] == pytest.approx(hp[hp >= 0].max())
+	assert np.isnan(df.loc["2024-03-01 01:30", "Hp30"])
+	with pytest.raises(ValueError):
+		load_combined(["foo"], "2024-01-01", "2024-01-02")
+
+
+def test_gfz_daily():
+	sources = {"gfz_daily": GFZ_PATHS}
+	df = load_combined(sources, "2024-01-01", "2024-01-10 21:00")
+	assert list(df.columns) == ["f107_obs", "f107_adj", "isn"]
+	daily = gfz_daily(**GFZ_PATHS).loc["2024-01-01":"2024-01-10"]
+	np.testing.assert_allclose(df["isn"], np.repeat(daily["isn"].values, 8))
+	np.testing.assert_allclose(df["f107_obs"], np.repeat(daily["f107_obs"].values, 8))
+
+
+def test_range():
+	# a single grid point
+	df = load_combined(["celestrak"], "2024-01-02", "2024-01-02")
+	assert len(df) == 1
+	assert df.index[0] == pd.Timestamp("2024-01-02 01:30")
+	assert df["Kp"].iloc[0] == ap_kp_3h().loc["2024-01-02 01:30", "Kp"]
+	# the data range of the sources
+	sources = {"gfz_daily": GFZ_PATHS, "omni": OMNI_KWARGS}
+	df = load_combined(sources, cadence="1D")
+	daily = gfz_daily(**GFZ_PATHS)[["f107_obs", "f107_adj", "isn"]]
+	daily = daily[(daily >= 0).any(axis=1)]
+	assert df.index[0] == omnie_hourly(2000, **OMNI_KWARGS).index[0]
+	assert df.index[-1] == daily.index[-1]
+	np.testing.assert_allclose(df.loc[daily.index, "isn"], daily["isn"])
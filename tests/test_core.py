@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Core function tests
+
+Merging of historic and recent data, concurrent loading and downloading.
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+import spaceweather as sw
+from spaceweather.celestrak import read_sw
+from spaceweather.core import (
+	_compression, _dl_file, _dl_range, _merge_frames, _open_text,
+	_resource_filepath, _single_flight,
+)
+
+
+def _frame(start, periods, value, flag):
+	idx = pd.date_range(start, periods=periods, freq="1D")
+	return pd.DataFrame(
+		{"x": np.full(periods, value, dtype=np.int32), "D": flag},
+		index=idx,
+	)
+
+
+@pytest.mark.parametrize(
+	"new_start, new_periods",
+	[
+		("2000-01-08", 5),  # overlap
+		("2000-01-11", 3),  # adjacent
+		("2000-01-15", 3),  # gap
+		("2000-01-03", 3),  # contained
+		("1999-12-25", 30),  # containing
+	],
+)
+def test_merge(new_start, new_periods):
+	old = _frame("2000-01-01", 10, 1, 1)
+	new = _frame(new_start, new_periods, 2, 0)
+	new.iloc[-1:, 1] = 1
+	ret = _merge_frames(old, new, rank="D")
+	ref = pd.concat([old, new]).sort_values("D", kind="stable")
+	ref = ref[~ref.index.duplicated(keep="last")].sort_index()
+	pd.testing.assert_frame_equal(ret, ref, check_freq=False)
+	assert ret["x"].dtype == np.int32
+	# equal ranks prefer the new data
+	ret = _merge_frames(old, new)
+	ref = pd.concat([old, new])
+	ref = ref[~ref.index.duplicated(keep="last")].sort_index()
+	pd.testing.assert_frame_equal(ret, ref, check_freq=False)
+
+
+def _run_threads(func, n):
+	# runs `func` in `n` threads starting at the same time
+	barrier = threading.Barrier(n)
+	results = [None] * n
+
+	def _run(i):
+		barrier.wait()
+		results[i] = func()
+
+	threads = [threading.Thread(target=_run, args=(_i,)) for _i in range(n)]
+	for _t in threads:
+		_t.start()
+	for _t in threads:
+		_t.join()
+	return results
+
+
+def test_single_flight_loader(mocker):
+	calls = []
+
+	def _slow_read(swpath):
+		calls.append(swpath)
+		time.sleep(0.2)
+		return read_sw(swpath)
+
+	mocker.patch("spaceweather.celestrak.read_sw", side_effect=_slow_read)
+	results = _run_threads(sw.sw_daily, 16)
+	# one parse of each of the two files
+	assert len(calls) == 2
+	for df in results[1:]:
+		pd.testing.assert_frame_equal(df, results[0])
+	# the results are independent
+	results[1].iloc[0, 0] = -9999
+	assert results[0].iloc[0, 0] != -9999
+	# later calls parse again
+	sw.sw_daily()
+	assert len(calls) == 4
+
+
+def test_single_flight_error():
+	calls = []
+
+	@_single_flight
+	def _fail(x):
+		calls.append(x)
+		time.sleep(0.1)
+		raise ValueError(x)
+
+	def _call():
+		try:
+			_fail(1)
+		except ValueError as e:
+			return e
+	results = _run_threads(_call, 8)
+	assert len(calls) == 1
+	assert all(isinstance(_r, ValueError) for _r in results)
+
+
+class _SlowResponse(object):
+	status_code = 200
+
+	def __init__(self, content):
+		self.content = content
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		return False
+
+	def iter_content(self, chunk_size=1):
+		for i in range(0, len(self.content), chunk_size):
+			time.sleep(0.001)
+			yield self.content[i:i + chunk_size]
+
+
+def test_atomic_download(mocker, tmpdir):
+	fname = os.path.join(str(tmpdir), "data.txt")
+	contents = [
+		("{0}".format(_i) * 1024 * 64).encode() for _i in range(1, 5)
+	]
+	with open(fname, "wb") as fp:
+		fp.write(contents[0])
+	responses = iter(contents[1:])
+	mocker.patch(
+		"requests.get",
+		side_effect=lambda url, **kwargs: _SlowResponse(next(responses)),
+	)
+	done = threading.Event()
+
+	def _download():
+		for _ in contents[1:]:
+			_dl_file(fname, "http://example.com/data.txt")
+		done.set()
+
+	seen = set()
+	thread = threading.Thread(target=_download)
+	thread.start()
+	while not done.is_set():
+		with open(fname, "rb") as fp:
+			seen.add(fp.read())
+	thread.join()
+	# only complete files were read
+	assert seen.issubset(set(contents))
+	with open(fname, "rb") as fp:
+		assert fp.read() == contents[-1]
+	assert os.listdir(str(tmpdir)) == ["data.txt"]
+
+
+def _compressor(fmt):
+	if fmt == "gzip":
+		import gzip
+		return gzip.compress
+	if fmt == "xz":
+		import lzma
+		return lzma.compress
+	zstd = pytest.importorskip("zstandard")
+	return zstd.ZstdCompressor().compress
+
+
+@pytest.mark.parametrize("fmt, ext", [("gzip", ".gz"), ("xz", ".xz"), ("zstd", ".zst")])
+def test_compressed_download(mocker, tmpdir, fmt, ext):
+	_compressor(fmt)
+	content = b"".join(
+		"{0:04d} data line\n".format(_i).encode() for _i in range(1000)
+	)
+	mocker.patch(
+		"requests.get",
+		side_effect=lambda url, **kwargs: _SlowResponse(content),
+	)
+	fname = os.path.join(str(tmpdir), "data.txt" + ext)
+	_dl_file(fname, "http://example.com/data.txt")
+	assert _compression(fname) == fmt
+	with _open_text(fname) as fp:
+		assert fp.read() == content.decode()
+	assert os.path.getsize(fname) < len(content)
+	assert os.listdir(str(tmpdir)) == ["data.txt" + ext]
+
+
+@pytest.mark.parametrize("fmt", ["gzip", "xz", "zstd"])
+def test_compressed_readers(tmpdir, fmt):
+	compress = _compressor(fmt)
+
+	def _compressed(fname):
+		# compressed copy without compression extension,
+		# detected from the file contents
+		path = os.path.join(str(tmpdir), os.path.basename(fname))
+		with open(fname, "rb") as fp, open(path, "wb") as fc:
+			fc.write(compress(fp.read()))
+		return path
+
+	gfz = os.path.join("tests", "Kp_ap_Ap_SN_F107_since_2024.txt")
+	pd.testing.assert_frame_equal(sw.read_gfz(_compressed(gfz)), sw.read_gfz(gfz))
+	assert sw.get_gfz_age(_compressed(gfz), relative=False) == sw.get_gfz_age(gfz, relative=False)
+	hp = os.path.join("tests", "Hp30_ap30_complete_series.txt")
+	pd.testing.assert_frame_equal(sw.read_gfz_hp(_compressed(hp)), sw.read_gfz_hp(hp))
+	hpc = _compressed(hp)
+	kwargs = dict(start="2024-01-02", end="2024-01-03", gfzpath_30d=hp)
+	pd.testing.assert_frame_equal(
+		sw.gfz_hp30(gfzpath_all=hpc, **kwargs), sw.gfz_hp30(gfzpath_all=hp, **kwargs),
+	)
+	swf = sw.SW_PATH_5Y
+	pd.testing.assert_frame_equal(read_sw(_compressed(swf)), read_sw(swf))
+	assert sw.get_file_age(_compressed(swf), relative=False) == sw.get_file_age(swf, relative=False)
+	csv = os.path.join("tests", "SW-Last5Years.csv")
+	pd.testing.assert_frame_equal(sw.read_sw_csv(_compressed(csv)), sw.read_sw_csv(csv))
+	omni = os.path.join("tests", "omni2t_2000.dat")
+	pd.testing.assert_frame_equal(sw.read_omnie(_compressed(omni)), sw.read_omnie(omni))
+
+
+class _Response(_SlowResponse):
+	def __init__(self, content, status_code=200):
+		self.content = content
+		self.status_code = status_code
+
+	def close(self):
+		pass
+
+
+def test_mirrors(mocker, monkeypatch, tmpdir):
+	import requests
+
+	def _get(url, **kwargs):
+		if url.startswith("http://down"):
+			raise requests.ConnectionError("down")
+		if url.startswith("http://empty"):
+			return _Response(b"", 404)
+		return _Response(url.encode())
+
+	get = mocker.patch("requests.get", side_effect=_get)
+	monkeypatch.setenv("SPACEWEATHER_MIRRORS", " ".join([
+		"http://down.example.org,",
+		"http://empty.example.org/sw/",
+		"http://mirror.example.org/sw",
+	]))
+	fname = os.path.join(str(tmpdir), "data.txt")
+	_dl_file(fname, "http://example.com/files/data.txt")
+	with open(fname, "rb") as fp:
+		assert fp.read() == b"http://mirror.example.org/sw/data.txt"
+	assert [_c[0][0] for _c in get.call_args_list] == [
+		"http://down.example.org/data.txt",
+		"http://empty.example.org/sw/data.txt",
+		"http://mirror.example.org/sw/data.txt",
+	]
+	# the original url after all mirrors failed
+	monkeypatch.setenv("SPACEWEATHER_MIRRORS", "http://down.example.org")
+	_dl_file(fname, "http://example.com/files/data.txt")
+	with open(fname, "rb") as fp:
+		assert fp.read() == b"http://example.com/files/data.txt"
+	# range requests
+	monkeypatch.setenv("SPACEWEATHER_MIRRORS", "http://empty.example.org http://mirror.example.org")
+	assert _dl_range("http://example.com/files/data.txt", 7) == b"mirror.example.org/data.txt"
+	assert get.call_args[0][0] == "http://mirror.example.org/data.txt"
+	assert get.call_args[1]["headers"] == {"Range": "bytes=7-"}
+
+
+def test_data_dir(monkeypatch, tmpdir):
+	data_dir = os.path.join(str(tmpdir), "data")
+	monkeypatch.setenv("SPACEWEATHER_DATA_DIR", data_dir)
+	path = _resource_filepath("SW-Last5Years.txt")
+	assert path == os.path.join(data_dir, "SW-Last5Years.txt")
+	# seeded with the packaged file
+	with open(path, "rb") as fp, open(str(sw.SW_PATH_5Y), "rb") as fe:
+		assert fp.read() == fe.read()
+	assert _resource_filepath("omni_extended") == os.path.join(data_dir, "omni_extended")
+	assert sorted(os.listdir(data_dir)) == ["SW-Last5Years.txt"]
+	# keeps the file times for the age checks
+	assert os.path.getmtime(path) == os.path.getmtime(str(sw.SW_PATH_5Y))
+	# the module paths
+	out = subprocess.check_output([
+		sys.executable, "-c",
+		"import spaceweather as sw; print(sw.SW_PATH_ALL); print(sw.GFZ_PATH_30D)",
+	])
+	assert out.decode().split() == [
+		os.path.join(data_dir, "SW-All.txt"),
+		os.path.join(data_dir, "Kp_ap_Ap_SN_F107_nowcast.txt"),
+	]
+	assert os.path.exists(os.path.join(data_dir, "SW-All.txt"))
+	# not usable, e.g. below a file
+	tmpdir.join("file").write("")
+	monkeypatch.setenv("SPACEWEATHER_DATA_DIR", os.path.join(str(tmpdir), "file", "data"))
+	with pytest.warns(UserWarning):
+		path = _resource_filepath("SW-Last5Years.txt")
+	assert path == sw.SW_PATH_5Y
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Coupling function tests
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import (
+	akasofu_epsilon, borovsky_rate, coupling_functions,
+	kan_lee_efield, newell_dphidt, omnie_hourly, omnie_mask_missing,
+)
+
+_TEST_PATH = os.path.join(".", "tests")
+
+
+@pytest.fixture(scope="module")
+def df_o():
+	return omnie_hourly(2000, local_path=_TEST_PATH, prefix="omni2t")
+
+
+def test_southward():
+	# purely southward IMF, sin(θ/2) = 1
+	v, by, bz = 400., 0., -5.
+	np.testing.assert_allclose(newell_dphidt(v, by, bz), 400**(4. / 3) * 5**(2. / 3))
+	np.testing.assert_allclose(kan_lee_efield(v, by, bz), 2.)
+	np.testing.assert_allclose(
+		akasofu_epsilon(v, by, bz, 5.),
+		1e7 * 4e5 * 25e-18 * (7 * 6371.2e3)**2,
+	)
+	# no coupling for northward IMF
+	for func in [newell_dphidt, kan_lee_efield]:
+		assert func(v, 0., 5.) == 0.
+	assert akasofu_epsilon(v, 0., 5., 5.) == 0.
+	assert borovsky_rate(v, 0., 5., 5., 5.) == 0.
+	assert borovsky_rate(v, by, bz, 5., 5.) > 0.
+
+
+def test_coupling(df_o):
+	dfm = omnie_mask_missing(df_o)
+	ret = coupling_functions(df_o)
+	assert list(ret.columns) == ["newell", "epsilon", "kan_lee", "borovsky"]
+	np.testing.assert_allclose(
+		ret["newell"],
+		newell_dphidt(dfm["v_plasma"], dfm["B_y_GSM"], dfm["B_z_GSM"]),
+	)
+	np.testing.assert_allclose(
+		ret["borovsky"],
+		borovsky_rate(
+			dfm["v_plasma"], dfm["B_y_GSM"], dfm["B_z_GSM"], dfm["B_mag"],
+			dfm["n_p"], dfm["mach"], dfm["mach_mag"],
+		),
+	)
+	# the missing values in the last row
+	assert ret.iloc[-1].isna().all()
+	assert ret.iloc[:-1].notna().all().all()
+	# chunked and single precision
+	ret32 = coupling_functions(
+		df_o, functions=["kan_lee", "newell"], dtype=np.float32, chunksize=4,
+	)
+	assert (ret32.dtypes == np.float32).all()
+	np.testing.assert_allclose(ret32, ret[["kan_lee", "newell"]], rtol=1e-5)
+	with pytest.raises(ValueError):
+		coupling_functions(df_o, functions=["foo"])
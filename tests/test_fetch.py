@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Space weather index download and parse tests
+
+Parsing while downloading from a local http server.
+"""
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import requests
+
+import pytest
+
+from spaceweather import (
+	fetch_gfz, fetch_gfz_hp, fetch_omnie, fetch_sw,
+	read_gfz, read_gfz_hp, read_omnie, read_sw, read_sw_csv,
+)
+from spaceweather.celestrak import SW_FILE_5Y, SW_PATH_5Y
+from spaceweather.core import _compression, _fetch
+
+TESTS = os.path.abspath("tests")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+	def log_message(self, *args):
+		pass
+
+
+def _serve(directory):
+	handler = functools.partial(_QuietHandler, directory=directory)
+	server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+	thread = threading.Thread(target=server.serve_forever)
+	thread.daemon = True
+	thread.start()
+	return server, "http://{0}:{1}".format(*server.server_address[:2])
+
+
+@pytest.fixture(scope="module")
+def url():
+	server, url = _serve(TESTS)
+	yield url
+	server.shutdown()
+	server.server_close()
+
+
+def _same_file(path, fname):
+	with open(path, "rb") as fp, open(os.path.join(TESTS, fname), "rb") as fe:
+		return fp.read() == fe.read()
+
+
+def test_fetch_gfz(url, tmpdir):
+	fname = "Kp_ap_Ap_SN_F107_since_2024.txt"
+	path = os.path.join(str(tmpdir), fname)
+	df = fetch_gfz(gfzpath=path, url=url + "/" + fname)
+	pd.testing.assert_frame_equal(df, read_gfz(os.path.join(TESTS, fname)))
+	assert _same_file(path, fname)
+	assert os.listdir(str(tmpdir)) == [fname]
+
+
+def test_fetch_gfz_hp(url, tmpdir):
+	fname = "Hp30_ap30_complete_series.txt"
+	path = os.path.join(str(tmpdir), fname + ".gz")
+	df = fetch_gfz_hp(gfzhppath=path, url=url + "/" + fname)
+	pd.testing.assert_frame_equal(df, read_gfz_hp(os.path.join(TESTS, fname)))
+	assert _compression(path) == "gzip"
+	pd.testing.assert_frame_equal(read_gfz_hp(path), df)
+
+
+def test_fetch_sw(tmpdir):
+	server, url = _serve(os.path.dirname(str(SW_PATH_5Y)))
+	path = os.path.join(str(tmpdir), SW_FILE_5Y)
+	try:
+		df = fetch_sw(swpath=path, url=url + "/" + SW_FILE_5Y)
+	finally:
+		server.shutdown()
+		server.server_close()
+	pd.testing.assert_frame_equal(df, read_sw(SW_PATH_5Y))
+	with open(path, "rb") as fp, open(SW_PATH_5Y, "rb") as fe:
+		assert fp.read() == fe.read()
+
+
+def test_fetch_sw_csv(url, tmpdir):
+	fname = "SW-Last5Years.csv"
+	path = os.path.join(str(tmpdir), fname)
+	df = fetch_sw(swpath=path, url=url + "/" + fname)
+	pd.testing.assert_frame_equal(df, read_sw_csv(os.path.join(TESTS, fname)))
+	assert _same_file(path, fname)
+
+
+def test_fetch_omnie(url, tmpdir):
+	df = fetch_omnie(2000, prefix="omni2t", local_path=str(tmpdir), url_base=url + "/")
+	pd.testing.assert_frame_equal(df, read_omnie(os.path.join(TESTS, "omni2t_2000.dat")))
+	assert _same_file(os.path.join(str(tmpdir), "omni2t_2000.dat"), "omni2t_2000.dat")
+
+
+def test_fetch_fallback(url, tmpdir):
+	fname = "Kp_ap_Ap_SN_F107_nowcast.txt"
+	path = os.path.join(str(tmpdir), fname)
+	with pytest.raises(IOError):
+		with pytest.warns(UserWarning):
+			fetch_gfz(gfzpath=path, url=url + "/missing.txt")
+	with open(os.path.join(TESTS, fname), "rb") as fp:
+		tmpdir.join(fname).write_binary(fp.read())
+	with pytest.warns(UserWarning):
+		df = fetch_gfz(gfzpath=path, url=url + "/missing.txt")
+	pd.testing.assert_frame_equal(df, read_gfz(path))
+
+
+def test_fetch_parse_error(url, tmpdir):
+	fname = "Kp_ap_Ap_SN_F107_nowcast.txt"
+	path = os.path.join(str(tmpdir), fname)
+
+	def _fail(fp):
+		fp.readline()
+		raise ValueError("parse error")
+
+	with pytest.raises(ValueError):
+		_fetch(path, url + "/" + fname, _fail)
+	# the partial download is removed
+	assert os.listdir(str(tmpdir)) == []
+
+
+def test_fetch_offline(mocker, tmpdir):
+	fname = "Kp_ap_Ap_SN_F107_nowcast.txt"
+	path = os.path.join(str(tmpdir), fname)
+	with open(os.path.join(TESTS, fname), "rb") as fp:
+		content = fp.read()
+	tmpdir.join(fname).write_binary(content)
+	expect = read_gfz(path)
+	mocker.patch("requests.get", side_effect=requests.ConnectionError("offline"))
+	with pytest.warns(UserWarning):
+		df = fetch_gfz(gfzpath=path, url="http://localhost/" + fname)
+	pd.testing.assert_frame_equal(df, expect)
+
+	# interrupted download
+	def _chunks(chunk_size=1):
+		yield content[:1000]
+		raise requests.exceptions.ChunkedEncodingError("interrupted")
+
+	response = mocker.Mock(status_code=200, iter_content=_chunks)
+	mocker.patch("requests.get", return_value=response)
+	with pytest.warns(UserWarning):
+		df = fetch_gfz(gfzpath=path, url="http://localhost/" + fname)
+	pd.testing.assert_frame_equal(df, expect)
+	assert os.listdir(str(tmpdir)) == [fname]
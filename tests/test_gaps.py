@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Gap filling tests
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import fill_gaps, omnie_hourly, omnie_mask_missing
+
+_TEST_PATH = os.path.join(".", "tests")
+
+
+@pytest.fixture(scope="module")
+def df_gaps():
+	rng = np.random.default_rng(42)
+	values = rng.normal(size=(500, 20))
+	values[rng.random(values.shape) < 0.3] = np.nan
+	values[:20, 3] = np.nan
+	values[-20:, 5] = np.nan
+	return pd.DataFrame(
+		values, index=pd.date_range("2000-01-01", periods=500, freq="1h"),
+		columns=["c{0}".format(_i) for _i in range(20)],
+	)
+
+
+def test_linear(df_gaps):
+	ret, mask = fill_gaps(df_gaps, return_mask=True)
+	expected = df_gaps.interpolate(limit_area="inside")
+	pd.testing.assert_frame_equal(ret, expected)
+	pd.testing.assert_frame_equal(mask, df_gaps.isna() & expected.notna())
+
+
+def test_nearest(df_gaps):
+	ret = fill_gaps(df_gaps, method="nearest")
+	pos = pd.DataFrame(
+		np.arange(len(df_gaps))[:, None].repeat(df_gaps.shape[1], axis=1),
+		index=df_gaps.index, columns=df_gaps.columns,
+	).where(df_gaps.notna())
+	# distances to the previous and next valid values, ties use the previous
+	use_prev = (pos.ffill().rsub(np.arange(len(df_gaps)), axis=0)
+		<= pos.bfill().sub(np.arange(len(df_gaps)), axis=0))
+	expected = df_gaps.ffill().where(use_prev, df_gaps.bfill())
+	expected = expected.where(df_gaps.ffill().notna() & df_gaps.bfill().notna())
+	pd.testing.assert_frame_equal(ret, expected)
+
+
+def test_persistence(df_gaps):
+	ret = fill_gaps(df_gaps, method="persistence")
+	pd.testing.assert_frame_equal(ret, df_gaps.ffill())
+
+
+def test_max_gap():
+	values = np.array([1., np.nan, 3., np.nan, np.nan, 6., np.nan, np.nan, np.nan, 10.])
+	expected = np.array([1., 2., 3., 4., 5., 6., np.nan, np.nan, np.nan, 10.])
+	np.testing.assert_allclose(fill_gaps(values, max_gap=2), expected)
+	s = pd.Series(values, index=pd.date_range("2000-01-01", periods=10, freq="3h"))
+	np.testing.assert_allclose(fill_gaps(s, max_gap="6h"), expected)
+	# in place for float arrays
+	ret, mask = fill_gaps(values, max_gap=2, inplace=True, return_mask=True)
+	assert ret is values
+	np.testing.assert_allclose(values, expected)
+	np.testing.assert_array_equal(np.nonzero(mask)[0], [1, 3, 4])
+
+
+def test_omni():
+	df = omnie_hourly(2000, local_path=_TEST_PATH, prefix="omni2t")
+	df = pd.concat([df.iloc[:5], df.iloc[-1:], df.iloc[5:-1]])
+	df.index = pd.date_range("2000-01-01", periods=len(df), freq="1h")
+	ret, mask = fill_gaps(
+		df, columns=["Dst", "B_z_GSM"], missing="omni", return_mask=True,
+	)
+	expected = omnie_mask_missing(df)[["Dst", "B_z_GSM"]].interpolate()
+	pd.testing.assert_frame_equal(ret[["Dst", "B_z_GSM"]], expected)
+	assert mask.sum().tolist() == [1, 1]
+	# the other columns are unchanged
+	pd.testing.assert_series_equal(ret["Kp"], df["Kp"])
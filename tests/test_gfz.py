@@ -21,9 +21,12 @@ import requests
 import pytest
 
 from spaceweather import (
-	gfz_3h, gfz_daily, get_gfz_age, update_gfz,
+	gfz_3h, gfz_daily, gfz_hp30, gfz_hp60, get_gfz_age, update_gfz,
+)
+from spaceweather.gfz import (
+	GFZ_URL_30D, HP30_URL_30D, HP60_URL_30D,
+	HpNowcastFollower, read_gfz_hp,
 )
-from spaceweather.gfz import GFZ_URL_30D, HP30_URL_30D, HP60_URL_30D
 
 GFZ_PATH_ALL = os.path.join("tests", "Kp_ap_Ap_SN_F107_since_2024.txt")
 GFZ_PATH_30D = os.path.join("tests", "Kp_ap_Ap_SN_F107_nowcast.txt")
@@ -107,6 +110,46 @@ def test_daily():
 	)
 
 
+def test_daily_snapshot(mocker):
+	# only the standard format is served from the "gfz" snapshot
+	m_snap = mocker.patch("spaceweather.gfz._from_snapshot", return_value=None)
+	gfz_daily(gfzpath_all=GFZ_PATH_ALL, gfzpath_30d=GFZ_PATH_30D)
+	assert m_snap.call_count == 1
+	gfz_daily(
+		gfzpath_all=HP30_PATH_ALL, gfzpath_30d=HP30_PATH_30D, gfz_format="hp30",
+	)
+	assert m_snap.call_count == 1
+
+
+def test_daily_f107_avg():
+	df = gfz_daily(
+		gfzpath_all=GFZ_PATH_ALL, gfzpath_30d=GFZ_PATH_30D, f107_avg=True,
+	)
+	for _n in ["obs", "adj"]:
+		f107 = df["f107_" + _n].where(df["f107_" + _n] >= 0)
+		np.testing.assert_allclose(
+			df["f107_81ctr_" + _n],
+			f107.rolling(81, center=True, min_periods=1).mean(),
+		)
+		np.testing.assert_allclose(
+			df["f107_81lst_" + _n],
+			f107.rolling(81, min_periods=1).mean(),
+		)
+		np.testing.assert_allclose(
+			df["f107_27bsrn_" + _n],
+			f107.groupby(df["bsrn"]).transform("mean"),
+		)
+	# the averages need the F10.7 columns of the standard format
+	for fmt, (fall, f30d) in [
+		("hp30", (HP30_PATH_ALL, HP30_PATH_30D)),
+		("hp60", (HP60_PATH_ALL, HP60_PATH_30D)),
+	]:
+		with pytest.raises(ValueError):
+			gfz_daily(
+				gfzpath_all=fall, gfzpath_30d=f30d, gfz_format=fmt, f107_avg=True,
+			)
+
+
 @pytest.mark.parametrize(
 	"name, result",
 	[
@@ -173,3 +216,104 @@ def test_daily_hp(fpall, fp30d, index, expected, request):
 		np.array(expected, dtype=np.float64),
 		rtol=1e-6,
 	)
+
+
+@pytest.mark.parametrize(
+	"func, fpall, fp30d",
+	[
+		(gfz_hp30, HP30_PATH_ALL, HP30_PATH_30D),
+		(gfz_hp60, HP60_PATH_ALL, HP60_PATH_30D),
+	],
+	ids=["Hp30", "Hp60"],
+)
+def test_gfz_hp(func, fpall, fp30d, request):
+	_gfz_fmt = request.node.callspec.id.lower()
+	kwargs = dict(gfzpath_all=fpall, gfzpath_30d=fp30d)
+	df = func(**kwargs)
+	pd.testing.assert_frame_equal(df, gfz_daily(gfz_format=_gfz_fmt, **kwargs))
+	for start, end in [
+		("2025-06-20 10:00", "2025-07-10 00:30"),
+		("2025-07-14 23:59", None),
+		(None, "2025-06-17 01:00"),
+		("2020-01-01 00:00", "2020-02-01 00:00"),
+	]:
+		pd.testing.assert_frame_equal(
+			func(start, end, **kwargs), df.loc[start:end],
+		)
+	start, end = "2025-07-01 00:00", "2025-07-02 00:00"
+	ret = func(start, end, columns=["Hp"], raw=True, **kwargs)
+	assert sorted(ret.keys()) == ["Hp", "time"]
+	np.testing.assert_array_equal(
+		ret["time"], df.loc[start:end].index.values,
+	)
+	np.testing.assert_array_equal(
+		ret["Hp"], df.loc[start:end, "Hp"].values,
+	)
+
+
+class _RangeResponse(object):
+	def __init__(self, content, headers):
+		_range = headers.get("Range", "bytes=0-")
+		start, end = _range[len("bytes="):].split("-")
+		start = int(start)
+		end = int(end) + 1 if end else None
+		if start >= len(content):
+			self.status_code = 416
+			self.content = b""
+		else:
+			self.status_code = 206
+			self.content = content[start:end]
+
+
+def test_nowcast_follower(mocker):
+	with open(HP30_PATH_30D, "rb") as fp:
+		lines = fp.read().splitlines(True)
+	header = [_l for _l in lines if _l.startswith(b"#")]
+	data = [_l for _l in lines if not _l.startswith(b"#")]
+	remote = {"content": b"".join(header + data)}
+
+	def _get(url, headers=None, **kwargs):
+		return _RangeResponse(remote["content"], headers or {})
+
+	mocker.patch("requests.get", side_effect=_get)
+	follower = HpNowcastFollower("hp30", url=HP30_URL_30D, interval="0s")
+	df0 = follower.poll()
+	ref = read_gfz_hp(HP30_PATH_30D)
+	pd.testing.assert_frame_equal(df0, ref[ref["Hp"] >= 0])
+	# Move the 30-day window by one day and fill in the missing values
+	n_miss = (ref["Hp"] < 0).sum()
+	new_data = data[48:-n_miss] + [
+		_l.replace(b"-1.000   -1", b" 2.333    9") for _l in data[-n_miss:]
+	]
+	remote["content"] = b"".join(header + new_data)
+	df1 = follower.poll()
+	assert len(df1) == n_miss
+	assert df1.index[0] == ref.index[-n_miss]
+	np.testing.assert_allclose(df1["ap"], 9)
+	# only the tail was requested, from the last known line on
+	_range = requests.get.call_args[1]["headers"]["Range"]
+	assert int(_range[len("bytes="):-1]) == len(
+		b"".join(header + new_data[:-n_miss - 1])
+	)
+	assert len(follower.df) == len(df0) + n_miss
+	# idle polls request the head and the last line only
+	for _ in range(3):
+		ncalls = requests.get.call_count
+		assert len(follower.poll()) == 0
+		assert requests.get.call_count == ncalls + 2
+		_range = requests.get.call_args[1]["headers"]["Range"]
+		assert int(_range[len("bytes="):-1]) == len(
+			b"".join(header + new_data[:-1])
+		)
+	# irregular files (a missing line) are read completely
+	remote["content"] = b"".join(header + new_data[:10] + new_data[11:])
+	ncalls = requests.get.call_count
+	assert len(follower.poll()) == 0
+	assert requests.get.call_count == ncalls + 3
+	assert requests.get.call_args[1]["headers"]["Range"] == "bytes=0-"
+	# iteration
+	follower = HpNowcastFollower(
+		"hp30", url=HP30_URL_30D, df=ref.iloc[:-n_miss - 2],
+	)
+	rows = [next(follower), next(follower)]
+	assert [_r.Index for _r in rows] == list(ref.index[-n_miss - 2:-n_miss])
@@ -10,6 +10,7 @@
 # See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
 """OMNI data read tests
 """
+import gzip
 import os
 import requests
 from posixpath import join as urljoin
@@ -112,3 +113,146 @@ def test_mask_missing(df_o):
 		dfp.index,
 	):
 		assert np.isnan(dfp[v])
+
+
+def _write_hro(path, start, periods, freq="1min", seed=1):
+	# synthetic HRO file with some fill values
+	from spaceweather.omni import _OMNI_HRO_COLUMNS, _OMNI_HRO_COLUMNS_5MIN
+	columns = _OMNI_HRO_COLUMNS
+	if freq == "5min":
+		columns = columns + _OMNI_HRO_COLUMNS_5MIN
+	rng = np.random.default_rng(seed)
+	times = pd.date_range(start, periods=periods, freq=freq)
+	lines = []
+	for _i, _t in enumerate(times):
+		fields = [
+			str(_t.year), str(_t.dayofyear), str(_t.hour), str(_t.minute),
+		]
+		for _n, _m in columns[4:]:
+			if _i % 7 == 3:
+				fields.append(str(_m))
+			elif isinstance(_m, int):
+				fields.append(str(int(rng.integers(0, 100))))
+			else:
+				fields.append("{0:.2f}".format(rng.normal()))
+		lines.append(" ".join(fields))
+	with open(path, "w") as fp:
+		fp.write("\n".join(lines) + "\n")
+	return times
+
+
+def test_omni_hro(tmpdir):
+	from spaceweather import read_omni_hro
+	fname = os.path.join(str(tmpdir), "omni_min2020.asc")
+	times = _write_hro(fname, "2020-01-01", 2000)
+	df = read_omni_hro(fname)
+	np.testing.assert_array_equal(df.index, times)
+	assert df.shape[1] == 46
+	assert df["B_z_GSM"].isna().sum() == len(range(3, 2000, 7))
+	assert df["SYM_H"].isna().sum() == len(range(3, 2000, 7))
+	raw = read_omni_hro(fname, mask_missing=False)
+	assert (raw["B_z_GSM"] == 9999.99).sum() == len(range(3, 2000, 7))
+	# projection and chunked parsing
+	df1 = read_omni_hro(fname, columns=["B_z_GSM", "v_plasma"], chunksize=333)
+	assert list(df1.columns) == ["year", "doy", "hour", "minute", "B_z_GSM", "v_plasma"]
+	pd.testing.assert_frame_equal(df1, df[df1.columns])
+	# downsampling while parsing
+	for freq, how in [("5min", "mean"), ("1h", "max"), ("1h", "count")]:
+		df2 = read_omni_hro(
+			fname, columns=["B_z_GSM", "AE"], freq=freq, how=how, chunksize=77,
+		)
+		expected = df[["B_z_GSM", "AE"]].astype(np.float64).resample(
+			freq, origin="epoch",
+		).agg(how)
+		np.testing.assert_allclose(df2[["B_z_GSM", "AE"]], expected)
+		np.testing.assert_array_equal(df2.index, expected.index)
+
+
+def test_omni_hro_single(tmpdir):
+	# single rows in the last interval and in the chunks
+	from spaceweather import read_omni_hro
+	for freq, periods in [("1min", 61), ("5min", 13)]:
+		fname = os.path.join(str(tmpdir), "omni_{0}.asc".format(freq))
+		_write_hro(fname, "2020-01-01", periods, freq=freq)
+		df = read_omni_hro(fname, columns=["AE"], freq="1h")
+		assert len(df) == 2
+		df = read_omni_hro(fname, columns=["AE"], freq="1h", chunksize=1)
+		assert len(df) == 2
+
+
+def test_omni_hro_range(mocker, tmpdir):
+	from spaceweather import cache_omni_hro, omni_hro_range
+	from spaceweather.omni import OMNI_HRO_URL_BASE
+	tmpdir = str(tmpdir)
+	times = _write_hro(
+		os.path.join(tmpdir, "omni_5min2019.asc"), "2019-12-31 12:00", 144, "5min",
+	)
+	times = times.append(_write_hro(
+		os.path.join(tmpdir, "omni_5min2020.asc"), "2020-01-01", 288, "5min",
+	))
+	df = omni_hro_range(
+		"2019-12-31 20:00", "2020-01-01 04:00", res="5min",
+		columns=["p_10MeV", "SYM_H"], local_path=tmpdir, chunksize=50,
+	)
+	np.testing.assert_array_equal(
+		df.index, times[(times >= "2019-12-31 20:00") & (times <= "2020-01-01 04:00")],
+	)
+	assert df["p_10MeV"].isna().any()
+	df3 = omni_hro_range(
+		"2019-12-31 20:00", "2020-01-01 04:00", res="5min",
+		columns=["SYM_H"], freq="1h", local_path=tmpdir, chunksize=50,
+	)
+	assert len(df3) == 9
+	np.testing.assert_allclose(
+		df3["SYM_H"], df["SYM_H"].resample("1h").mean(),
+	)
+	# download
+	mocker.patch("requests.get")
+	cache_omni_hro(2018, res="5min", local_path=os.path.join(tmpdir, "data"))
+	requests.get.assert_called_once_with(
+		urljoin(OMNI_HRO_URL_BASE, "omni_5min2018.asc"), stream=True,
+	)
+	with pytest.raises(IOError):
+		with pytest.warns(UserWarning):
+			omni_hro_range("2017-01-01", "2017-01-02", local_path=tmpdir)
+
+
+def test_parquet(tmpdir):
+	pytest.importorskip("pyarrow")
+	from spaceweather import omnie_query, omnie_to_parquet
+	tmpdir = str(tmpdir)
+	src = os.path.join(_TEST_PATH, "omni2t_2000.dat")
+	with open(src) as fp:
+		lines = fp.readlines()
+	with open(os.path.join(tmpdir, "omni2_2000.dat"), "w") as fp:
+		fp.writelines(lines)
+	# compressed as downloaded by `cache_omnie()`
+	with gzip.open(os.path.join(tmpdir, "omni2_2001.dat.gz"), "wt") as fp:
+		fp.writelines("2001" + _l[4:] for _l in lines)
+	dspath = os.path.join(tmpdir, "parquet")
+	kwargs = dict(local_path=tmpdir, dataset_path=dspath)
+	assert omnie_to_parquet(**kwargs) == [2000, 2001]
+	# incremental
+	assert omnie_to_parquet(**kwargs) == []
+	assert omnie_to_parquet(years=[2001], overwrite=True, **kwargs) == [2001]
+
+	df = omnie_mask_missing(pd.concat([
+		omnie_hourly(_y, ext=_e, local_path=tmpdir)
+		for _y, _e in [(2000, "dat"), (2001, "dat.gz")]
+	]))
+	ret = omnie_query(dataset_path=dspath)
+	pd.testing.assert_frame_equal(ret, df, check_dtype=False, check_freq=False)
+	start, end = df.index[5], df.index[-3]
+	ret = omnie_query(start, end, columns=["Dst", "Kp"], dataset_path=dspath)
+	pd.testing.assert_frame_equal(
+		ret, df.loc[start:end, ["Dst", "Kp"]], check_dtype=False, check_freq=False,
+	)
+	ret = omnie_query(
+		"2001-01-01", None, columns=["Dst"], where="Dst < -30", dataset_path=dspath,
+	)
+	expected = df.loc["2001-01-01":, ["Dst"]]
+	pd.testing.assert_frame_equal(
+		ret, expected[expected["Dst"] < -30], check_dtype=False, check_freq=False,
+	)
+	with pytest.raises(ValueError):
+		omnie_query(where="Dst <", dataset_path=dspath)
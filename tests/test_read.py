@@ -21,9 +21,12 @@ import pytest
 
 from spaceweather import (
 	ap_kp_3h, sw_daily, get_file_age, update_data,
+	read_sw, read_sw_csv, read_sw_sections,
 	SW_PATH_ALL, SW_PATH_5Y,
 )
-from spaceweather.celestrak import DL_URL_5Y
+from spaceweather.celestrak import DL_URL_5Y, DL_URL_5Y_CSV
+
+SW_CSV_PATH = os.path.join("tests", "SW-Last5Years.csv")
 
 
 @pytest.fixture(scope="module")
@@ -121,3 +124,60 @@ def test_3hourly_index(name, result, df_3h):
 		result,
 		rtol=1e-12,
 	)
+
+
+def test_sections():
+	sections = read_sw_sections(SW_PATH_5Y)
+	assert sorted(sections.keys()) == [
+		"daily_predicted", "monthly_predicted", "observed",
+	]
+	df_obs = sections["observed"]
+	df_dp = sections["daily_predicted"]
+	df_mp = sections["monthly_predicted"]
+	assert df_obs.index[-1] < df_dp.index[0]
+	assert df_dp.index[-1] < df_mp.index[0]
+	assert (df_obs["Q"] >= 0).all()
+	assert (df_dp["Q"] == -1).all()
+	assert (df_mp["Ap0"] == -1).all()
+	pd.testing.assert_frame_equal(
+		read_sw(SW_PATH_5Y),
+		pd.concat([df_obs, df_dp, df_mp]),
+	)
+
+
+def test_no_sections(tmpdir):
+	# files without the section markers are parsed as a whole
+	with open(SW_PATH_5Y) as fp:
+		lines = [_l for _l in fp if not _l.startswith(("BEGIN ", "END "))]
+	path = os.path.join(str(tmpdir), "sw.txt")
+	with open(path, "w") as fp:
+		fp.writelines(lines)
+	assert list(read_sw_sections(path).keys()) == ["observed"]
+	pd.testing.assert_frame_equal(read_sw(path), read_sw(SW_PATH_5Y))
+	with open(path, "w") as fp:
+		fp.writelines(_l for _l in lines if not _l[:4].isdigit())
+	with pytest.raises(ValueError):
+		read_sw(path)
+
+
+@pytest.mark.parametrize("engine", [None, "c"])
+def test_read_csv(engine):
+	df_csv = read_sw_csv(SW_CSV_PATH, engine=engine)
+	df_txt = read_sw(SW_PATH_5Y).loc[df_csv.index]
+	# The csv files provide only the data type instead of the flux qualifier
+	df_txt["Q"] = df_txt["Q"].where(
+		(df_txt["Q"] < 0) | (df_txt["Q"] == 4), 0
+	)
+	pd.testing.assert_frame_equal(df_csv, df_txt)
+	pd.testing.assert_frame_equal(read_sw(SW_CSV_PATH), df_csv)
+
+
+def test_update_csv(mocker, tmpdir):
+	mocker.patch("requests.get")
+	tmpdir = str(tmpdir)
+	update_data(
+		swpath_all=SW_CSV_PATH,
+		swpath_5y=os.path.join(tmpdir, "foo.csv"),
+		file_format="csv",
+	)
+	requests.get.assert_called_with(DL_URL_5Y_CSV, stream=True)
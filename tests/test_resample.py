@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Resampling tests
+
+Block resampling tests against `pandas.DataFrame.resample()`.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import align, read_gfz_hp, resample
+
+HP30_PATH = os.path.join("tests", "Hp30_ap30_complete_series.txt")
+
+
+@pytest.fixture(scope="module")
+def df_hp30():
+	df = read_gfz_hp(HP30_PATH)[["Hp", "ap"]].astype(np.float64)
+	df = df.where(df >= 0)
+	# introduce some gaps
+	df.iloc[40:50] = np.nan
+	return df.drop(df.index[100:130])
+
+
+@pytest.mark.parametrize(
+	"how",
+	["mean", "sum", "min", "max", "count", "first", "last", "median", "std"],
+)
+@pytest.mark.parametrize("freq", ["3h", "24h"])
+def test_downsample(how, freq, df_hp30):
+	ret = resample(df_hp30, freq, how=how)
+	kwargs = {"min_count": 1} if how == "sum" else {}
+	ref = getattr(df_hp30.resample(freq, origin="epoch"), how)(**kwargs)
+	np.testing.assert_array_equal(ret.index, ref.index)
+	np.testing.assert_allclose(
+		ret.values.astype(float), ref.values.astype(float), rtol=1e-12,
+	)
+
+
+def test_label_upsample(df_hp30):
+	ret = resample(df_hp30, "3h", how={"Hp": "max", "ap": "mean"}, label="center")
+	assert (ret.index.hour % 3 == 1).all()
+	assert (ret.index.minute == 30).all()
+	ref = df_hp30.resample("3h", origin="epoch").agg({"Hp": "max", "ap": "mean"})
+	np.testing.assert_allclose(ret.values, ref.values)
+	# repeats the 3h values for the 30 min intervals
+	up = resample(ret, "30min", label="center")
+	np.testing.assert_array_equal(up.index[:6].minute, [15, 45] * 3)
+	np.testing.assert_allclose(up.values[::6], ret.values)
+	np.testing.assert_allclose(up.values[5::6], ret.values)
+
+
+def test_align(df_hp30):
+	index = pd.date_range(
+		df_hp30.index[0].floor("1D") - pd.Timedelta("1D"),
+		df_hp30.index[-1].floor("1D") + pd.Timedelta("2D"),
+		freq="3h",
+	) + pd.Timedelta("90min")
+	ret = align(df_hp30, index, how="max")
+	ref = df_hp30.resample("3h", origin="epoch").max()
+	ref.index = ref.index + pd.Timedelta("90min")
+	pd.testing.assert_frame_equal(ret, ref.reindex(index), check_freq=False)
+	assert ret.iloc[:8].isna().all().all()
+	# single time stamps need the cadence
+	with pytest.raises(ValueError):
+		align(df_hp30, index[10:11], how="max")
+	pd.testing.assert_frame_equal(
+		align(df_hp30, index[10:11], how="max", freq="3h"),
+		ref.reindex(index[10:11]), check_freq=False,
+	)
+	assert align(df_hp30, index[:0]).shape == (0, len(df_hp30.columns))
+	with pytest.raises(ValueError):
+		resample(df_hp30, "20min")
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Space weather index query server tests
+
+Queries against a local server on the test data files.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from spaceweather import gfz_3h, gfz_hp30
+from spaceweather.server import IndexStore, bench_server, make_server
+
+GFZ_PATH_ALL = os.path.join("tests", "Kp_ap_Ap_SN_F107_since_2024.txt")
+GFZ_PATH_30D = os.path.join("tests", "Kp_ap_Ap_SN_F107_nowcast.txt")
+
+HP30_PATH_ALL = os.path.join("tests", "Hp30_ap30_complete_series.txt")
+HP30_PATH_30D = os.path.join("tests", "Hp30_ap30_nowcast.txt")
+
+FILES = {
+	"kp3h": {"gfzpath_all": GFZ_PATH_ALL, "gfzpath_30d": GFZ_PATH_30D},
+	"hp30": {"gfzpath_all": HP30_PATH_ALL, "gfzpath_30d": HP30_PATH_30D},
+}
+
+
+def _start(store):
+	server = make_server(store, port=0)
+	thread = threading.Thread(target=server.serve_forever)
+	thread.daemon = True
+	thread.start()
+	return server, "http://{0}:{1}".format(*server.server_address[:2])
+
+
+@pytest.fixture(scope="module")
+def server():
+	server, url = _start(IndexStore(files=FILES))
+	yield url
+	server.shutdown()
+	server.server_close()
+
+
+def _get(url):
+	with urlopen(url) as r:
+		return json.loads(r.read().decode("utf-8"))
+
+
+def _post(url, body):
+	req = Request(
+		url + "/query", data=json.dumps(body).encode("utf-8"),
+		headers={"Content-Type": "application/json"},
+	)
+	with urlopen(req) as r:
+		return json.loads(r.read().decode("utf-8"))
+
+
+def test_datasets(server):
+	info = _get(server + "/datasets")
+	assert sorted(info.keys()) == ["daily", "hp30", "kp3h"]
+	assert info["kp3h"]["columns"] == ["Kp", "Ap"]
+	assert "f107_obs" in info["daily"]["columns"]
+
+
+def test_query_range(server):
+	df = gfz_3h(gfzpath_all=GFZ_PATH_ALL, gfzpath_30d=GFZ_PATH_30D)
+	ret = _get(server + "/query?dataset=kp3h&start=2024-01-02&end=2024-01-02T23:59&columns=Kp")
+	expect = df.loc["2024-01-02", "Kp"]
+	assert list(ret.keys()) == ["time", "Kp"]
+	assert len(ret["time"]) == len(expect) == 8
+	assert pd.DatetimeIndex(ret["time"]).equals(pd.DatetimeIndex(expect.index))
+	np.testing.assert_allclose(ret["Kp"], expect.values)
+
+
+def test_query_points(server):
+	df = gfz_3h(gfzpath_all=GFZ_PATH_ALL, gfzpath_30d=GFZ_PATH_30D)
+	times = ["2024-01-02 00:00", "2024-01-02 02:59", "2024-01-02 03:00", "1900-01-01"]
+	ret = _post(server, {"dataset": "kp3h", "times": times})
+	assert ret["time"][0] == "2024-01-02T00:00:00"
+	expect = df.loc["2024-01-02", "Ap"].values
+	assert ret["Ap"][:3] == [expect[0], expect[0], expect[1]]
+	assert ret["Ap"][3] is None
+	# same via GET
+	query = "&".join("t=" + _t.replace(" ", "T") for _t in times)
+	ret_get = _get(server + "/query?dataset=kp3h&" + query)
+	assert ret_get == ret
+	hp = gfz_hp30(gfzpath_all=HP30_PATH_ALL, gfzpath_30d=HP30_PATH_30D)
+	t = hp.index[10]
+	ret = _post(server, {"dataset": "hp30", "times": [t.isoformat()], "columns": ["Hp"]})
+	assert ret["Hp"] == [hp["Hp"].iloc[10]]
+	# columns as for GET
+	body = {"dataset": "kp3h", "times": times, "columns": "Kp,Ap"}
+	assert _post(server, body) == ret_get
+
+
+def test_query_errors(server):
+	with pytest.raises(HTTPError) as e:
+		_post(server, {"dataset": "foo", "times": []})
+	assert e.value.code == 404
+	with pytest.raises(HTTPError) as e:
+		_get(server + "/query?dataset=kp3h&columns=foo")
+	assert e.value.code == 404
+	with pytest.raises(HTTPError) as e:
+		_get(server + "/query?dataset=kp3h&start=foo")
+	assert e.value.code == 400
+	with pytest.raises(HTTPError) as e:
+		_post(server, {"dataset": "kp3h", "times": [], "columns": 1})
+	assert e.value.code == 400
+
+
+def test_query_arrow(server):
+	pa = pytest.importorskip("pyarrow")
+	with urlopen(server + "/query?dataset=kp3h&start=2024-01-02&end=2024-01-02T23:59&format=arrow") as r:
+		assert r.headers["Content-Type"] == "application/vnd.apache.arrow.stream"
+		table = pa.ipc.open_stream(r.read()).read_all()
+	assert table.column_names == ["time", "Kp", "Ap"]
+	assert table.num_rows == 8
+
+
+def test_reload(tmpdir):
+	fpall = os.path.join(str(tmpdir), os.path.basename(GFZ_PATH_ALL))
+	fp30d = os.path.join(str(tmpdir), os.path.basename(GFZ_PATH_30D))
+	shutil.copy(GFZ_PATH_ALL, fpall)
+	shutil.copy(GFZ_PATH_30D, fp30d)
+	store = IndexStore(
+		files={"kp3h": {"gfzpath_all": fpall, "gfzpath_30d": fp30d}},
+		datasets=["kp3h"], check_interval=0,
+	)
+	_, values = store.query("kp3h", times=["2024-01-01 01:00"])
+	ap0 = values["Ap"][0]
+	with open(fpall) as fp:
+		lines = fp.readlines()
+	for _i, _l in enumerate(lines):
+		if _l.startswith("2024 01 01"):
+			# the first 3h ap value, keeping the column widths
+			lines[_i] = _l.replace(
+				"{0:5d}{1:5d}".format(int(ap0), 2),
+				"{0:5d}{1:5d}".format(int(ap0) + 100, 2),
+				1,
+			)
+	with open(fpall, "w") as fp:
+		fp.writelines(lines)
+	mtime = time.time() + 10
+	os.utime(fpall, (mtime, mtime))
+	_, values = store.query("kp3h", times=["2024-01-01 01:00"])
+	assert values["Ap"][0] == ap0 + 100
+
+
+def test_bench(server):
+	stats = bench_server(server, requests=20, concurrency=4, batch=10, seed=0)
+	assert stats["requests"] == 20
+	assert stats["errors"] == 0
+	assert stats["rps"] > 0
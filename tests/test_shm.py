@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Shared memory tests
+"""
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+# python 3.8+, skip before importing the python 3 only modules
+pytest.importorskip("multiprocessing.shared_memory")
+
+from concurrent.futures import ProcessPoolExecutor  # noqa: E402
+
+from spaceweather import share_frame  # noqa: E402
+from spaceweather.shm import _views  # noqa: E402
+
+
+def _frame(n):
+	return pd.DataFrame(
+		{
+			"Ap": np.arange(n, dtype=np.int32),
+			"f107": np.linspace(60., 300., n),
+			"flag": np.arange(n) % 2 == 0,
+		},
+		index=pd.date_range("1932-01-01", periods=n, freq="1D", name="date"),
+	)
+
+
+def _task(handle, i):
+	arrays = handle.arrays()
+	return arrays["Ap"][i] + arrays["f107"][i], arrays["index"][i]
+
+
+def test_share_frame():
+	df = _frame(1000)
+	with share_frame(df) as shared:
+		handle = pickle.loads(pickle.dumps(shared.handle))
+		ret = handle.to_frame()
+		pd.testing.assert_frame_equal(ret, df, check_freq=False)
+		# the views are read-only
+		with pytest.raises(ValueError):
+			ret.loc[ret.index[0], "Ap"] = -1
+		assert handle.arrays()["Ap"][0] == 0
+		del ret
+	# the pickled handle does not depend on the data size
+	with share_frame(_frame(10)) as small, share_frame(_frame(100000)) as large:
+		assert abs(len(pickle.dumps(small.handle)) - len(pickle.dumps(large.handle))) < 16
+	with pytest.raises(TypeError):
+		share_frame(df.assign(name="a"))
+	# attached views in this process prevent closing
+	shared = share_frame(df)
+	arrays = shared.handle.arrays()
+	with pytest.raises(BufferError, match="close"):
+		shared.close()
+	assert arrays["Ap"][1] == 1
+	del arrays
+	# repeated attaching keeps only the live views
+	for _ in range(10):
+		ret = shared.handle.to_frame()
+	assert len(_views[shared.handle.name]) <= 2 * (len(df.columns) + 1)
+	del ret
+	shared.close()
+	shared.close()
+
+
+def test_process_pool():
+	df = _frame(1000)
+	idx = list(range(0, 1000, 97))
+	with share_frame(df, columns=["Ap", "f107"]) as shared:
+		with ProcessPoolExecutor(max_workers=2) as pool:
+			res = list(pool.map(_task, [shared.handle] * len(idx), idx))
+	np.testing.assert_allclose(
+		[_r[0] for _r in res], (df["Ap"] + df["f107"]).values[idx],
+	)
+	np.testing.assert_array_equal([_r[1] for _r in res], df.index.values[idx])
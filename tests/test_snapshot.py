@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# vim:fileencoding=utf-8
+#
+# Copyright (c) 2026 Stefan Bender
+#
+# This module is part of pyspaceweather.
+# pyspaceweather is free software: you can redistribute it or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, version 2.
+# See accompanying COPYING.GPLv2 file or http://www.gnu.org/licenses/gpl-2.0.html.
+"""Space weather snapshot tests
+
+Export and import of the parsed test data files.
+"""
+import json
+import os
+import shutil
+import time
+
+import pandas as pd
+
+import pytest
+
+from spaceweather import (
+	export_snapshot, gfz_daily, gfz_hp30, import_snapshot, install_snapshot,
+	load_snapshot, omnie_hourly,
+)
+from spaceweather.cli import main
+from spaceweather.core import _merge_frames
+
+GFZ_PATH_ALL = os.path.join("tests", "Kp_ap_Ap_SN_F107_since_2024.txt")
+GFZ_PATH_30D = os.path.join("tests", "Kp_ap_Ap_SN_F107_nowcast.txt")
+
+HP30_PATH_ALL = os.path.join("tests", "Hp30_ap30_complete_series.txt")
+HP30_PATH_30D = os.path.join("tests", "Hp30_ap30_nowcast.txt")
+
+OMNI_KWARGS = {"prefix": "omni2t", "local_path": "tests"}
+
+
+def _copy_files(tmpdir):
+	files = {}
+	for name, fall, f30d in [
+		("gfz", GFZ_PATH_ALL, GFZ_PATH_30D),
+		("hp30", HP30_PATH_ALL, HP30_PATH_30D),
+	]:
+		files[name] = {}
+		for arg, fname in [("gfzpath_all", fall), ("gfzpath_30d", f30d)]:
+			path = os.path.join(str(tmpdir), os.path.basename(fname))
+			shutil.copy(fname, path)
+			files[name][arg] = path
+	return files
+
+
+@pytest.fixture
+def snapshot(tmpdir):
+	files = _copy_files(tmpdir)
+	files["omni"] = OMNI_KWARGS
+	path = os.path.join(str(tmpdir), "snapshot.npz")
+	export_snapshot(
+		path, sources=["gfz", "hp30", "omni"], omni_years=[2000], files=files,
+	)
+	yield path, files
+	import_snapshot(None)
+
+
+def test_export(snapshot):
+	path, files = snapshot
+	snap = load_snapshot(path)
+	assert snap.keys() == ["gfz", "hp30", "omni_2000"]
+	entry = snap.manifest["sources"]["gfz"]
+	assert [_f["path"] for _f in entry["files"]] == [
+		os.path.abspath(files["gfz"]["gfzpath_all"]),
+		os.path.abspath(files["gfz"]["gfzpath_30d"]),
+	]
+	df = gfz_daily(**files["gfz"])
+	assert entry["rows"] == len(df)
+	pd.testing.assert_frame_equal(snap.frame("gfz"), df)
+	pd.testing.assert_frame_equal(snap.frame("hp30"), gfz_hp30(**files["hp30"]))
+	pd.testing.assert_frame_equal(
+		snap.frame("omni_2000"), omnie_hourly(2000, **OMNI_KWARGS),
+	)
+	# no temporary files left
+	assert sorted(os.listdir(os.path.dirname(path))) == sorted(
+		[os.path.basename(path)]
+		+ [os.path.basename(_f) for _f in files["gfz"].values()]
+		+ [os.path.basename(_f) for _f in files["hp30"].values()]
+	)
+
+
+def test_import(mocker, snapshot):
+	path, files = snapshot
+	expect_gfz = gfz_daily(**files["gfz"])
+	expect_hp = gfz_hp30(**files["hp30"])
+	expect_omni = omnie_hourly(2000, **OMNI_KWARGS)
+	import_snapshot(path)
+	m_gfz = mocker.patch.dict(
+		"spaceweather.gfz._PARSERS", {"gfz": (mocker.Mock(), None)},
+	)["gfz"][0]
+	m_hp = mocker.patch("spaceweather.gfz._read_hp_window")
+	m_omni = mocker.patch("spaceweather.omni.read_omnie")
+	pd.testing.assert_frame_equal(gfz_daily(**files["gfz"]), expect_gfz)
+	pd.testing.assert_frame_equal(gfz_hp30(**files["hp30"]), expect_hp)
+	pd.testing.assert_frame_equal(omnie_hourly(2000, **OMNI_KWARGS), expect_omni)
+	# time window and columns
+	start, end = expect_hp.index[10], expect_hp.index[20]
+	pd.testing.assert_frame_equal(
+		gfz_hp30(start=start, end=end, columns=["Hp"], **files["hp30"]),
+		expect_hp.loc[start:end, ["Hp"]],
+	)
+	assert not m_gfz.called
+	assert not m_hp.called
+	assert not m_omni.called
+
+
+def test_modified(mocker, snapshot):
+	path, files = snapshot
+	import_snapshot(path)
+	merge = mocker.patch("spaceweather.gfz._merge_frames", wraps=_merge_frames)
+	gfz_daily(**files["gfz"])
+	assert not merge.called
+	# other files are not served from the snapshot
+	renamed = os.path.join(os.path.dirname(path), "nowcast.txt")
+	shutil.copy(GFZ_PATH_30D, renamed)
+	gfz_daily(gfzpath_all=GFZ_PATH_ALL, gfzpath_30d=renamed)
+	assert merge.call_count == 1
+	# touching the files keeps the snapshot
+	mtime = time.time() + 10
+	os.utime(files["gfz"]["gfzpath_30d"], (mtime, mtime))
+	gfz_daily(**files["gfz"])
+	assert merge.call_count == 1
+	# updated files are parsed
+	with open(files["gfz"]["gfzpath_30d"]) as fp:
+		lines = fp.readlines()
+	with open(files["gfz"]["gfzpath_30d"], "w") as fp:
+		fp.writelines(lines[:-1])
+	gfz_daily(**files["gfz"])
+	assert merge.call_count == 2
+
+
+def test_relocated(mocker, snapshot, tmpdir):
+	# copies of the files in another directory, with new times
+	path, files = snapshot
+	other = tmpdir.mkdir("other")
+	moved = _copy_files(other)
+	mtime = time.time() + 10
+	for _f in moved["gfz"].values():
+		os.utime(_f, (mtime, mtime))
+	import_snapshot(path)
+	merge = mocker.patch("spaceweather.gfz._merge_frames", wraps=_merge_frames)
+	df = gfz_daily(**moved["gfz"])
+	assert not merge.called
+	pd.testing.assert_frame_equal(df, load_snapshot(path).frame("gfz"))
+	# missing files are fine too
+	os.remove(moved["hp30"]["gfzpath_30d"])
+	gfz_hp30(**moved["hp30"])
+	assert not merge.called
+
+
+def test_install(snapshot, tmpdir):
+	path, _ = snapshot
+	dest = os.path.join(str(tmpdir), "installed.npz")
+	manifest = install_snapshot(path, dest=dest)
+	assert manifest == load_snapshot(dest).manifest
+
+
+def test_cli(capsys, snapshot, tmpdir):
+	path, _ = snapshot
+	status = main(["snapshot", "info", path])
+	ret = json.loads(capsys.readouterr().out)
+	assert status == 0
+	assert sorted(ret["sources"].keys()) == ["gfz", "hp30", "omni_2000"]
+	assert ret["sources"]["omni_2000"]["rows"] == len(omnie_hourly(2000, **OMNI_KWARGS))
+	dest = os.path.join(str(tmpdir), "installed.npz")
+	status = main(["snapshot", "import", path, "--dest", dest])
+	capsys.readouterr()
+	assert status == 0
+	assert load_snapshot(dest).keys() == ["gfz", "hp30", "omni_2000"]